@@ -0,0 +1,338 @@
+"""
+Shared fixtures, and functions to generate synthetic OME-Zarr data for benchmarks.
+"""
+
+from __future__ import annotations
+
+import itertools
+import string
+from typing import TYPE_CHECKING, Any, Literal
+
+import pytest
+import zarr
+from zarr.storage import LocalStore, MemoryStore
+
+from ome_zarr_models import instrument
+from ome_zarr_models.common.instrumentation import InstrumentedStore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+    from zarr.abc.store import Store
+
+    from ome_zarr_models.common.instrumentation import StoreRecording
+
+Version = Literal["0.4", "0.5", "0.6"]
+StoreType = Literal["memory", "local"]
+
+AXES = [
+    {"name": "t", "type": "time", "unit": "millisecond"},
+    {"name": "c", "type": "channel"},
+    {"name": "z", "type": "space", "unit": "micrometer"},
+    {"name": "y", "type": "space", "unit": "micrometer"},
+    {"name": "x", "type": "space", "unit": "micrometer"},
+]
+DIMENSION_NAMES = [axis["name"] for axis in AXES]
+PLATE_SHAPES = {96: (8, 12), 384: (16, 24), 1536: (32, 48)}
+
+
+def record_store_ops(
+    benchmark: BenchmarkFixture,
+    func: Callable[..., Any],
+    *args: Any,
+    **kwargs: Any,
+) -> StoreRecording:
+    """
+    Call a function once, and record the store operations it makes.
+
+    The number of each type of store operation is saved in the extra info of the
+    benchmark, and the recording is returned.
+    """
+    with instrument() as recording:
+        func(*args, **kwargs)
+    benchmark.extra_info["store_ops"] = {
+        operation: recording.count(operation)
+        for operations in recording.to_dict()["loaders"].values()
+        for operation in operations
+    }
+    return recording
+
+
+def make_store(store_type: StoreType, path: Path) -> InstrumentedStore:
+    """
+    Create an empty store, wrapped in a store that records store operations.
+    """
+    match store_type:
+        case "memory":
+            return InstrumentedStore(MemoryStore())
+        case "local":
+            return InstrumentedStore(LocalStore(root=path))
+        case _:
+            raise ValueError(f"Unknown store type: {store_type}")
+
+
+@pytest.fixture(params=["memory", "local"])
+def store_type(request: pytest.FixtureRequest) -> StoreType:
+    """
+    Type of store to run a benchmark on.
+    """
+    return request.param  # type: ignore[no-any-return]
+
+
+@pytest.fixture
+def store(store_type: StoreType, tmp_path: Path) -> InstrumentedStore:
+    """
+    An empty store, wrapped in a store that records store operations.
+    """
+    return make_store(store_type, tmp_path)
+
+
+def zarr_format(version: Version) -> Literal[2, 3]:
+    """
+    Zarr format used by a version of OME-Zarr.
+    """
+    return 2 if version == "0.4" else 3
+
+
+def wrap_attributes(attributes: dict[str, Any], *, version: Version) -> dict[str, Any]:
+    """
+    Wrap OME-Zarr attributes in the 'ome' key if needed.
+    """
+    if version == "0.4":
+        return attributes
+    return {"ome": {"version": version, **attributes}}
+
+
+def multiscales_attributes(*, version: Version, n_levels: int) -> list[dict[str, Any]]:
+    """
+    Generate multiscales metadata.
+
+    For OME-Zarr 0.6 this includes an extra coordinate system for each level,
+    which the default coordinate system is transformed into.
+    """
+    scales = [[1.0, 1.0, 2.0**i, 2.0**i, 2.0**i] for i in range(n_levels)]
+    if version == "0.6":
+        coordinate_systems = [{"name": "physical", "axes": AXES}] + [
+            {"name": f"extra_{i}", "axes": AXES} for i in range(n_levels)
+        ]
+        datasets = [
+            {
+                "path": str(i),
+                "coordinateTransformations": [
+                    {
+                        "type": "scale",
+                        "scale": scale,
+                        "input": f"/{i}",
+                        "output": "physical",
+                    }
+                ],
+            }
+            for i, scale in enumerate(scales)
+        ]
+        transforms = [
+            {
+                "type": "sequence",
+                "input": "physical",
+                "output": f"extra_{i}",
+                "transformations": [
+                    {"type": "scale", "scale": [1.0, 1.0, 1.0, 0.5, 0.5]},
+                    {"type": "translation", "translation": [0, 0, 0, i, i]},
+                ],
+            }
+            for i in range(n_levels)
+        ]
+        return [
+            {
+                "name": "benchmark",
+                "coordinateSystems": coordinate_systems,
+                "datasets": datasets,
+                "coordinateTransformations": transforms,
+            }
+        ]
+
+    multiscale: dict[str, Any] = {
+        "name": "benchmark",
+        "axes": AXES,
+        "datasets": [
+            {
+                "path": str(i),
+                "coordinateTransformations": [{"type": "scale", "scale": scale}],
+            }
+            for i, scale in enumerate(scales)
+        ],
+    }
+    if version == "0.4":
+        multiscale["version"] = "0.4"
+    return [multiscale]
+
+
+def create_arrays(group: zarr.Group, *, n_levels: int, dtype: str = "uint8") -> None:
+    """
+    Create an (empty) array for each multiscale level in a group.
+    """
+    for i in range(n_levels):
+        shape = (1, 1, 2 ** (n_levels - i), 2 ** (n_levels - i), 2 ** (n_levels - i))
+        if group.metadata.zarr_format == 2:
+            group.create_array(str(i), shape=shape, dtype=dtype)
+        else:
+            group.create_array(
+                str(i), shape=shape, dtype=dtype, dimension_names=DIMENSION_NAMES
+            )
+
+
+def make_image(
+    store: Store,
+    *,
+    version: Version,
+    n_levels: int,
+    n_labels: int = 0,
+    path: str = "",
+) -> zarr.Group:
+    """
+    Create an image with *n_levels* multiscale levels, and *n_labels* labels.
+    """
+    group = zarr.create_group(
+        store,
+        path=path,
+        zarr_format=zarr_format(version),
+        attributes=wrap_attributes(
+            {"multiscales": multiscales_attributes(version=version, n_levels=n_levels)},
+            version=version,
+        ),
+    )
+    create_arrays(group, n_levels=n_levels)
+    if n_labels:
+        make_labels(group, version=version, n_levels=n_levels, n_labels=n_labels)
+    return group
+
+
+def make_labels(
+    image_group: zarr.Group, *, version: Version, n_levels: int, n_labels: int
+) -> zarr.Group:
+    """
+    Create a labels group with *n_labels* image labels within an image group.
+    """
+    label_names = [f"label_{i}" for i in range(n_labels)]
+    labels_group = image_group.create_group(
+        "labels",
+        attributes=wrap_attributes({"labels": label_names}, version=version),
+    )
+    for name in label_names:
+        image_label: dict[str, Any] = {
+            "colors": [
+                {"label-value": value, "rgba": [value, value, value, 255]}
+                for value in range(16)
+            ],
+            "source": {"image": "../../"},
+        }
+        if version == "0.4":
+            image_label["version"] = "0.4"
+        label_group = labels_group.create_group(
+            name,
+            attributes=wrap_attributes(
+                {
+                    "image-label": image_label,
+                    "multiscales": multiscales_attributes(
+                        version=version, n_levels=n_levels
+                    ),
+                },
+                version=version,
+            ),
+        )
+        create_arrays(label_group, n_levels=n_levels, dtype="uint16")
+    return labels_group
+
+
+def row_names(n_rows: int) -> list[str]:
+    """
+    Generate plate row names: A, B, ..., Z, AA, AB, ...
+    """
+    letters = string.ascii_uppercase
+    names = list(letters) + [a + b for a, b in itertools.product(letters, repeat=2)]
+    return names[:n_rows]
+
+
+def plate_attributes(
+    *, version: Literal["0.4", "0.5"], n_wells: int, n_fields: int
+) -> dict[str, Any]:
+    """
+    Generate plate metadata for a plate with *n_wells* wells.
+    """
+    n_rows, n_cols = PLATE_SHAPES[n_wells]
+    rows = row_names(n_rows)
+    columns = [str(i + 1) for i in range(n_cols)]
+    return {
+        "version": version,
+        "acquisitions": [{"id": 0, "maximumfieldcount": n_fields}],
+        "field_count": n_fields,
+        "rows": [{"name": row} for row in rows],
+        "columns": [{"name": column} for column in columns],
+        "wells": [
+            {"path": f"{row}/{column}", "rowIndex": i, "columnIndex": j}
+            for (i, row), (j, column) in itertools.product(
+                enumerate(rows), enumerate(columns)
+            )
+        ],
+    }
+
+
+def make_plate(
+    store: Store,
+    *,
+    version: Literal["0.4", "0.5"],
+    n_wells: int,
+    n_fields: int = 1,
+    n_levels: int = 1,
+) -> zarr.Group:
+    """
+    Create a plate, with *n_fields* images in every well.
+    """
+    plate = plate_attributes(version=version, n_wells=n_wells, n_fields=n_fields)
+    group = zarr.create_group(
+        store,
+        zarr_format=zarr_format(version),
+        attributes=wrap_attributes({"plate": plate}, version=version),
+    )
+    well: dict[str, Any] = {
+        "images": [{"path": str(i), "acquisition": 0} for i in range(n_fields)]
+    }
+    if version == "0.4":
+        well["version"] = "0.4"
+    for well_in_plate in plate["wells"]:
+        well_group = group.create_group(
+            well_in_plate["path"],
+            attributes=wrap_attributes({"well": well}, version=version),
+        )
+        for i in range(n_fields):
+            make_image(
+                store,
+                version=version,
+                n_levels=n_levels,
+                path=f"{well_group.path}/{i}",
+            )
+    return group
+
+
+@pytest.fixture(scope="session")
+def plate_factory(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[..., zarr.Group]:
+    """
+    Create plates, re-using plates that have already been created.
+
+    Creating large plates is slow, so each plate is only created once per session.
+    """
+    plates: dict[tuple[StoreType, str, int], zarr.Group] = {}
+
+    def get_plate(
+        store_type: StoreType, *, version: Literal["0.4", "0.5"], n_wells: int
+    ) -> zarr.Group:
+        key = (store_type, version, n_wells)
+        if key not in plates:
+            store = make_store(store_type, tmp_path_factory.mktemp("plate"))
+            plates[key] = make_plate(store, version=version, n_wells=n_wells)
+        return plates[key]
+
+    return get_plate
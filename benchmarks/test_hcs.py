@@ -0,0 +1,184 @@
+import tracemalloc
+from collections.abc import Callable
+from typing import Any, Literal
+
+import pytest
+import zarr
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import ome_zarr_models.v04
+import ome_zarr_models.v04.plate
+import ome_zarr_models.v05
+import ome_zarr_models.v05.plate
+from benchmarks.conftest import (
+    PLATE_SHAPES,
+    StoreType,
+    plate_attributes,
+    record_store_ops,
+    row_names,
+)
+from ome_zarr_models import open_ome_zarr
+from ome_zarr_models.common.instrumentation import InstrumentedStore
+
+HCS_CLASSES: dict[str, Any] = {
+    "0.4": ome_zarr_models.v04.HCS,
+    "0.5": ome_zarr_models.v05.HCS,
+}
+PLATE_CLASSES: dict[str, Any] = {
+    "0.4": ome_zarr_models.v04.plate.Plate,
+    "0.5": ome_zarr_models.v05.plate.Plate,
+}
+
+# Maximum number of store operations per well when loading a whole plate.
+# If a change increases the number of store operations, these will fail.
+STORE_OPS_PER_WELL = {"0.4": 12, "0.5": 6}
+# Maximum number of store operations to load a single well from a lazy plate.
+LAZY_WELL_STORE_OPS = {"0.4": 11, "0.5": 5}
+# Maximum number of store operations per group or array when writing a whole plate
+# concurrently.
+CONCURRENT_STORE_OPS_PER_NODE = {"0.4": 5, "0.5": 2}
+
+PlateFactory = Callable[..., zarr.Group]
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("n_wells", [96, 384, 1536])
+def test_hcs_from_zarr(
+    benchmark: BenchmarkFixture,
+    plate_factory: PlateFactory,
+    store_type: StoreType,
+    version: Literal["0.4", "0.5"],
+    n_wells: int,
+) -> None:
+    group = plate_factory(store_type, version=version, n_wells=n_wells)
+    hcs_cls = HCS_CLASSES[version]
+
+    recording = record_store_ops(benchmark, hcs_cls.from_zarr, group)
+    assert recording.count() <= STORE_OPS_PER_WELL[version] * n_wells
+    # Loading a whole plate is slow, so only time a few rounds
+    benchmark.pedantic(hcs_cls.from_zarr, args=(group,), rounds=3)  # type: ignore[no-untyped-call]
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("n_wells", [96, 384, 1536])
+def test_open_ome_zarr_hcs(
+    benchmark: BenchmarkFixture,
+    plate_factory: PlateFactory,
+    store_type: StoreType,
+    version: Literal["0.4", "0.5"],
+    n_wells: int,
+) -> None:
+    group = plate_factory(store_type, version=version, n_wells=n_wells)
+
+    recording = record_store_ops(benchmark, open_ome_zarr, group)
+    assert recording.count() <= STORE_OPS_PER_WELL[version] * n_wells
+    benchmark.pedantic(open_ome_zarr, args=(group,), rounds=3)  # type: ignore[no-untyped-call]
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("n_wells", [96, 1536])
+def test_hcs_images(
+    benchmark: BenchmarkFixture,
+    plate_factory: PlateFactory,
+    version: Literal["0.4", "0.5"],
+    n_wells: int,
+) -> None:
+    group = plate_factory("memory", version=version, n_wells=n_wells)
+    wells = list(HCS_CLASSES[version].from_zarr(group).well_groups)
+
+    def get_images() -> list[Any]:
+        return [image for well in wells for image in well.images]
+
+    # Record the memory used by the image models
+    tracemalloc.start()
+    images = get_images()
+    benchmark.extra_info["memory"] = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del images
+    benchmark(get_images)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("n_wells", [96, 384, 1536])
+def test_hcs_from_zarr_lazy(
+    benchmark: BenchmarkFixture,
+    plate_factory: PlateFactory,
+    store_type: StoreType,
+    version: Literal["0.4", "0.5"],
+    n_wells: int,
+) -> None:
+    group = plate_factory(store_type, version=version, n_wells=n_wells)
+    hcs_cls = HCS_CLASSES[version]
+
+    recording = record_store_ops(benchmark, hcs_cls.from_zarr, group, lazy=True)
+    assert recording.count() == 0
+    benchmark(hcs_cls.from_zarr, group, lazy=True)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("n_wells", [96, 1536])
+def test_hcs_lazy_get_well_group(
+    benchmark: BenchmarkFixture,
+    plate_factory: PlateFactory,
+    store_type: StoreType,
+    version: Literal["0.4", "0.5"],
+    n_wells: int,
+) -> None:
+    group = plate_factory(store_type, version=version, n_wells=n_wells)
+    hcs_cls = HCS_CLASSES[version]
+
+    def get_last_well() -> None:
+        hcs = hcs_cls.from_zarr(group, lazy=True)
+        hcs.get_well_group(n_wells - 1)
+
+    recording = record_store_ops(benchmark, get_last_well)
+    assert recording.count() <= LAZY_WELL_STORE_OPS[version]
+    benchmark(get_last_well)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("concurrent", [True, False], ids=["concurrent", "sequential"])
+def test_hcs_to_zarr(
+    benchmark: BenchmarkFixture,
+    plate_factory: PlateFactory,
+    store: InstrumentedStore,
+    version: Literal["0.4", "0.5"],
+    *,
+    concurrent: bool,
+) -> None:
+    n_wells = 96
+    hcs = HCS_CLASSES[version].from_zarr(
+        plate_factory("memory", version=version, n_wells=n_wells)
+    )
+
+    recording = record_store_ops(
+        benchmark, hcs.to_zarr, store, "", concurrent=concurrent
+    )
+    if concurrent:
+        n_nodes = len(hcs.to_flat())
+        assert recording.count() <= CONCURRENT_STORE_OPS_PER_NODE[version] * n_nodes
+    benchmark(hcs.to_zarr, store, "", overwrite=True, concurrent=concurrent)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("n_wells", [96, 1536])
+def test_plate_well_lookup(
+    benchmark: BenchmarkFixture, version: Literal["0.4", "0.5"], n_wells: int
+) -> None:
+    plate = PLATE_CLASSES[version].model_validate(
+        plate_attributes(version=version, n_wells=n_wells, n_fields=1)
+    )
+    n_rows, n_cols = PLATE_SHAPES[n_wells]
+    rows = row_names(n_rows)
+    columns = [str(i + 1) for i in range(n_cols)]
+
+    def look_up_wells() -> None:
+        # Look up every well by name, and every row and column
+        for row in rows:
+            for column in columns:
+                plate.get_well_index(row, column)
+            plate.well_indices_in_row(row)
+        for column in columns:
+            plate.well_indices_in_column(column)
+
+    benchmark(look_up_wells)
@@ -0,0 +1,206 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+import pytest
+import zarr
+from pytest_benchmark.fixture import BenchmarkFixture
+from zarr.storage import LocalStore, MemoryStore
+
+import ome_zarr_models._v06.image
+import ome_zarr_models._v06.labels
+import ome_zarr_models.v04
+import ome_zarr_models.v05
+from benchmarks.conftest import (
+    AXES,
+    Version,
+    make_image,
+    record_store_ops,
+)
+from ome_zarr_models import open_ome_zarr
+from ome_zarr_models.common.instrumentation import InstrumentedStore
+from ome_zarr_models.common.pyramid import DownsampleMethod
+
+IMAGE_CLASSES: dict[Version, Any] = {
+    "0.4": ome_zarr_models.v04.Image,
+    "0.5": ome_zarr_models.v05.Image,
+    "0.6": ome_zarr_models._v06.image.Image,
+}
+AXIS_CLASSES: dict[Version, Any] = {
+    "0.4": ome_zarr_models.v04.axes.Axis,
+    "0.5": ome_zarr_models.v05.axes.Axis,
+}
+LABELS_CLASSES: dict[Version, Any] = {
+    "0.4": ome_zarr_models.v04.Labels,
+    "0.5": ome_zarr_models.v05.Labels,
+    "0.6": ome_zarr_models._v06.labels.Labels,
+}
+
+# Maximum number of store operations for each benchmark.
+# If a change increases the number of store operations, these will fail.
+IMAGE_STORE_OPS: dict[tuple[Version, int], int] = {
+    ("0.4", 3): 13,
+    ("0.4", 12): 40,
+    ("0.5", 3): 7,
+    ("0.5", 12): 16,
+    ("0.6", 3): 7,
+    ("0.6", 12): 16,
+}
+IMAGE_WITH_LABELS_STORE_OPS: dict[tuple[Version, int], int] = {
+    ("0.4", 4): 13,
+    ("0.4", 32): 13,
+    ("0.5", 4): 51,
+    ("0.5", 32): 359,
+    ("0.6", 4): 51,
+    ("0.6", 32): 359,
+}
+LABELS_STORE_OPS: dict[tuple[Version, int], int] = {
+    ("0.4", 4): 53,
+    ("0.4", 32): 417,
+    ("0.5", 4): 44,
+    ("0.5", 32): 352,
+    ("0.6", 4): 44,
+    ("0.6", 32): 352,
+}
+TO_ZARR_STORE_OPS: dict[tuple[Version, int], int] = {
+    ("0.4", 3): 27,
+    ("0.4", 12): 72,
+    ("0.5", 3): 11,
+    ("0.5", 12): 29,
+}
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5", "0.6"])
+@pytest.mark.parametrize("n_levels", [3, 12])
+def test_image_from_zarr(
+    benchmark: BenchmarkFixture,
+    store: InstrumentedStore,
+    version: Version,
+    n_levels: int,
+) -> None:
+    group = make_image(store, version=version, n_levels=n_levels)
+    image_cls = IMAGE_CLASSES[version]
+
+    recording = record_store_ops(benchmark, image_cls.from_zarr, group)
+    assert recording.count() <= IMAGE_STORE_OPS[version, n_levels]
+    benchmark(image_cls.from_zarr, group)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("n_levels", [3, 12])
+def test_open_ome_zarr_image(
+    benchmark: BenchmarkFixture,
+    store: InstrumentedStore,
+    version: Version,
+    n_levels: int,
+) -> None:
+    group = make_image(store, version=version, n_levels=n_levels)
+
+    recording = record_store_ops(benchmark, open_ome_zarr, group)
+    assert recording.count() <= IMAGE_STORE_OPS[version, n_levels]
+    benchmark(open_ome_zarr, group)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5", "0.6"])
+@pytest.mark.parametrize("n_labels", [4, 32])
+@pytest.mark.parametrize("trusted", [False, True])
+def test_image_with_labels_from_zarr(
+    benchmark: BenchmarkFixture,
+    store: InstrumentedStore,
+    version: Version,
+    n_labels: int,
+    trusted: bool,
+) -> None:
+    group = make_image(store, version=version, n_levels=3, n_labels=n_labels)
+    image_cls = IMAGE_CLASSES[version]
+
+    recording = record_store_ops(benchmark, image_cls.from_zarr, group, trusted=trusted)
+    assert recording.count() <= IMAGE_WITH_LABELS_STORE_OPS[version, n_labels]
+    benchmark(image_cls.from_zarr, group, trusted=trusted)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5", "0.6"])
+@pytest.mark.parametrize("n_labels", [4, 32])
+def test_labels_from_zarr(
+    benchmark: BenchmarkFixture,
+    store: InstrumentedStore,
+    version: Version,
+    n_labels: int,
+) -> None:
+    make_image(store, version=version, n_levels=3, n_labels=n_labels)
+    group = zarr.open_group(store, path="labels", mode="r")
+    labels_cls = LABELS_CLASSES[version]
+
+    recording = record_store_ops(benchmark, labels_cls.from_zarr, group)
+    assert recording.count() <= LABELS_STORE_OPS[version, n_labels]
+    benchmark(labels_cls.from_zarr, group)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("n_levels", [3, 12])
+def test_image_to_zarr(
+    benchmark: BenchmarkFixture,
+    store: InstrumentedStore,
+    version: Version,
+    n_levels: int,
+) -> None:
+    image = IMAGE_CLASSES[version].from_zarr(
+        make_image(MemoryStore(), version=version, n_levels=n_levels)
+    )
+
+    recording = record_store_ops(benchmark, image.to_zarr, store, "")
+    assert recording.count() <= TO_ZARR_STORE_OPS[version, n_levels]
+    benchmark(image.to_zarr, store, "", overwrite=True)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("method", ["mean", "gaussian", "mode", "nearest"])
+def test_image_from_array(
+    benchmark: BenchmarkFixture,
+    store: InstrumentedStore,
+    version: Literal["0.4", "0.5"],
+    method: DownsampleMethod,
+) -> None:
+    data = np.random.default_rng(seed=0).integers(
+        0, 255, size=(1, 2, 32, 256, 256), dtype=np.uint16
+    )
+    image_cls = IMAGE_CLASSES[version]
+    axes = [AXIS_CLASSES[version](**axis) for axis in AXES]
+
+    benchmark(
+        image_cls.from_array,
+        data,
+        store=store,
+        path="",
+        axes=axes,
+        chunks=(1, 1, 16, 64, 64),
+        method=method,
+        overwrite=True,
+    )
+
+
+@pytest.mark.parametrize("n_workers", [1, 2, 4])
+def test_image_from_array_process_pool(
+    benchmark: BenchmarkFixture, tmp_path: Path, n_workers: int
+) -> None:
+    data = np.random.default_rng(seed=0).integers(
+        0, 255, size=(1, 2, 64, 512, 512), dtype=np.uint16
+    )
+    axes = [ome_zarr_models.v05.axes.Axis(**axis) for axis in AXES]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        benchmark.pedantic(  # type: ignore[no-untyped-call]
+            ome_zarr_models.v05.Image.from_array,
+            args=(data,),
+            kwargs={
+                "store": LocalStore(tmp_path),
+                "path": "",
+                "axes": axes,
+                "chunks": (1, 1, 32, 128, 128),
+                "method": "gaussian",
+                "overwrite": True,
+                "executor": executor,
+            },
+            rounds=3,
+        )
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "ome_zarr_models",
+        "ome_zarr_models.v04",
+        "ome_zarr_models.v05",
+        "ome_zarr_models.v05.image",
+        "ome_zarr_models.v05.hcs",
+    ],
+)
+def test_import_time(benchmark: BenchmarkFixture, module: str) -> None:
+    # Import in a new interpreter each time, so nothing is already imported.
+    # This includes the start up time of the interpreter, which is timed on its
+    # own by test_python_start_up_time().
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        subprocess.run,
+        args=([sys.executable, "-c", f"import {module}"],),
+        kwargs={"check": True},
+        rounds=10,
+    )
+
+
+def test_python_start_up_time(benchmark: BenchmarkFixture) -> None:
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        subprocess.run,
+        args=([sys.executable, "-c", "pass"],),
+        kwargs={"check": True},
+        rounds=10,
+    )
@@ -0,0 +1,46 @@
+from typing import Any
+
+import numpy as np
+import pytest
+import zarr
+from pytest_benchmark.fixture import BenchmarkFixture
+from zarr.storage import MemoryStore
+
+from ome_zarr_models.common.label_index import LabelIndex, compute_label_index
+
+
+@pytest.fixture
+def label_array() -> zarr.Array[Any]:
+    """
+    Label data with 1000 label values, in 64 chunks.
+    """
+    data = np.random.default_rng(seed=0).integers(
+        0, 1000, size=(32, 512, 512), dtype=np.uint32
+    )
+    array = zarr.create_array(
+        MemoryStore(), shape=data.shape, dtype=data.dtype, chunks=(16, 64, 128)
+    )
+    array[...] = data
+    return array
+
+
+def test_compute_label_index(
+    benchmark: BenchmarkFixture,
+    label_array: zarr.Array[Any],
+) -> None:
+    benchmark(compute_label_index, label_array)
+
+
+def test_label_index_lookup(
+    benchmark: BenchmarkFixture,
+    label_array: zarr.Array[Any],
+) -> None:
+    label_index = compute_label_index(label_array)
+
+    def lookup(label_index: LabelIndex) -> None:
+        for label_value in range(0, 1000, 10):
+            label_index.count(label_value)
+            label_index.bounding_box(label_value)
+            label_index.centroid(label_value)
+
+    benchmark(lookup, label_index)
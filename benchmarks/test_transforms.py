@@ -0,0 +1,79 @@
+from typing import Literal
+
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import ome_zarr_models._v06.multiscales
+import ome_zarr_models.v04.multiscales
+import ome_zarr_models.v05.multiscales
+from benchmarks.conftest import multiscales_attributes
+from ome_zarr_models.common.multiscales import MultiscaleBase
+
+MULTISCALE_CLASSES: dict[str, type[MultiscaleBase]] = {
+    "0.4": ome_zarr_models.v04.multiscales.Multiscale,
+    "0.5": ome_zarr_models.v05.multiscales.Multiscale,
+}
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("n_points", [1_000, 1_000_000])
+@pytest.mark.parametrize("direction", ["to_physical", "to_index"])
+def test_transform_points(
+    benchmark: BenchmarkFixture,
+    version: Literal["0.4", "0.5"],
+    n_points: int,
+    direction: Literal["to_physical", "to_index"],
+) -> None:
+    multiscale = MULTISCALE_CLASSES[version].model_validate(
+        multiscales_attributes(version=version, n_levels=3)[0]
+    )
+    transform = multiscale.get_dataset_transform(2)
+    points = np.random.default_rng(seed=0).uniform(0, 1000, size=(n_points, 5))
+    out = np.empty_like(points)
+
+    if direction == "to_physical":
+        benchmark(transform.apply, points, out=out)
+    else:
+        benchmark(transform.apply_inverse, points, out=out)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5", "0.6"])
+def test_select_level(
+    benchmark: BenchmarkFixture, version: Literal["0.4", "0.5", "0.6"]
+) -> None:
+    attributes = multiscales_attributes(version=version, n_levels=10)[0]
+    multiscale: MultiscaleBase | ome_zarr_models._v06.multiscales.Multiscale
+    if version == "0.6":
+        multiscale = ome_zarr_models._v06.multiscales.Multiscale.model_validate(
+            attributes
+        )
+    else:
+        multiscale = MULTISCALE_CLASSES[version].model_validate(attributes)
+    # Pixel sizes of each level are computed on the first call
+    assert multiscale.select_level(100) == 6
+
+    benchmark(multiscale.level_for_viewport, [[0, 0], [51_200, 51_200]], 1024)
+
+
+@pytest.mark.parametrize("n_levels", [3, 10])
+@pytest.mark.parametrize("cached", [True, False], ids=["cached", "uncached"])
+def test_get_transform_v06(
+    benchmark: BenchmarkFixture, n_levels: int, *, cached: bool
+) -> None:
+    attributes = multiscales_attributes(version="0.6", n_levels=n_levels)[0]
+    multiscale = ome_zarr_models._v06.multiscales.Multiscale.model_validate(attributes)
+    source = f"/{n_levels - 1}"
+    target = f"extra_{n_levels - 1}"
+
+    if cached:
+        multiscale.get_transform(source, target)
+        benchmark(multiscale.get_transform, source, target)
+    else:
+
+        def get_transform() -> None:
+            # Get the transform from a fresh copy of the multiscale metadata,
+            # so the transformation graph is rebuilt every time
+            multiscale.model_copy().get_transform(source, target)
+
+        benchmark(get_transform)
@@ -0,0 +1,145 @@
+import json
+from typing import Any, Literal
+
+import pytest
+from pydantic import BaseModel
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import ome_zarr_models._v06.image
+import ome_zarr_models._v06.multiscales
+import ome_zarr_models.v04.hcs
+import ome_zarr_models.v04.image
+import ome_zarr_models.v04.image_label
+import ome_zarr_models.v04.multiscales
+import ome_zarr_models.v05.hcs
+import ome_zarr_models.v05.image
+import ome_zarr_models.v05.image_label
+import ome_zarr_models.v05.multiscales
+import ome_zarr_models.v05.well_types
+from benchmarks.conftest import Version, multiscales_attributes, plate_attributes
+from ome_zarr_models.common.validation import unique_items_validator
+
+IMAGE_ATTRS_CLASSES: dict[Version, type[BaseModel]] = {
+    "0.4": ome_zarr_models.v04.image.ImageAttrs,
+    "0.5": ome_zarr_models.v05.image.ImageAttrs,
+    "0.6": ome_zarr_models._v06.image.ImageAttrs,
+}
+IMAGE_LABEL_ATTRS_CLASSES: dict[Version, type[BaseModel]] = {
+    "0.4": ome_zarr_models.v04.image_label.ImageLabelAttrs,
+    "0.5": ome_zarr_models.v05.image_label.ImageLabelAttrs,
+}
+HCS_ATTRS_CLASSES: dict[Version, type[BaseModel]] = {
+    "0.4": ome_zarr_models.v04.hcs.HCSAttrs,
+    "0.5": ome_zarr_models.v05.hcs.HCSAttrs,
+}
+MULTISCALE_CLASSES: dict[Version, type[BaseModel]] = {
+    "0.4": ome_zarr_models.v04.multiscales.Multiscale,
+    "0.5": ome_zarr_models.v05.multiscales.Multiscale,
+    "0.6": ome_zarr_models._v06.multiscales.Multiscale,
+}
+DATASET_CLASSES: dict[Version, type[BaseModel]] = {
+    "0.4": ome_zarr_models.v04.multiscales.Dataset,
+    "0.5": ome_zarr_models.v05.multiscales.Dataset,
+    "0.6": ome_zarr_models._v06.multiscales.Dataset,
+}
+
+
+def ome_attributes(attributes: dict[str, Any], *, version: Version) -> dict[str, Any]:
+    """
+    Get the attributes that are validated by an OME-Zarr attributes class.
+    """
+    if version == "0.4":
+        return attributes
+    return {"version": version, **attributes}
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5", "0.6"])
+@pytest.mark.parametrize("n_levels", [3, 12])
+def test_image_attrs_model_validate_json(
+    benchmark: BenchmarkFixture, version: Version, n_levels: int
+) -> None:
+    attributes = ome_attributes(
+        {"multiscales": multiscales_attributes(version=version, n_levels=n_levels)},
+        version=version,
+    )
+    attributes_json = json.dumps(attributes).encode()
+    benchmark(IMAGE_ATTRS_CLASSES[version].model_validate_json, attributes_json)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("n_colors", [16, 4096])
+def test_image_label_attrs_model_validate_json(
+    benchmark: BenchmarkFixture, version: Version, n_colors: int
+) -> None:
+    image_label: dict[str, Any] = {
+        "colors": [
+            {"label-value": value, "rgba": [value % 256, 0, 0, 255]}
+            for value in range(n_colors)
+        ],
+        "properties": [
+            {"label-value": value, "area": value} for value in range(n_colors)
+        ],
+    }
+    if version == "0.4":
+        image_label["version"] = version
+    attributes = ome_attributes(
+        {
+            "image-label": image_label,
+            "multiscales": multiscales_attributes(version=version, n_levels=3),
+        },
+        version=version,
+    )
+    attributes_json = json.dumps(attributes).encode()
+    benchmark(IMAGE_LABEL_ATTRS_CLASSES[version].model_validate_json, attributes_json)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5"])
+@pytest.mark.parametrize("n_wells", [96, 384, 1536])
+def test_hcs_attrs_model_validate_json(
+    benchmark: BenchmarkFixture, version: Literal["0.4", "0.5"], n_wells: int
+) -> None:
+    plate = plate_attributes(version=version, n_wells=n_wells, n_fields=1)
+    attributes_json = json.dumps(
+        ome_attributes({"plate": plate}, version=version)
+    ).encode()
+    benchmark(HCS_ATTRS_CLASSES[version].model_validate_json, attributes_json)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5", "0.6"])
+@pytest.mark.parametrize("n_levels", [3, 12])
+def test_multiscale_model_validate(
+    benchmark: BenchmarkFixture, version: Version, n_levels: int
+) -> None:
+    (multiscale,) = multiscales_attributes(version=version, n_levels=n_levels)
+    benchmark(MULTISCALE_CLASSES[version].model_validate, multiscale)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5", "0.6"])
+def test_dataset_model_validate(benchmark: BenchmarkFixture, version: Version) -> None:
+    (multiscale,) = multiscales_attributes(version=version, n_levels=1)
+    (dataset,) = multiscale["datasets"]
+    benchmark(DATASET_CLASSES[version].model_validate, dataset)
+
+
+@pytest.mark.parametrize("version", ["0.4", "0.5", "0.6"])
+def test_datasets_model_validate(benchmark: BenchmarkFixture, version: Version) -> None:
+    # Every dataset has a different path, so each one is validated from scratch
+    # instead of being shared with a dataset validated from identical metadata
+    (multiscale,) = multiscales_attributes(version=version, n_levels=100)
+    datasets = multiscale["datasets"]
+    dataset_cls = DATASET_CLASSES[version]
+
+    def validate_datasets() -> None:
+        for dataset in datasets:
+            dataset_cls.model_validate(dataset)
+
+    benchmark(validate_datasets)
+
+
+@pytest.mark.parametrize("n_items", [1_000, 10_000, 100_000])
+def test_unique_items_validator(benchmark: BenchmarkFixture, n_items: int) -> None:
+    images = [
+        ome_zarr_models.v05.well_types.WellImage(path=str(i), acquisition=i % 4)
+        for i in range(n_items)
+    ]
+    benchmark(unique_items_validator, images)
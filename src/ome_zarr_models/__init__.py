@@ -1,85 +1,210 @@
-from importlib.metadata import PackageNotFoundError, version
-from typing import Any
-
-import zarr
-
-import ome_zarr_models.v04.hcs
-import ome_zarr_models.v04.image
-import ome_zarr_models.v04.image_label
-import ome_zarr_models.v04.labels
-import ome_zarr_models.v04.well
-import ome_zarr_models.v05.hcs
-import ome_zarr_models.v05.image
-import ome_zarr_models.v05.image_label
-import ome_zarr_models.v05.labels
-import ome_zarr_models.v05.well
-from ome_zarr_models.base import BaseGroup
-from ome_zarr_models.v04.base import BaseGroupv04
-from ome_zarr_models.v05.base import BaseGroupv05
-
-try:
-    __version__ = version("ome_zarr_models")
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "uninstalled"
-
-
-_V04_groups: list[type[BaseGroupv04[Any]]] = [
-    ome_zarr_models.v04.hcs.HCS,
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    import zarr
+
+    from ome_zarr_models.base import BaseGroup
+    from ome_zarr_models.common.instrumentation import instrument
+    from ome_zarr_models.v04.base import BaseGroupv04
+    from ome_zarr_models.v05.base import BaseGroupv05
+
+__all__ = ["instrument", "open_ome_zarr", "prebuild"]
+
+# Mapping from the metadata key that identifies each type of group to the
+# module and name of the class that models that group.
+# Group classes are only imported when they are needed, because importing them
+# builds all their pydantic schemas.
+_V04_GROUP_CLASS_PATHS: dict[str, tuple[str, str]] = {
+    "plate": ("ome_zarr_models.v04.hcs", "HCS"),
+    "well": ("ome_zarr_models.v04.well", "Well"),
+    "labels": ("ome_zarr_models.v04.labels", "Labels"),
     # Important that ImageLabel is higher than Image
-    # otherwise Image will happily parse an ImageLabel
-    # dataset without parsing the image-label bit of
-    # metadata
-    ome_zarr_models.v04.image_label.ImageLabel,
-    ome_zarr_models.v04.image.Image,
-    ome_zarr_models.v04.labels.Labels,
-    ome_zarr_models.v04.well.Well,
-]
-
-_V05_groups: list[type[BaseGroupv05[Any]]] = [
-    ome_zarr_models.v05.hcs.HCS,
+    # image-label groups also contain multiscales metadata
+    "image-label": ("ome_zarr_models.v04.image_label", "ImageLabel"),
+    # ImageLabel.to_zarr() writes the image-label metadata under its field name
+    "image_label": ("ome_zarr_models.v04.image_label", "ImageLabel"),
+    "multiscales": ("ome_zarr_models.v04.image", "Image"),
+}
+
+_V05_GROUP_CLASS_PATHS: dict[str, tuple[str, str]] = {
+    "plate": ("ome_zarr_models.v05.hcs", "HCS"),
+    "well": ("ome_zarr_models.v05.well", "Well"),
+    "labels": ("ome_zarr_models.v05.labels", "Labels"),
     # Important that ImageLabel is higher than Image
-    # otherwise Image will happily parse an ImageLabel
-    # dataset without parsing the image-label bit of
-    # metadata
-    ome_zarr_models.v05.image_label.ImageLabel,
-    ome_zarr_models.v05.image.Image,
-    ome_zarr_models.v05.labels.Labels,
-    ome_zarr_models.v05.well.Well,
-]
+    # image-label groups also contain multiscales metadata
+    "image-label": ("ome_zarr_models.v05.image_label", "ImageLabel"),
+    # ImageLabel.to_zarr() writes the image-label metadata under its field name
+    "image_label": ("ome_zarr_models.v05.image_label", "ImageLabel"),
+    "multiscales": ("ome_zarr_models.v05.image", "Image"),
+}
+
+# Attributes of this module that are only imported when they are first accessed
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "instrument": ("ome_zarr_models.common.instrumentation", "instrument"),
+}
+_LAZY_SUBMODULES = ("base", "common", "v04", "v05")
+
+# Packages that contain the models for each OME-Zarr version
+_VERSION_PACKAGES = {"0.4": "ome_zarr_models.v04", "0.5": "ome_zarr_models.v05"}
+
+
+def _get_version() -> str:
+    """
+    Get the installed version of this package.
+    """
+    # Imported here because importing importlib.metadata is slow
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("ome_zarr_models")
+    except PackageNotFoundError:  # pragma: no cover
+        return "uninstalled"
+
+
+def _import_class(module_name: str, class_name: str) -> Any:
+    """
+    Import a class from a module.
+    """
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import attributes of this module the first time they are accessed.
+    """
+    value: Any
+    if name == "__version__":
+        value = _get_version()
+    elif name == "_V04_groups":
+        value = {
+            key: _import_class(*path) for key, path in _V04_GROUP_CLASS_PATHS.items()
+        }
+    elif name == "_V05_groups":
+        value = {
+            key: _import_class(*path) for key, path in _V05_GROUP_CLASS_PATHS.items()
+        }
+    elif name in _LAZY_ATTRIBUTES:
+        value = _import_class(*_LAZY_ATTRIBUTES[name])
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 
-def open_ome_zarr(group: zarr.Group) -> BaseGroup:
+def __dir__() -> list[str]:
+    return sorted([*globals(), "__version__", *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES])
+
+
+def _get_group_cls(group: zarr.Group) -> type[BaseGroup] | None:
+    """
+    Get the OME-Zarr group class that corresponds to the metadata in a Zarr group.
+
+    This only inspects the attributes of the group, which are already loaded
+    when the group is opened, so does not read anything from the store.
+    Only the module that defines the matching group class is imported.
+
+    Returns `None` if no OME-Zarr group class could be identified.
+    """
+    attrs = group.attrs.asdict()
+    class_paths: dict[str, tuple[str, str]]
+    if group.metadata.zarr_format == 3:
+        ome_attrs = attrs.get("ome")
+        if not isinstance(ome_attrs, dict) or ome_attrs.get("version") != "0.5":
+            return None
+        attrs = ome_attrs
+        class_paths = _V05_GROUP_CLASS_PATHS
+    else:
+        class_paths = _V04_GROUP_CLASS_PATHS
+
+    for key, class_path in class_paths.items():
+        if key in attrs:
+            group_cls: type[BaseGroupv04[Any]] | type[BaseGroupv05[Any]] = (
+                _import_class(*class_path)
+            )
+            return group_cls
+
+    return None
+
+
+def open_ome_zarr(group: zarr.Group, *, trusted: bool = False) -> BaseGroup:
     """
     Create an ome-zarr-models object from an existing OME-Zarr group.
 
     This function will 'guess' which type of OME-Zarr data exists by
-    trying to validate each group metadata definition against your data.
-    If validation is successful, that data class is returned without
-    trying any more.
-
-    It tries more recent versions of OME-Zarr first.
+    looking at the keys present in the group attributes. The Zarr format of
+    the group and the OME-Zarr version in the attributes are used to select
+    the OME-Zarr version.
 
     Parameters
     ----------
     group : zarr.Group
         Zarr group containing OME-Zarr data.
+    trusted :
+        If `True`, create the model without validating the metadata.
+        This is faster, but must only be used for groups whose metadata is
+        already known to be valid, e.g., groups that were written by
+        ome-zarr-models. Passed to `<group class>.from_zarr()`.
 
     Raises
     ------
     RuntimeError
-        If the passed group cannot be validated with any of the OME-Zarr group models.
+        If the type of OME-Zarr group cannot be determined from the group attributes.
+    pydantic.ValidationError, ValueError
+        If the group type is determined, but the group fails validation.
+        This is the same error that `<group class>.from_zarr()` raises.
     """
-    group_cls: type[BaseGroup]
-    for group_cls in _V05_groups + _V04_groups:
-        try:
-            return group_cls.from_zarr(group)
-        except Exception:
-            continue
-
-    raise RuntimeError(
-        f"Could not successfully validate {group} with any OME-Zarr group models.\n"
-        "\n"
-        "If you know what type of group you are trying to open, using the "
-        "<group class>.from_zarr() method will give you a more informative "
-        "error message explaining why validation failed."
-    )
+    group_cls = _get_group_cls(group)
+    if group_cls is None:
+        raise RuntimeError(
+            f"Could not successfully validate {group} with any OME-Zarr group models."
+            "\n\n"
+            "No OME-Zarr metadata keys were found in the group attributes. "
+            f"Valid keys are {list(_V05_GROUP_CLASS_PATHS)} under the 'ome' key "
+            f"(OME-Zarr 0.5), or {list(_V04_GROUP_CLASS_PATHS)} (OME-Zarr 0.4)."
+        )
+    return group_cls.from_zarr(group, trusted=trusted)  # type: ignore[attr-defined,no-any-return]
+
+
+def prebuild(version: Literal["0.4", "0.5"] | None = None) -> None:
+    """
+    Build the validators for every model of an OME-Zarr version.
+
+    Validators for each model are normally built the first time the model is used,
+    so processes only pay for building the models they use.
+    Long-running processes can call this when they start up, so using each
+    model for the first time is not slower than using it again.
+
+    Parameters
+    ----------
+    version :
+        OME-Zarr version to build models for.
+        If `None`, build models for all supported versions.
+    """
+    import pkgutil
+
+    from pydantic import BaseModel
+
+    versions = list(_VERSION_PACKAGES) if version is None else [version]
+    for package_version in versions:
+        if package_version not in _VERSION_PACKAGES:
+            raise ValueError(
+                f"Unsupported OME-Zarr version '{package_version}'. "
+                f"Supported versions are {list(_VERSION_PACKAGES)}."
+            )
+        package = importlib.import_module(_VERSION_PACKAGES[package_version])
+        for module_info in pkgutil.iter_modules(
+            package.__path__, prefix=f"{package.__name__}."
+        ):
+            module = importlib.import_module(module_info.name)
+            for obj in vars(module).values():
+                if (
+                    isinstance(obj, type)
+                    and issubclass(obj, BaseModel)
+                    and obj.__module__.startswith(f"{__name__}.")
+                ):
+                    obj.model_rebuild()
@@ -2,16 +2,37 @@
 Private utilities.
 """
 
-from collections import Counter
-from collections.abc import Hashable, Iterable
+import itertools
+import os
+import threading
+import types
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
 from dataclasses import MISSING, fields, is_dataclass
-from typing import TypeVar
+from typing import (
+    Annotated,
+    Any,
+    Generic,
+    Literal,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 import pydantic
-from pydantic import create_model
+import zarr
+import zarr.api.asynchronous
+import zarr.errors
+from pydantic import BaseModel, create_model
 from zarr.abc.store import Store
+from zarr.core.group import AsyncGroup
 
 T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
 
 
 def get_store_path(store: Store) -> str:
@@ -34,6 +55,164 @@ def duplicates(values: Iterable[Hashable]) -> dict[Hashable, int]:
     return {k: v for k, v in counts.items() if v > 1}
 
 
+_JSON_SCALAR_TYPES = (str, int, float, bool, types.NoneType)
+
+
+def freeze_json(value: Any) -> Hashable:
+    """
+    Convert JSON-like data to a hashable key.
+
+    Dictionaries, lists and scalar values are tagged with their type, so that
+    e.g. `1`, `1.0` and `True` give different keys.
+
+    Raises
+    ------
+    TypeError
+        If *value* contains anything other than dictionaries, lists, strings,
+        numbers, booleans or `None`.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return (dict, tuple((key, freeze_json(item)) for key, item in value.items()))
+    if value_type is list:
+        return (list, tuple(freeze_json(item) for item in value))
+    if value_type in _JSON_SCALAR_TYPES:
+        return (value_type, value)
+    raise TypeError(f"Cannot freeze value of type {value_type}")
+
+
+def get_member(group: Any, path: str) -> Any:
+    """
+    Get the node at a path within a group spec.
+
+    Unlike looking up the path in `group.to_flat()`, this does not copy
+    every node in the hierarchy.
+
+    Raises
+    ------
+    KeyError
+        If there is no node at *path*.
+    """
+    node = group
+    for name in path.strip("/").split("/"):
+        members = getattr(node, "members", None)
+        if members is None or name not in members:
+            raise KeyError(path)
+        node = members[name]
+    return node
+
+
+def add_member(
+    members: dict[str, Any], path: str, node: Any, *, group_cls: type[Any]
+) -> None:
+    """
+    Add a node at a path to the members of a group spec, without copying it.
+
+    Groups with no attributes are created for any parents of *path* that are not
+    already members, in the same way as `GroupSpec.from_flat()`.
+    """
+    *parents, name = path.strip("/").split("/")
+    for parent in parents:
+        if parent not in members:
+            members[parent] = group_cls(attributes={}, members={})
+        members = members[parent].members
+    members[name] = node
+
+
+def update_member(
+    members: Mapping[str, Any], path: str, update: Callable[[Any], Any]
+) -> dict[str, Any]:
+    """
+    Get a copy of the members of a group spec, with the node at a path updated.
+
+    *update* is called with the node at *path*, and the node is replaced with
+    the value it returns. Only the groups along *path* are copied.
+
+    Raises
+    ------
+    KeyError
+        If there is no node at *path*.
+    """
+    name, _, rest = path.strip("/").partition("/")
+    node = members[name]
+    if rest:
+        node_members = getattr(node, "members", None)
+        if node_members is None:
+            raise KeyError(path)
+        node = node.model_copy(
+            update={"members": update_member(node_members, rest, update)}
+        )
+    else:
+        node = update(node)
+    return {**members, name: node}
+
+
+async def open_group_async(group: zarr.Group, path: str) -> zarr.Group:
+    """
+    Open the group at a path within another group.
+
+    If *group* has consolidated metadata, the metadata of the group at *path* is
+    taken from that instead of being read from the store.
+
+    Raises
+    ------
+    zarr.errors.GroupNotFoundError
+        If there is no group at *path*.
+    """
+    if group.metadata.consolidated_metadata is None:
+        return zarr.Group(
+            await zarr.api.asynchronous.open_group(
+                store=group.store_path / path, mode="r"
+            )
+        )
+    try:
+        node = await group._async_group.getitem(path)
+    except KeyError as e:
+        raise zarr.errors.GroupNotFoundError(
+            f"No group found in consolidated metadata at path '{path}'"
+        ) from e
+    if not isinstance(node, AsyncGroup):
+        raise zarr.errors.GroupNotFoundError(
+            f"Expected to find a group at path '{path}', but found an array"
+        )
+    return zarr.Group(node)
+
+
+def set_field_values(model: BaseModel) -> dict[str, Any]:
+    """
+    Get the values of the fields that were set on a model, and any extra values.
+
+    Fields are keyed by their alias if they have one.
+    Unlike `model.model_dump(exclude_unset=True)`, nested models are not converted
+    to dictionaries, so they are not validated again if the values are used to
+    create another model.
+    """
+    model_fields = type(model).model_fields
+    values = {
+        model_fields[name].alias or name: getattr(model, name)
+        for name in model.model_fields_set
+        if name in model_fields
+    }
+    values.update(model.model_extra or {})
+    return values
+
+
+def fields_equal(model: BaseModel, other: BaseModel) -> bool:
+    """
+    Check if two models have the same type, field values and extra values.
+
+    Unlike `model == other`, private attributes are not compared.
+    """
+    return (
+        type(model) is type(other)
+        and model.__pydantic_extra__ == other.__pydantic_extra__
+        and all(
+            getattr(model, name) == getattr(other, name)
+            for name in type(model).model_fields
+        )
+    )
+
+
 def dataclass_to_pydantic(dataclass_type: type) -> type[pydantic.BaseModel]:
     """Convert a dataclass to a Pydantic model.
 
@@ -62,3 +241,227 @@ def dataclass_to_pydantic(dataclass_type: type) -> type[pydantic.BaseModel]:
             field_definitions[_field.name] = (_field.type, Ellipsis)
 
     return create_model(dataclass_type.__name__, **field_definitions)  # type: ignore[no-any-return, call-overload]
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A thread-safe cache that holds at most *maxsize* items.
+
+    When the cache is full, the least recently used item is evicted.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1 (got {maxsize})")
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """
+        Get an item from the cache, or `None` if it is not present.
+        """
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Put an item in the cache, evicting the least recently used item if needed.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all items from the cache.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks can't be pickled, so leave out the lock
+        with self._lock:
+            return {"maxsize": self.maxsize, "_data": self._data.copy()}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def construct_model(model_cls: type[M], data: Mapping[str, Any]) -> M:
+    """
+    Create a pydantic model from a mapping without running any validation.
+
+    Unlike `BaseModel.model_construct()`, this also creates any nested models
+    from the annotations of the model fields, so the returned model has the same
+    structure as a validated model.
+    Values that are already pydantic models are used as they are.
+
+    This must only be used on data that is already known to be valid.
+    """
+    if not model_cls.__pydantic_complete__:
+        # Validation would normally build the model on first use,
+        # but model_construct() doesn't
+        model_cls.model_rebuild()
+
+    values: dict[str, Any] = {}
+    extra = dict(data)
+    for name, field in model_cls.model_fields.items():
+        for key in (field.alias, name):
+            if key is not None and key in extra:
+                values[name] = _construct_value(field.annotation, extra.pop(key))
+                break
+    if model_cls.model_config.get("extra") != "allow":
+        extra = {}
+    # Extra values are set afterwards, because passing them as keyword arguments
+    # fails for keys that clash with the arguments of model_construct()
+    # (e.g., "cls")
+    model = model_cls.model_construct(_fields_set={*values, *extra}, **values)
+    if extra:
+        object.__setattr__(model, "__pydantic_extra__", extra)
+    return model
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """
+    Create a value for a field with a given annotation without validating it.
+    """
+    if isinstance(value, BaseModel):
+        return value
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Annotated:
+        return _construct_value(args[0], value)
+    if origin in (Union, types.UnionType):
+        for arg in args:
+            if _matches(arg, value):
+                return _construct_value(arg, value)
+        return value
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if isinstance(value, Mapping):
+            return construct_model(annotation, value)
+        return value
+    if annotation is float and isinstance(value, int) and not isinstance(value, bool):
+        # The same (lax mode) conversion that validation does
+        return float(value)
+
+    if isinstance(value, Mapping) and origin in (dict, Mapping):
+        return {k: _construct_value(args[1], v) for k, v in value.items()}
+    if isinstance(value, Sequence) and not isinstance(value, str):
+        if origin in (list, Sequence):
+            return [_construct_value(args[0], v) for v in value]
+        if origin is tuple:
+            if len(args) == 2 and args[1] is Ellipsis:
+                return tuple(_construct_value(args[0], v) for v in value)
+            return tuple(
+                _construct_value(arg, v) for arg, v in zip(args, value, strict=True)
+            )
+    return value
+
+
+def _matches(annotation: Any, value: Any) -> bool:
+    """
+    Guess if a value matches one of the options of a union annotation.
+
+    Models match mappings that contain all their required fields,
+    and that have a matching value for any fields annotated with `Literal`.
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _matches(get_args(annotation)[0], value)
+    if annotation is None or annotation is type(None):
+        return value is None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if not isinstance(value, Mapping):
+            return False
+        for name, field in annotation.model_fields.items():
+            key = field.alias if field.alias in value else name
+            if key not in value:
+                if field.is_required():
+                    return False
+                continue
+            if get_origin(field.annotation) is Literal:
+                if value[key] not in get_args(field.annotation):
+                    return False
+        return True
+    if origin in (list, tuple, Sequence):
+        if not isinstance(value, Sequence) or isinstance(value, str):
+            return False
+        args = get_args(annotation)
+        if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+            # Fixed length tuple
+            return len(args) == len(value) and all(
+                _matches(arg, v) for arg, v in zip(args, value, strict=True)
+            )
+        return True
+    if origin in (dict, Mapping):
+        return isinstance(value, Mapping)
+    if isinstance(annotation, type):
+        return isinstance(value, annotation)
+    # Anything else (e.g., type aliases or forward references) can't be checked
+    return True
+
+
+# Maximum number of tasks for each CPU that are submitted to an executor
+# but not yet finished. This limits how much data is held in memory at once.
+_PENDING_TASKS_PER_CPU = 4
+
+
+def run_tasks(
+    executor: Executor,
+    func: Callable[..., T],
+    tasks: Iterable[tuple[Any, ...]],
+) -> Iterator[T]:
+    """
+    Run a function for each set of arguments in *tasks* using *executor*.
+
+    Tasks are submitted lazily, so only a limited number of them (and the data
+    they hold) are waiting to run at any one time.
+    Results are yielded in the order that tasks finish.
+    """
+    max_pending = _PENDING_TASKS_PER_CPU * (os.cpu_count() or 1)
+    pending: set[Future[T]] = set()
+    try:
+        for args in tasks:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(func, *args))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def chunk_regions(array: "zarr.Array[Any]") -> Iterator[tuple[slice, ...]]:
+    """
+    Regions covered by each chunk of an array.
+    """
+    ranges = [
+        range(0, size, chunk)
+        for size, chunk in zip(array.shape, array.chunks, strict=True)
+    ]
+    for starts in itertools.product(*ranges):
+        yield tuple(
+            slice(start, min(start + chunk, size))
+            for start, chunk, size in zip(
+                starts, array.chunks, array.shape, strict=True
+            )
+        )
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generic, Literal, Self, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Generic, Literal, Self, TypeVar, Union
 
 import pydantic_zarr
 import pydantic_zarr.v3
-from pydantic import BaseModel
+import zarr
+from pydantic import BaseModel, ConfigDict
 
 from ome_zarr_models.base import BaseAttrs, BaseGroup
+from ome_zarr_models.common.cache import cached_from_zarr
+from ome_zarr_models.common.instrumentation import instrumented_from_zarr
 
 if TYPE_CHECKING:
-    import zarr
+    from zarr.abc.store import Store
 
 
 class BaseOMEAttrs(BaseAttrs):
@@ -43,8 +46,15 @@ class BaseGroupv06(
     Base class for all v0.6 OME-Zarr groups.
     """
 
+    # See BaseAttrs for why validators are built on first use
+    model_config = ConfigDict(defer_build=True)
+
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    @cached_from_zarr
+    @instrumented_from_zarr
+    def from_zarr(  # type: ignore[override]
+        cls, group: zarr.Group, *, trusted: bool = False
+    ) -> Self:
         """
         Create an OME-Zarr model from a `zarr.Group`.
 
@@ -52,9 +62,70 @@ class BaseGroupv06(
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image metadata.
+        trusted :
+            If `True`, create the model without validating the metadata.
+            Only use this for groups whose metadata is already known to be valid,
+            e.g., groups that were written by ome-zarr-models.
         """
+        if trusted:
+            group_spec: pydantic_zarr.v3.GroupSpec[Any, Any] = (
+                pydantic_zarr.v3.GroupSpec.from_zarr(group)
+            )
+            return cls._from_attributes_and_members(
+                attributes=group_spec.attributes,
+                members=group_spec.members,
+                trusted=True,
+            )
         return super().from_zarr(group)
 
+    def to_zarr(
+        self,
+        store: Store,
+        path: str,
+        *,
+        overwrite: bool = False,
+        consolidate: bool = False,
+        concurrent: bool = False,
+        **kwargs: Any,
+    ) -> zarr.Group:
+        """
+        Save this model to a Zarr store.
+
+        Parameters
+        ----------
+        store :
+            Store to save the group to.
+        path :
+            Path within the store to save the group to.
+        overwrite :
+            If `True`, overwrite any existing group or array at *path*.
+        consolidate :
+            If `True`, also write consolidated metadata for the group.
+            This allows the whole group to be loaded later with a single read.
+        concurrent :
+            If `True`, create the metadata for every group and array in memory,
+            and then write all the metadata documents to the store concurrently.
+            This is much faster for large hierarchies (e.g., HCS plates), especially
+            on high latency stores.
+            Unlike the default behaviour, an error is raised if there is already
+            a group or array at any of the paths and *overwrite* is `False`.
+        **kwargs :
+            Passed to `GroupSpec.to_zarr()`. Not supported if *concurrent* is `True`.
+        """
+        if concurrent:
+            if kwargs:
+                raise TypeError(
+                    "Extra keyword arguments are not supported when concurrent=True. "
+                    f"Got {list(kwargs)}."
+                )
+            return self._to_zarr_concurrent(
+                store, path, overwrite=overwrite, consolidate=consolidate
+            )
+        group = super().to_zarr(store, path, overwrite=overwrite, **kwargs)
+        if consolidate:
+            group = zarr.consolidate_metadata(store, path)
+        return group
+
     @property
     def ome_zarr_version(self) -> Literal["0.6"]:
         """
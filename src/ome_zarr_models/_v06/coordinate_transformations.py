@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-from typing import Literal, Self
+import itertools
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Literal, Self
 
 from pydantic import Field, field_validator, model_validator
 
 from ome_zarr_models._v06.axes import Axes
 from ome_zarr_models.base import BaseAttrs
+from ome_zarr_models.common.coordinate_transformations import ScaleTranslation
 from ome_zarr_models.common.validation import unique_items_validator
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 # to add to __all__:
 # "PathScale",  # TODO: not supported yet
 # "PathTranslation",  # TODO: not supported yet
@@ -15,7 +22,9 @@ __all__ = [
     "CoordinateSystem",
     "Identity",
     "ScaleTransform",
+    "ScaleTranslation",
     "SequenceTransform",
+    "TransformationGraph",
     "TranslationTransform",
     "VectorScale",
     "VectorTransform",
@@ -111,3 +120,153 @@ CoordinateTransformation = (
 ScaleTransform = VectorScale  # | PathScale # to be added
 TranslationTransform = VectorTranslation  # | PathTranslation # to be added
 VectorTransform = VectorScale | VectorTranslation
+
+
+def _to_scale_translation(
+    transform: CoordinateTransformation,
+) -> ScaleTranslation | None:
+    """
+    Convert a coordinate transformation to a `ScaleTranslation`.
+
+    Returns `None` for identity transformations, which don't have a dimensionality.
+    """
+    if isinstance(transform, VectorScale):
+        return ScaleTranslation(transform.scale)
+    elif isinstance(transform, VectorTranslation):
+        return ScaleTranslation(
+            [1.0] * len(transform.translation), transform.translation
+        )
+    elif isinstance(transform, SequenceTransform):
+        combined = None
+        for sub_transform in transform.transformations:
+            converted = _to_scale_translation(sub_transform)
+            if converted is None:
+                continue
+            combined = converted if combined is None else combined.then(converted)
+        return combined
+    return None
+
+
+class TransformationGraph:
+    """
+    A graph of coordinate transformations between coordinate systems.
+
+    Each coordinate system (or array path) is a node, and each coordinate
+    transformation is an edge from its input to its output.
+    Transformations can also be followed backwards, using their inverse.
+
+    Parameters
+    ----------
+    transformations :
+        Coordinate transformations. Transformations without an input and output
+        are ignored.
+    ndims :
+        Dimensionality of each node. This is needed to create transforms
+        between nodes that are only connected by identity transformations.
+    """
+
+    def __init__(
+        self,
+        transformations: Iterable[CoordinateTransformation],
+        ndims: dict[str, int],
+    ) -> None:
+        self._ndims = ndims
+        # Mapping from each node to a list of (node, transform) pairs for each
+        # of its neighbours. A transform of None is an identity transform.
+        self._edges: dict[str, list[tuple[str, ScaleTranslation | None]]] = {
+            name: [] for name in ndims
+        }
+        for transformation in transformations:
+            if transformation.input is None or transformation.output is None:
+                continue
+            forward = _to_scale_translation(transformation)
+            self._edges.setdefault(transformation.input, []).append(
+                (transformation.output, forward)
+            )
+            if forward is not None and (forward.scale == 0).any():
+                # Not invertible, so can only be followed forwards
+                continue
+            self._edges.setdefault(transformation.output, []).append(
+                (transformation.input, None if forward is None else forward.inverse())
+            )
+        self._cache: dict[tuple[str, str], ScaleTranslation] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def nodes(self) -> list[str]:
+        """
+        Names of all the nodes in the graph.
+        """
+        return list(self._edges)
+
+    def find_path(self, source: str, target: str) -> list[str]:
+        """
+        Find the shortest chain of transformations between two nodes.
+
+        Returns
+        -------
+        list[str]
+            Names of the nodes on the path, starting with *source*
+            and ending with *target*.
+
+        Raises
+        ------
+        ValueError
+            If either node is not in the graph, or there is no path between them.
+        """
+        for node in (source, target):
+            if node not in self._edges:
+                raise ValueError(
+                    f"No coordinate system with name '{node}' found. "
+                    f"Must be one of {self.nodes}."
+                )
+
+        # Breadth first search, so the first path found is one of the shortest
+        previous: dict[str, str | None] = {source: None}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            if node == target:
+                path = [node]
+                while (parent := previous[path[-1]]) is not None:
+                    path.append(parent)
+                return path[::-1]
+            for neighbour, _ in self._edges[node]:
+                if neighbour not in previous:
+                    previous[neighbour] = node
+                    queue.append(neighbour)
+
+        raise ValueError(
+            f"No chain of coordinate transformations from '{source}' to '{target}'."
+        )
+
+    def get_transform(self, source: str, target: str) -> ScaleTranslation:
+        """
+        Get the transform from one node to another.
+
+        The transformations on the shortest path between the nodes are combined
+        into a single transform. Transforms are cached, so getting the same
+        transform again is fast.
+
+        Raises
+        ------
+        ValueError
+            If either node is not in the graph, or there is no path between them.
+        """
+        key = (source, target)
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+
+        path = self.find_path(source, target)
+        combined: ScaleTranslation | None = None
+        for start, end in itertools.pairwise(path):
+            transform = next(t for node, t in self._edges[start] if node == end)
+            if transform is not None:
+                combined = transform if combined is None else combined.then(transform)
+        if combined is None:
+            combined = ScaleTranslation.identity(self._ndims[source])
+
+        with self._lock:
+            self._cache[key] = combined
+        return combined
@@ -1,16 +1,25 @@
+from collections.abc import Mapping
 from typing import Any, Self
 
 # Import needed for pydantic type resolution
 import pydantic_zarr  # noqa: F401
 import zarr
+import zarr.api.asynchronous
 import zarr.errors
-from pydantic import Field, model_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_zarr.v3 import AnyArraySpec, AnyGroupSpec, GroupSpec
+from zarr.core.sync import sync
 
+from ome_zarr_models._utils import add_member, construct_model, open_group_async
 from ome_zarr_models._v06.base import BaseGroupv06, BaseOMEAttrs
 from ome_zarr_models._v06.labels import Labels
 from ome_zarr_models._v06.multiscales import Dataset, Multiscale
-from ome_zarr_models.common.validation import check_array_path
+from ome_zarr_models.common.cache import cached_from_zarr
+from ome_zarr_models.common.instrumentation import (
+    instrumented_from_zarr,
+    instrumented_from_zarr_async,
+)
+from ome_zarr_models.common.validation import check_array_paths_async
 
 __all__ = ["Image", "ImageAttrs"]
 
@@ -33,7 +42,11 @@ class Image(BaseGroupv06[ImageAttrs]):
     """
 
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    @cached_from_zarr
+    @instrumented_from_zarr
+    def from_zarr(  # type: ignore[override]
+        cls, group: zarr.Group, *, trusted: bool = False
+    ) -> Self:
         """
         Create an OME-Zarr image model from a `zarr.Group`.
 
@@ -41,35 +54,67 @@ class Image(BaseGroupv06[ImageAttrs]):
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image metadata.
+        trusted :
+            If `True`, create the model without validating the metadata.
+            Only use this for groups whose metadata is already known to be valid,
+            e.g., groups that were written by ome-zarr-models.
+        """
+        return sync(cls.from_zarr_async(group, trusted=trusted))
+
+    @classmethod
+    @instrumented_from_zarr_async
+    async def from_zarr_async(cls, group: zarr.Group, *, trusted: bool = False) -> Self:
+        """
+        Asynchronously create an OME-Zarr image model from a `zarr.Group`.
+
+        The metadata for all the arrays in the image are fetched concurrently.
+
+        Parameters
+        ----------
+        group : zarr.Group
+            A Zarr group that has valid OME-Zarr image metadata.
+        trusted :
+            If `True`, create the model without validating the metadata.
         """
         # on unlistable storage backends, the members of this group will be {}
         group_spec: GroupSpec[dict[str, Any], Any] = GroupSpec.from_zarr(group, depth=0)
 
         if "ome" not in group_spec.attributes:
             raise RuntimeError(f"Did not find 'ome' key in {group} attributes")
-        multi_meta = ImageAttrs.model_validate(group_spec.attributes["ome"])
-        members_tree_flat: dict[str, AnyGroupSpec | AnyArraySpec] = {}
-        for multiscale in multi_meta.multiscales:
-            for dataset in multiscale.datasets:
-                array_path = f"{group.path}/{dataset.path}"
-                array_spec = check_array_path(
-                    group, array_path, expected_zarr_version=3
-                )
-                members_tree_flat["/" + dataset.path] = array_spec
+
+        if trusted:
+            multi_meta = construct_model(ImageAttrs, group_spec.attributes["ome"])
+        else:
+            multi_meta = ImageAttrs.model_validate(group_spec.attributes["ome"])
+        dataset_paths = [
+            dataset.path
+            for multiscale in multi_meta.multiscales
+            for dataset in multiscale.datasets
+        ]
+        array_specs = await check_array_paths_async(
+            group,
+            [f"{group.path}/{path}" for path in dataset_paths],
+            expected_zarr_version=3,
+        )
+        members: dict[str, AnyGroupSpec | AnyArraySpec] = {}
+        for path, array_spec in zip(dataset_paths, array_specs, strict=True):
+            add_member(members, path, array_spec, group_cls=GroupSpec)
 
         try:
-            labels_group = zarr.open_group(store=group.store_path / "labels", mode="r")
-            labels = Labels.from_zarr(labels_group)
-            # members_tree_flat["/labels"] = labels
-            labels_flat = labels.to_flat()
-            for path in labels_flat:
-                members_tree_flat[f"/labels{path}"] = labels_flat[path]
+            labels_group = await open_group_async(group, "labels")
+            labels = await Labels.from_zarr_async(labels_group, trusted=trusted)
+            add_member(members, "labels", labels, group_cls=GroupSpec)
 
         except zarr.errors.GroupNotFoundError:
             pass
 
-        members_normalized: AnyGroupSpec = GroupSpec.from_flat(members_tree_flat)
-        return cls(attributes=group_spec.attributes, members=members_normalized.members)
+        # The OME attributes and the labels have already been validated,
+        # so pass the models in directly to stop them being validated again
+        return cls._from_attributes_and_members(
+            attributes={**group_spec.attributes, "ome": multi_meta},
+            members=members,
+            trusted=trusted,
+        )
 
     # TODO: this code was copy-pasted from v05 and now needs to be adapted to v06.
     #  In particular the "axes" are not used anymore.
@@ -241,6 +286,27 @@ class Image(BaseGroupv06[ImageAttrs]):
     #
     #     return self
 
+    @field_validator("members", mode="after")
+    @classmethod
+    def _labels_member(
+        cls, members: Mapping[str, Any] | None
+    ) -> Mapping[str, Any] | None:
+        """
+        Convert the labels group in the members to a `Labels` model.
+
+        This gives validated images the same types of members as images created
+        with `from_zarr()`.
+        """
+        if members is None or "labels" not in members:
+            return members
+        labels_group = members["labels"]
+        if isinstance(labels_group, Labels) or not isinstance(labels_group, GroupSpec):
+            return members
+        labels = Labels(
+            attributes=labels_group.attributes, members=labels_group.members
+        )
+        return {**members, "labels": labels}
+
     @model_validator(mode="after")
     def _check_label_multiscales(self) -> Self:
         """
@@ -287,6 +353,8 @@ class Image(BaseGroupv06[ImageAttrs]):
             return None
 
         labels_group = self.members["labels"]
+        if isinstance(labels_group, Labels):
+            return labels_group
         if not isinstance(labels_group, GroupSpec):
             raise ValueError("Node at path 'labels' is not a group")
 
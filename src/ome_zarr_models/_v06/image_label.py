@@ -4,11 +4,18 @@ from typing import Self
 import pydantic_zarr  # noqa: F401
 import zarr
 from pydantic import Field
+from zarr.core.sync import sync
 
+from ome_zarr_models._utils import set_field_values
 from ome_zarr_models._v06.base import BaseGroupv06, BaseOMEAttrs
 from ome_zarr_models._v06.image import Image
 from ome_zarr_models._v06.image_label_types import Label
 from ome_zarr_models._v06.multiscales import Multiscale
+from ome_zarr_models.common.cache import cached_from_zarr
+from ome_zarr_models.common.instrumentation import (
+    instrumented_from_zarr,
+    instrumented_from_zarr_async,
+)
 
 __all__ = ["ImageLabel", "ImageLabelAttrs"]
 
@@ -30,7 +37,11 @@ class ImageLabel(
     """
 
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    @cached_from_zarr
+    @instrumented_from_zarr
+    def from_zarr(  # type: ignore[override]
+        cls, group: zarr.Group, *, trusted: bool = False
+    ) -> Self:
         """
         Create an instance of an OME-Zarr image from a `zarr.Group`.
 
@@ -38,7 +49,34 @@ class ImageLabel(
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image label metadata.
+        trusted :
+            If `True`, create the model without validating the metadata.
+            Only use this for groups whose metadata is already known to be valid,
+            e.g., groups that were written by ome-zarr-models.
         """
-        # Use Image.from_zarr() to validate multiscale metadata
-        image = Image.from_zarr(group)
-        return cls(attributes=image.attributes.model_dump(), members=image.members)
+        return sync(cls.from_zarr_async(group, trusted=trusted))
+
+    @classmethod
+    @instrumented_from_zarr_async
+    async def from_zarr_async(cls, group: zarr.Group, *, trusted: bool = False) -> Self:
+        """
+        Asynchronously create an instance of an OME-Zarr image label from
+        a `zarr.Group`.
+
+        The metadata for all the arrays in the image label are fetched concurrently.
+
+        Parameters
+        ----------
+        group : zarr.Group
+            A Zarr group that has valid OME-Zarr image label metadata.
+        trusted :
+            If `True`, create the model without validating the metadata.
+        """
+        # Use Image.from_zarr_async() to validate multiscale metadata. The validated
+        # multiscales are re-used, so only the image-label metadata is validated here.
+        image = await Image.from_zarr_async(group, trusted=trusted)
+        return cls._from_attributes_and_members(
+            attributes={"ome": set_field_values(image.ome_attributes)},
+            members=image.members,
+            trusted=trusted,
+        )
@@ -1,3 +1,6 @@
+import asyncio
+import functools
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, Self
 
 import numpy as np
@@ -5,11 +8,30 @@ import numpy as np
 # Import needed for pydantic type resolution
 import pydantic_zarr  # noqa: F401
 import zarr
+import zarr.api.asynchronous
 import zarr.errors
-from pydantic import Field, ValidationError, model_validator
+from pydantic import (
+    Field,
+    ValidationError,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 from pydantic_zarr.v3 import AnyArraySpec, AnyGroupSpec, GroupSpec
+from zarr.core.sync import sync
 
+from ome_zarr_models._utils import (
+    add_member,
+    construct_model,
+    open_group_async,
+    update_member,
+)
 from ome_zarr_models._v06.base import BaseGroupv06, BaseOMEAttrs
+from ome_zarr_models.common.cache import cached_from_zarr
+from ome_zarr_models.common.instrumentation import (
+    instrumented_from_zarr,
+    instrumented_from_zarr_async,
+)
 from ome_zarr_models.common.validation import check_array_spec, check_group_spec
 
 if TYPE_CHECKING:
@@ -48,8 +70,12 @@ def _check_valid_dtypes(labels: "Labels") -> "Labels":
             raise ValueError(f"Label path '{label_path}' not found in zarr group")
         label_spec = check_group_spec(labels, label_path)  # type: ignore[arg-type]
         try:
-            image_spec = ImageLabel(
-                attributes=label_spec.attributes, members=label_spec.members
+            image_spec = (
+                label_spec
+                if isinstance(label_spec, ImageLabel)
+                else ImageLabel(
+                    attributes=label_spec.attributes, members=label_spec.members
+                )
             )
         except ValidationError as e:
             raise RuntimeError(
@@ -85,6 +111,28 @@ class LabelsAttrs(BaseOMEAttrs):
     )
 
 
+async def _image_label_from_zarr_async(
+    group: zarr.Group, label_path: str, *, trusted: bool
+) -> "ImageLabel":
+    """
+    Load the image label group at a path within a labels group.
+    """
+    from ome_zarr_models._v06.image_label import ImageLabel
+
+    try:
+        image_group = await open_group_async(group, label_path)
+    except zarr.errors.GroupNotFoundError as err:
+        raise ValueError(f"Label path '{label_path}' not found in zarr group") from err
+    try:
+        return await ImageLabel.from_zarr_async(image_group, trusted=trusted)
+    except Exception as err:
+        msg = (
+            f"Error validating the label path '{label_path}' "
+            "as a OME-Zarr multiscales group."
+        )
+        raise RuntimeError(msg) from err
+
+
 class Labels(
     BaseGroupv06[LabelsAttrs],
 ):
@@ -93,7 +141,11 @@ class Labels(
     """
 
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    @cached_from_zarr
+    @instrumented_from_zarr
+    def from_zarr(  # type: ignore[override]
+        cls, group: zarr.Group, *, trusted: bool = False
+    ) -> Self:
         """
         Create an OME-Zarr labels model from a `zarr.Group`.
 
@@ -101,36 +153,92 @@ class Labels(
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr label metadata.
+        trusted :
+            If `True`, create the model without validating the metadata.
+            Only use this for groups whose metadata is already known to be valid,
+            e.g., groups that were written by ome-zarr-models.
         """
-        from ome_zarr_models._v06.image_label import ImageLabel
+        return sync(cls.from_zarr_async(group, trusted=trusted))
 
+    @classmethod
+    @instrumented_from_zarr_async
+    async def from_zarr_async(cls, group: zarr.Group, *, trusted: bool = False) -> Self:
+        """
+        Asynchronously create an OME-Zarr labels model from a `zarr.Group`.
+
+        All the image label groups are loaded concurrently.
+
+        Parameters
+        ----------
+        group : zarr.Group
+            A Zarr group that has valid OME-Zarr label metadata.
+        trusted :
+            If `True`, create the model without validating the metadata.
+        """
         attrs_dict = group.attrs.asdict()
-        label_attrs = LabelsAttrs.model_validate(group.attrs.asdict()["ome"])
+        if trusted:
+            label_attrs = construct_model(LabelsAttrs, attrs_dict["ome"])  # type: ignore[arg-type]
+        else:
+            label_attrs = LabelsAttrs.model_validate(attrs_dict["ome"])
+
+        image_labels = await asyncio.gather(
+            *(
+                _image_label_from_zarr_async(group, label_path, trusted=trusted)
+                for label_path in label_attrs.labels
+            )
+        )
+        members: dict[str, AnyGroupSpec | AnyArraySpec] = {}
+        for label_path, image_label in zip(
+            label_attrs.labels, image_labels, strict=True
+        ):
+            add_member(members, label_path, image_label, group_cls=GroupSpec)
+
+        # The OME attributes and the image labels have already been validated,
+        # so pass the models in directly to stop them being validated again
+        return cls._from_attributes_and_members(
+            attributes={**attrs_dict, "ome": label_attrs},
+            members=members,
+            trusted=trusted,
+        )
+
+    @field_validator("members", mode="after")
+    @classmethod
+    def _image_label_members(
+        cls, members: Mapping[str, Any] | None, info: ValidationInfo
+    ) -> Mapping[str, Any] | None:
+        """
+        Convert the image label groups in the members to `ImageLabel` models.
 
-        # Extract Zarr Image paths from multiscale metadata
-        members_tree_flat: dict[str, AnyGroupSpec | AnyArraySpec] = {}
-        for label_path in label_attrs.labels:
+        This gives validated labels groups the same types of members as labels
+        groups created with `from_zarr()`.
+        """
+        from ome_zarr_models._v06.image_label import ImageLabel
+
+        attributes = info.data.get("attributes")
+        if members is None or attributes is None:
+            return members
+
+        def to_image_label(label_path: str, spec: Any) -> Any:
+            if isinstance(spec, ImageLabel) or not isinstance(spec, GroupSpec):
+                # Anything that isn't a group is reported by _check_valid_dtypes()
+                return spec
             try:
-                image_group = zarr.open_group(
-                    store=group.store_path / label_path, mode="r"
-                )
-            except zarr.errors.GroupNotFoundError as err:
-                raise ValueError(
-                    f"Label path '{label_path}' not found in zarr group"
-                ) from err
+                return ImageLabel(attributes=spec.attributes, members=spec.members)
+            except ValidationError as e:
+                raise RuntimeError(
+                    f"Error validating multiscale image at path '{label_path}'. "
+                    "See above for more detailed error message."
+                ) from e
+
+        for label_path in attributes.ome.labels:
             try:
-                image_model = ImageLabel.from_zarr(image_group).to_flat()
-            except Exception as err:
-                msg = (
-                    f"Error validating the label path '{label_path}' "
-                    "as a OME-Zarr multiscales group."
+                members = update_member(
+                    members, label_path, functools.partial(to_image_label, label_path)
                 )
-                raise RuntimeError(msg) from err
-            for path in image_model:
-                members_tree_flat["/" + label_path + path] = image_model[path]
-
-        members_normalized: AnyGroupSpec = GroupSpec.from_flat(members_tree_flat)
-        return cls(attributes=attrs_dict, members=members_normalized.members)
+            except KeyError:
+                # Missing label paths are reported by _check_valid_dtypes()
+                continue
+        return members
 
     _check_valid_dtypes = model_validator(mode="after")(_check_valid_dtypes)
 
@@ -150,6 +258,8 @@ class Labels(
         if self.members is None:
             raise RuntimeError(f"{self.members=}")
         spec = self.members[path]
+        if isinstance(spec, ImageLabel):
+            return spec
         if not isinstance(spec, GroupSpec):
             raise RuntimeError(f"Node at {path} is not a group")
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Self
+from functools import cached_property
+from typing import TYPE_CHECKING, Self
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     JsonValue,
     field_validator,
@@ -13,15 +15,37 @@ from pydantic import (
 from ome_zarr_models._v06.coordinate_transformations import (
     CoordinateSystem,
     CoordinateTransformation,
+    ScaleTranslation,
+    SequenceTransform,
+    TransformationGraph,
     VectorScale,
     VectorTranslation,
 )
 from ome_zarr_models.base import BaseAttrs
+from ome_zarr_models.common.multiscales import _select_level, _viewport_pixel_size
 from ome_zarr_models.common.validation import check_length
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+    from ome_zarr_models._v06.axes import Axes
+
 __all__ = ["Dataset", "Multiscale"]
 
 
+class _Transforms(BaseModel):
+    """
+    Wrapper used to validate the transforms of a `Dataset` before checking them.
+    """
+
+    # See BaseAttrs for why validators are built on first use
+    model_config = ConfigDict(defer_build=True)
+
+    transforms: list[CoordinateTransformation]
+
+
 class Dataset(BaseAttrs):
     """
     An element of Multiscale.datasets.
@@ -47,13 +71,9 @@ class Dataset(BaseAttrs):
         - if such transformation is a sequence, ensure that its length is 2 and that
           the first transformation is a scale and the second a translation
         """
-        # the class below simplifies error messages since we are in a before validator;
+        # _Transforms simplifies error messages since we are in a before validator;
         # see more: ome_zarr_models.common.multiscales.Dataset
-
-        class Transforms(BaseModel):
-            transforms: list[CoordinateTransformation]
-
-        transforms = Transforms(transforms=transforms_obj).transforms
+        transforms = _Transforms(transforms=transforms_obj).transforms
         check_length(transforms, valid_lengths=[1], variable_name="transforms")
 
         transform = transforms[0]
@@ -128,24 +148,73 @@ class Multiscale(BaseAttrs):
     name: JsonValue | None = None
     type: JsonValue = None
 
+    @cached_property
+    def _coordinate_systems_by_name(self) -> dict[str, CoordinateSystem]:
+        return {cs.name: cs for cs in self.coordinateSystems}
+
     def get_coordinate_system(self, name: str) -> CoordinateSystem:
         """
         Get a coordinate system by name.
         """
-        for cs in self.coordinateSystems:
-            if cs.name == name:
-                return cs
-        raise ValueError(f"No coordinate system with name {name} found.")
+        try:
+            return self._coordinate_systems_by_name[name]
+        except KeyError:
+            raise ValueError(f"No coordinate system with name {name} found.") from None
+
+    @cached_property
+    def transformation_graph(self) -> TransformationGraph:
+        """
+        Graph of all the coordinate transformations in this multiscale.
+
+        This includes the coordinate transformations of each dataset, which
+        transform from the array (identified by the input of the transformations)
+        to a coordinate system, and the coordinate transformations between
+        coordinate systems.
+
+        The graph is built the first time it is accessed, and then re-used.
+        """
+        ndims = {cs.name: len(cs.axes) for cs in self.coordinateSystems}
+        transformations: list[CoordinateTransformation] = []
+        for dataset in self.datasets:
+            for transformation in dataset.coordinateTransformations:
+                if transformation.input is not None and transformation.output in ndims:
+                    ndims.setdefault(transformation.input, ndims[transformation.output])
+                transformations.append(transformation)
+        transformations.extend(self.coordinateTransformations or ())
+        return TransformationGraph(transformations, ndims)
+
+    def get_transform(self, from_cs: str, to_cs: str) -> ScaleTranslation:
+        """
+        Get the transform between two coordinate systems.
+
+        The coordinate transformations along the shortest chain between the
+        two coordinate systems are combined into a single transform.
+        Transformations are followed backwards (using their inverse) if needed.
+        Combined transforms are cached, so repeated calls are fast.
+
+        Parameters
+        ----------
+        from_cs :
+            Name of the coordinate system to transform from. This can also be the
+            input of a dataset transformation (e.g., `"/0"`) to transform from
+            array coordinates.
+        to_cs :
+            Name of the coordinate system to transform to.
+
+        Raises
+        ------
+        ValueError
+            If either coordinate system doesn't exist, or there is no chain of
+            coordinate transformations between them.
+        """
+        return self.transformation_graph.get_transform(from_cs, to_cs)
 
     @property
     def ndim(self) -> int:
         """
         Dimensionality of the data described by this metadata.
         """
-        output_cs_name = self.datasets[0].coordinateTransformations[0].output
-        assert output_cs_name is not None
-        output_cs = self.get_coordinate_system(name=output_cs_name)
-        return len(output_cs.axes)
+        return len(self._output_axes)
 
     @property
     def default_coordinate_system(self) -> CoordinateSystem:
@@ -157,6 +226,89 @@ class Multiscale(BaseAttrs):
         """
         return self.coordinateSystems[0]
 
+    @cached_property
+    def _spatial_scales(self) -> tuple[tuple[float, ...], ...]:
+        """
+        Pixel size of each level along each spatial axis of its output
+        coordinate system.
+
+        Cached as tuples, so that models still compare equal with `==`
+        after this is cached.
+        """
+        spatial = [
+            i for i, axis in enumerate(self._output_axes) if axis.type == "space"
+        ]
+        scales = []
+        for dataset in self.datasets:
+            (transform,) = dataset.coordinateTransformations
+            if isinstance(transform, SequenceTransform):
+                transform = transform.transformations[0]
+            assert isinstance(transform, VectorScale)
+            scales.append(tuple(float(transform.scale[i]) for i in spatial))
+        return tuple(scales)
+
+    @property
+    def _output_axes(self) -> Axes:
+        output_cs_name = self.datasets[0].coordinateTransformations[0].output
+        assert output_cs_name is not None
+        return self.get_coordinate_system(name=output_cs_name).axes
+
+    def select_level(self, target_pixel_size: npt.ArrayLike) -> int:
+        """
+        Select the multiscale level to use for a given pixel size.
+
+        The lowest resolution level with a pixel size less than or equal to the
+        target pixel size along the spatial axes of the datasets' output
+        coordinate system is selected.
+        If no level is high enough resolution, the highest resolution level
+        is selected.
+        Levels do not need to be ordered from high to low resolution.
+
+        Pixel sizes of each level are computed the first time this is called,
+        so subsequent calls are fast.
+
+        Parameters
+        ----------
+        target_pixel_size :
+            Target pixel size, in the units of the spatial axes.
+            Either a single pixel size for every spatial axis,
+            or pixel sizes for the last N spatial axes (e.g., the `y` and `x` axes
+            when viewing 2D slices of 3D data).
+
+        Returns
+        -------
+        int
+            Index of the selected dataset in `datasets`.
+        """
+        return _select_level(self._spatial_scales, target_pixel_size)
+
+    def level_for_viewport(
+        self, bbox: npt.ArrayLike, screen_px: int | Sequence[int]
+    ) -> int:
+        """
+        Select the multiscale level to use to show a region on screen.
+
+        This selects the lowest resolution level that still has at least one
+        pixel for every screen pixel (see `select_level()`).
+
+        Parameters
+        ----------
+        bbox :
+            Bounding box of the region in the output coordinate system of the
+            datasets, with shape (2, n_axes). The first row is one corner of the box,
+            and the second row is the opposite corner.
+            The axes are the last `n_axes` spatial axes.
+        screen_px :
+            Number of screen pixels the region is shown across.
+            Either a single number for all axes, or one number for each axis.
+
+        Returns
+        -------
+        int
+            Index of the selected dataset in `datasets`.
+        """
+        return self.select_level(_viewport_pixel_size(bbox, screen_px))
+
     @model_validator(mode="after")
     def _ensure_same_output_cs_for_all_datasets(data: Self) -> Self:
         """
@@ -1,7 +1,25 @@
+from __future__ import annotations
+
+import dataclasses
+import weakref
 from abc import ABC, abstractmethod
-from typing import Literal
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Literal, Self
+
+import zarr
+from pydantic import BaseModel, ConfigDict, model_validator
+from zarr.core.group import ConsolidatedMetadata, GroupMetadata
+from zarr.core.metadata import ArrayV2Metadata, ArrayV3Metadata
+
+from ome_zarr_models._utils import construct_model, freeze_json
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
 
-from pydantic import BaseModel, ConfigDict
+    from pydantic import ModelWrapValidatorHandler
+    from zarr.abc.store import Store
+
+    NodeMetadata = GroupMetadata | ArrayV2Metadata | ArrayV3Metadata
 
 
 class BaseAttrs(BaseModel):
@@ -19,14 +37,152 @@ class BaseAttrs(BaseModel):
         # key - names in Python can't contain a "."
         populate_by_name=True,
         frozen=True,
+        # Build validators the first time each model is used, instead of when
+        # it is defined, so importing a module only pays for models that are used.
+        # Use ome_zarr_models.prebuild() to build them up front.
+        defer_build=True,
     )
 
 
+# Interned models, keyed by model class and the data they were validated from.
+# Models are removed when nothing else refers to them.
+_interned_models: weakref.WeakValueDictionary[Hashable, InternedAttrs] = (
+    weakref.WeakValueDictionary()
+)
+# Set while a model is being created with __init__(), which must fill in the
+# new model instead of returning an existing one
+_in_init: ContextVar[bool] = ContextVar("_in_init", default=False)
+
+
+class InternedAttrs(BaseAttrs):
+    """
+    Base class for metadata models that are shared between identical copies.
+
+    When one of these models is validated from JSON-like data (e.g., metadata
+    read from a Zarr group), and a model of the same class has already been
+    validated from identical data, the existing model is returned instead of
+    validating and storing a new copy.
+    This saves time and memory when the same metadata is repeated many times,
+    e.g. the axes of every image in a HCS plate.
+
+    Notes
+    -----
+    Models are only shared if every value they hold is immutable (i.e., the
+    model and its extra values can be hashed), so one model can never be changed
+    through another model that shares it.
+    Only use this for models whose fields are all immutable types.
+    """
+
+    def __init__(self, /, **data: Any) -> None:
+        token = _in_init.set(True)
+        try:
+            super().__init__(**data)
+        finally:
+            _in_init.reset(token)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _intern(cls, data: Any, handler: ModelWrapValidatorHandler[Self]) -> Self:
+        if _in_init.get():
+            # Models nested inside this one can still be interned
+            token = _in_init.set(False)
+            try:
+                return handler(data)
+            finally:
+                _in_init.reset(token)
+        try:
+            key = (cls, freeze_json(data))
+        except TypeError:
+            # Not JSON-like data (e.g. an existing model), so validate as normal
+            return handler(data)
+        model = _interned_models.get(key)
+        if model is None:
+            model = handler(data)
+            if not _is_immutable(model):
+                # e.g. a JSON list or dictionary in an extra field
+                return model
+            model = _interned_models.setdefault(key, model)
+        return model  # type: ignore[return-value]
+
+
+def _is_immutable(model: BaseModel) -> bool:
+    """
+    Check if a frozen model and every value it holds are immutable.
+    """
+    try:
+        hash((model, *(model.model_extra or {}).values()))
+    except TypeError:
+        return False
+    return True
+
+
 class BaseGroup(ABC):
     """
     Base class for all OME-Zarr groups.
     """
 
+    @classmethod
+    def _from_attributes_and_members(
+        cls, *, attributes: Any, members: Any, trusted: bool = False
+    ) -> Self:
+        """
+        Create a group model from its attributes and members.
+
+        If *trusted* is `True`, the model is created without any validation.
+        """
+        if trusted:
+            return construct_model(
+                cls,  # type: ignore[type-var]
+                {"attributes": attributes, "members": members},
+            )
+        return cls(attributes=attributes, members=members)  # type: ignore[call-arg]
+
+    def _to_zarr_concurrent(
+        self, store: Store, path: str, *, overwrite: bool, consolidate: bool
+    ) -> zarr.Group:
+        """
+        Save this model to a Zarr store, writing all metadata documents concurrently.
+
+        The metadata for every group and array in the hierarchy is created in memory,
+        and then written using `zarr.create_hierarchy()`.
+        If *consolidate* is `True`, the consolidated metadata is created from the
+        in-memory metadata, instead of being read back from the store.
+        """
+        nodes: dict[str, NodeMetadata] = {}
+        _add_node_metadata(self, "", nodes)
+        root = nodes.pop("")
+        assert isinstance(root, GroupMetadata)
+        if consolidate:
+            # Mark child groups as having no members outside of the consolidated
+            # metadata, in the same way as zarr.consolidate_metadata()
+            members = {
+                key: (
+                    dataclasses.replace(
+                        node, consolidated_metadata=ConsolidatedMetadata(metadata={})
+                    )
+                    if isinstance(node, GroupMetadata)
+                    else node
+                )
+                for key, node in nodes.items()
+            }
+            ConsolidatedMetadata._flat_to_nested(members)
+            root = dataclasses.replace(
+                root, consolidated_metadata=ConsolidatedMetadata(metadata=members)
+            )
+
+        path = path.strip("/")
+        nodes_to_write: dict[str, NodeMetadata] = {path: root}
+        for key, node in nodes.items():
+            nodes_to_write[f"{path}/{key}" if path else key] = node
+        created = dict(
+            zarr.create_hierarchy(
+                store=store, nodes=nodes_to_write, overwrite=overwrite
+            )
+        )
+        group = created[path]
+        assert isinstance(group, zarr.Group)
+        return group
+
     @property
     @abstractmethod
     def ome_zarr_version(self) -> Literal["0.4", "0.5", "0.6"]:
@@ -42,3 +198,21 @@ class BaseGroup(ABC):
         OME attributes.
         """
         raise NotImplementedError
+
+
+def _add_node_metadata(spec: Any, path: str, nodes: dict[str, NodeMetadata]) -> None:
+    """
+    Add the Zarr metadata for a group or array spec (and all of its members)
+    to *nodes*, keyed by path.
+    """
+    if hasattr(spec, "members"):
+        # Group. Attributes are dumped to JSON types, so consolidated metadata
+        # created from them is the same as consolidated metadata read from the store
+        attributes = spec.model_dump(mode="json", exclude={"members"})["attributes"]
+        nodes[path] = GroupMetadata(attributes=attributes, zarr_format=spec.zarr_format)
+        for name, member in (spec.members or {}).items():
+            _add_node_metadata(member, f"{path}/{name}" if path else name, nodes)
+    elif spec.zarr_format == 2:
+        nodes[path] = ArrayV2Metadata.from_dict(spec.model_dump())
+    else:
+        nodes[path] = ArrayV3Metadata.from_dict(spec.model_dump())
@@ -0,0 +1,290 @@
+"""
+A process-wide cache of OME-Zarr group models.
+
+When the cache is enabled, calling `from_zarr()` on any group class (or opening
+a group with [ome_zarr_models.open_ome_zarr][]) returns a previously loaded
+model if the same group has already been loaded and has not changed since.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import threading
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Concatenate, NamedTuple, ParamSpec, TypeVar
+
+from zarr.core.buffer import default_buffer_prototype
+from zarr.core.common import ZARR_JSON, ZARRAY_JSON, ZATTRS_JSON, ZGROUP_JSON
+from zarr.core.sync import sync
+
+from ome_zarr_models._utils import LRUCache
+from ome_zarr_models.common.instrumentation import uninstrumented_store
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterator
+
+    import zarr
+    from zarr.abc.store import Store
+    from zarr.core.buffer import Buffer
+    from zarr.storage import StorePath
+
+
+__all__ = [
+    "CacheInfo",
+    "ModelCache",
+    "disable_model_cache",
+    "enable_model_cache",
+    "get_model_cache",
+]
+
+M = TypeVar("M")
+P = ParamSpec("P")
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics for a [ModelCache][ome_zarr_models.common.cache.ModelCache].
+    """
+
+    hits: int
+    """Number of loads that returned a cached model."""
+    misses: int
+    """Number of loads that had to read the group from its store."""
+    maxsize: int
+    """Maximum number of models held in the cache."""
+    currsize: int
+    """Number of models currently held in the cache."""
+
+
+def _store_key(store: Store) -> Hashable:
+    """
+    Get a key that identifies a store.
+
+    Different store instances that point at the same data
+    (e.g., read-only copies of the same store) have the same key.
+    """
+    store = uninstrumented_store(store)
+    return (type(store), str(store))
+
+
+def _node_paths(model: Any, path: str = "") -> Iterator[tuple[str, bool]]:
+    """
+    Get the path of a group model, and of every array and group within it.
+
+    Yields
+    ------
+    path :
+        Path relative to the group that *model* was loaded from.
+    is_array :
+        Whether the node at *path* is an array.
+    """
+    members = getattr(model, "members", None)
+    yield path, not hasattr(model, "members")
+    for name, member in (members or {}).items():
+        yield from _node_paths(member, f"{path}/{name}" if path else name)
+
+
+def _metadata_keys(group: zarr.Group, model: Any) -> list[str]:
+    """
+    Get the keys of the metadata documents of every node in a model,
+    relative to the group that the model was loaded from.
+    """
+    keys: list[str] = []
+    for path, is_array in _node_paths(model):
+        if group.metadata.zarr_format == 3:
+            fnames = [ZARR_JSON]
+        else:
+            fnames = [ZARRAY_JSON if is_array else ZGROUP_JSON, ZATTRS_JSON]
+        keys.extend(f"{path}/{fname}" if path else fname for fname in fnames)
+    return keys
+
+
+async def _read_metadata(store_path: StorePath, keys: list[str]) -> list[Buffer | None]:
+    """
+    Read several metadata documents concurrently.
+    """
+    prototype = default_buffer_prototype()
+    return await asyncio.gather(
+        *((store_path / key).get(prototype=prototype) for key in keys)
+    )
+
+
+def _freshness_token(group: zarr.Group, model: Any) -> Hashable:
+    """
+    Get a token that changes if the metadata of a group, or of any of the arrays
+    and groups in a model loaded from it, changes.
+
+    This is a hash of the metadata documents of the group and of every array and
+    group in *model*, which are all read from the store concurrently.
+    """
+    buffers = sync(_read_metadata(group.store_path, _metadata_keys(group, model)))
+    digest = hashlib.sha1(usedforsecurity=False)
+    for buffer in buffers:
+        data = b"" if buffer is None else buffer.to_bytes()
+        # Include the length, so missing and empty documents give different hashes
+        digest.update(f"{-1 if buffer is None else len(data)}:".encode())
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class ModelCache:
+    """
+    A cache of validated OME-Zarr group models.
+
+    Models are keyed by the group class, the store and the path of the group
+    within the store.
+    When the cache is full the least recently used model is removed.
+
+    Notes
+    -----
+    Every time a cached model is looked up, the metadata documents of the group
+    and of every array and group in the model are read from the store
+    (concurrently), and the model is re-loaded if any of them has changed.
+    This is one read for each node in the model, but no listing of the store
+    and no validation.
+
+    Groups and arrays that are not members of the cached model (e.g., new
+    arrays, or the wells of an HCS plate that was loaded with `lazy=True`)
+    are not checked. Call `clear()` to make sure changes to them are picked up.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._models: LRUCache[Hashable, tuple[Hashable, Any]] = LRUCache(
+            maxsize=maxsize
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, token: Callable[[Any], Hashable]) -> Any | None:
+        """
+        Get a model from the cache, or `None` if it is not present or is stale.
+
+        Parameters
+        ----------
+        key :
+            Key of the model.
+        token :
+            Function that gets the current freshness token of the cached model.
+            The model is stale if this is different to the token that the model
+            was put in the cache with.
+        """
+        cached = self._models.get(key)
+        is_fresh = cached is not None and token(cached[1]) == cached[0]
+        with self._lock:
+            if cached is not None and is_fresh:
+                self._hits += 1
+                return cached[1]
+            self._misses += 1
+            return None
+
+    def put(self, key: Hashable, token: Hashable, model: Any) -> None:
+        """
+        Put a model in the cache.
+        """
+        self._models.put(key, (token, model))
+
+    def info(self) -> CacheInfo:
+        """
+        Get statistics for this cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._models.maxsize,
+                currsize=len(self._models),
+            )
+
+    def clear(self) -> None:
+        """
+        Remove all models from the cache, and reset the hit and miss counters.
+        """
+        self._models.clear()
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+
+_model_cache: ModelCache | None = None
+# Keys of the groups that are currently being loaded in this context, used to
+# avoid caching a model more than once when from_zarr() calls super().from_zarr()
+_loading: ContextVar[frozenset[Hashable]] = ContextVar("_loading", default=frozenset())
+
+
+def enable_model_cache(maxsize: int = 128) -> ModelCache:
+    """
+    Enable the process-wide model cache.
+
+    Parameters
+    ----------
+    maxsize :
+        Maximum number of models to keep in the cache.
+
+    Returns
+    -------
+    ModelCache
+        The new cache.
+    """
+    global _model_cache
+    _model_cache = ModelCache(maxsize=maxsize)
+    return _model_cache
+
+
+def disable_model_cache() -> None:
+    """
+    Disable the process-wide model cache, and remove all models from it.
+    """
+    global _model_cache
+    _model_cache = None
+
+
+def get_model_cache() -> ModelCache | None:
+    """
+    Get the process-wide model cache, or `None` if it is not enabled.
+    """
+    return _model_cache
+
+
+def cached_from_zarr(
+    func: Callable[Concatenate[type[M], zarr.Group, P], M],
+) -> Callable[Concatenate[type[M], zarr.Group, P], M]:
+    """
+    Decorate a `from_zarr()` class method to use the process-wide model cache.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(
+        cls: type[M], group: zarr.Group, /, *args: P.args, **kwargs: P.kwargs
+    ) -> M:
+        cache = _model_cache
+        if cache is None:
+            return func(cls, group, *args, **kwargs)
+
+        group_key = (cls, _store_key(group.store), group.path)
+        loading = _loading.get()
+        if group_key in loading:
+            return func(cls, group, *args, **kwargs)
+
+        # Include default values of any options, so calls with and without
+        # the default values given explicitly use the same cache entry
+        options = signature.bind(cls, group, *args, **kwargs)
+        options.apply_defaults()
+        key = (*group_key, tuple(options.arguments.items())[2:])
+        model = cache.get(key, lambda cached: _freshness_token(group, cached))
+        if model is not None:
+            return model  # type: ignore[no-any-return]
+
+        reset = _loading.set(loading | {group_key})
+        try:
+            model = func(cls, group, *args, **kwargs)
+        finally:
+            _loading.reset(reset)
+        cache.put(key, _freshness_token(group, model), model)
+        return model
+
+    return wrapper
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal, Self
 
+import numpy as np
 from pydantic import Field
 
 from ome_zarr_models.base import BaseAttrs
@@ -9,11 +10,14 @@ from ome_zarr_models.base import BaseAttrs
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
 
+    import numpy.typing as npt
+
 __all__ = [
     "Identity",
     "PathScale",
     "PathTranslation",
     "ScaleTransform",
+    "ScaleTranslation",
     "TranslationTransform",
     "VectorScale",
     "VectorTransform",
@@ -127,3 +131,269 @@ def _build_transforms(
     else:
         vec_trans = VectorTranslation.build(translation)
         return vec_scale, vec_trans
+
+
+class ScaleTranslation:
+    """
+    A scale followed by a translation, that can be applied to arrays of points.
+
+    This is the general form of any sequence of scale and translation
+    transformations, so can represent the mapping from the array index space
+    of a multiscale dataset to physical space.
+
+    Points are transformed with NumPy, so many points can be transformed
+    at once without any Python loops.
+
+    Parameters
+    ----------
+    scale :
+        Scale factor for each dimension.
+    translation :
+        Translation for each dimension. Defaults to no translation.
+    """
+
+    def __init__(
+        self, scale: npt.ArrayLike, translation: npt.ArrayLike | None = None
+    ) -> None:
+        scale_array = np.array(scale, dtype=np.float64)
+        if translation is None:
+            translation_array = np.zeros_like(scale_array)
+        else:
+            translation_array = np.array(translation, dtype=np.float64)
+        if scale_array.ndim != 1 or scale_array.shape != translation_array.shape:
+            raise ValueError(
+                "scale and translation must be 1D with the same length. "
+                f"Got shapes {scale_array.shape} and {translation_array.shape}."
+            )
+        scale_array.flags.writeable = False
+        translation_array.flags.writeable = False
+        self._scale = scale_array
+        self._translation = translation_array
+
+    @classmethod
+    def identity(cls, ndim: int) -> Self:
+        """
+        Create a transform that leaves points unchanged.
+        """
+        return cls(np.ones(ndim))
+
+    @classmethod
+    def from_transforms(cls, transforms: Iterable[Transform]) -> Self:
+        """
+        Combine a sequence of transformations into a single transform.
+
+        The transformations are applied in the order given.
+
+        Raises
+        ------
+        ValueError
+            If there are no transformations, if any of the transformations are
+            defined by a path instead of values, or if the transformations
+            have different dimensionalities.
+        """
+        scale: npt.NDArray[np.float64] | None = None
+        translation: npt.NDArray[np.float64] | None = None
+        for transform in transforms:
+            if isinstance(transform, Identity):
+                continue
+            if not isinstance(transform, VectorScale | VectorTranslation):
+                raise ValueError(
+                    f"Can't combine {transform.type} transformations that are "
+                    f"defined by a path: {transform}"
+                )
+            if scale is None or translation is None:
+                scale = np.ones(transform.ndim)
+                translation = np.zeros(transform.ndim)
+            elif transform.ndim != len(scale):
+                raise ValueError(
+                    "The transforms have inconsistent dimensionality. "
+                    f"Got {transform.type} transform with dimensionality "
+                    f"{transform.ndim}, expected {len(scale)}."
+                )
+            if isinstance(transform, VectorScale):
+                scale = scale * transform.scale
+                translation = translation * transform.scale
+            else:
+                translation = translation + transform.translation
+
+        if scale is None:
+            raise ValueError("At least one scale or translation transform is needed.")
+        return cls(scale, translation)
+
+    @property
+    def scale(self) -> npt.NDArray[np.float64]:
+        """
+        Scale factor for each dimension (read-only).
+        """
+        return self._scale
+
+    @property
+    def translation(self) -> npt.NDArray[np.float64]:
+        """
+        Translation for each dimension (read-only).
+        """
+        return self._translation
+
+    @property
+    def ndim(self) -> int:
+        """
+        Number of dimensions.
+        """
+        return len(self._scale)
+
+    def __repr__(self) -> str:
+        """
+        String representation of this transform.
+        """
+        return (
+            f"{type(self).__name__}(scale={self._scale.tolist()}, "
+            f"translation={self._translation.tolist()})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Check if two transforms have the same scale and translation.
+        """
+        if not isinstance(other, ScaleTranslation):
+            return NotImplemented
+        return np.array_equal(self._scale, other._scale) and np.array_equal(
+            self._translation, other._translation
+        )
+
+    def __hash__(self) -> int:
+        """
+        Hash of the scale and translation.
+        """
+        return hash((self._scale.tobytes(), self._translation.tobytes()))
+
+    def then(self, other: ScaleTranslation) -> ScaleTranslation:
+        """
+        Combine this transform with another transform that is applied after it.
+        """
+        self._check_ndim(other.ndim, "transform")
+        return ScaleTranslation(
+            self._scale * other._scale,
+            self._translation * other._scale + other._translation,
+        )
+
+    def inverse(self) -> ScaleTranslation:
+        """
+        Get the inverse of this transform.
+
+        Raises
+        ------
+        ValueError
+            If any of the scale factors are zero.
+        """
+        if np.any(self._scale == 0):
+            raise ValueError(
+                f"Can't invert a transform with a zero scale factor: {self}"
+            )
+        return ScaleTranslation(1 / self._scale, -self._translation / self._scale)
+
+    def to_affine(self) -> npt.NDArray[np.float64]:
+        """
+        Get the affine matrix for this transform.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array with shape `(ndim + 1, ndim + 1)`, that transforms points
+            in homogeneous coordinates.
+        """
+        affine = np.diag(np.append(self._scale, 1))
+        affine[:-1, -1] = self._translation
+        return affine
+
+    def apply(
+        self, points: npt.ArrayLike, *, out: npt.NDArray[np.float64] | None = None
+    ) -> npt.NDArray[np.float64]:
+        """
+        Transform points.
+
+        Parameters
+        ----------
+        points :
+            Array of points, with shape `(..., ndim)`. For example, `N` points
+            have shape `(N, ndim)`.
+        out :
+            Array to store the transformed points in. If not given, a new array
+            is created. This can be the same array as *points* to transform
+            the points in place.
+
+        Returns
+        -------
+        numpy.ndarray
+            Transformed points, with the same shape as *points*.
+        """
+        points = np.asarray(points)
+        self._check_ndim(points.shape[-1] if points.ndim else 0, "points")
+        if out is None:
+            return points * self._scale + self._translation
+        np.multiply(points, self._scale, out=out)
+        np.add(out, self._translation, out=out)
+        return out
+
+    def apply_inverse(
+        self, points: npt.ArrayLike, *, out: npt.NDArray[np.float64] | None = None
+    ) -> npt.NDArray[np.float64]:
+        """
+        Transform points with the inverse of this transform.
+
+        Parameters
+        ----------
+        points :
+            Array of points, with shape `(..., ndim)`.
+        out :
+            Array to store the transformed points in. If not given, a new array
+            is created.
+
+        Returns
+        -------
+        numpy.ndarray
+            Transformed points, with the same shape as *points*.
+        """
+        points = np.asarray(points)
+        self._check_ndim(points.shape[-1] if points.ndim else 0, "points")
+        if out is None:
+            return (points - self._translation) / self._scale
+        np.subtract(points, self._translation, out=out)
+        np.divide(out, self._scale, out=out)
+        return out
+
+    def apply_to_bounding_boxes(
+        self, boxes: npt.ArrayLike, *, inverse: bool = False
+    ) -> npt.NDArray[np.float64]:
+        """
+        Transform bounding boxes.
+
+        Parameters
+        ----------
+        boxes :
+            Array of bounding boxes, with shape `(..., 2, ndim)`.
+            `boxes[..., 0, :]` is the minimum corner of each box,
+            and `boxes[..., 1, :]` is the maximum corner.
+        inverse :
+            If `True`, transform with the inverse of this transform.
+
+        Returns
+        -------
+        numpy.ndarray
+            Transformed bounding boxes, with the same shape as *boxes*.
+            The first corner of each box is still the minimum corner,
+            even if some of the scale factors are negative.
+        """
+        boxes = np.asarray(boxes)
+        if boxes.ndim < 2 or boxes.shape[-2] != 2:
+            raise ValueError(
+                f"Bounding boxes must have shape (..., 2, ndim). Got {boxes.shape}."
+            )
+        corners = self.apply_inverse(boxes) if inverse else self.apply(boxes)
+        return np.sort(corners, axis=-2)
+
+    def _check_ndim(self, ndim: int, name: str) -> None:
+        if ndim != self.ndim:
+            raise ValueError(
+                f"Dimensionality of {name} ({ndim}) does not match "
+                f"dimensionality of transform ({self.ndim})."
+            )
@@ -0,0 +1,290 @@
+"""
+Validation of whole high-content screening (HCS) plates.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+import zarr
+import zarr.errors
+from zarr.storage import StorePath
+
+from ome_zarr_models.common.well import WellGroupNotFoundError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import ome_zarr_models.v04.hcs
+    import ome_zarr_models.v04.image
+    import ome_zarr_models.v04.well
+    import ome_zarr_models.v05.hcs
+    import ome_zarr_models.v05.image
+    import ome_zarr_models.v05.well
+    from ome_zarr_models.common.well_types import WellImage
+
+    HCS = ome_zarr_models.v04.hcs.HCS | ome_zarr_models.v05.hcs.HCS
+    Image = ome_zarr_models.v04.image.Image | ome_zarr_models.v05.image.Image
+    Well = ome_zarr_models.v04.well.Well | ome_zarr_models.v05.well.Well
+
+    # Where to read a group from. Either the path to the group in a Zarr store,
+    # or the JSON of a group model that is already in memory.
+    GroupSource = StorePath | dict[str, Any]
+
+
+__all__ = ["WellValidationResult", "validate_plate"]
+
+
+@dataclass(frozen=True)
+class WellValidationResult:
+    """
+    The result of validating a single well group, and the images within it.
+    """
+
+    index: int
+    """Index of the well in the plate metadata."""
+    path: str
+    """Path to the well group."""
+    found: bool = True
+    """Whether a well Zarr group exists at the well path."""
+    error: str | None = None
+    """Error message from validating the well group, if it is not valid."""
+    image_errors: dict[str, str] = field(default_factory=dict)
+    """Error messages from validating each image that is not valid, keyed by path."""
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        `True` if the well group and all of the images within it are valid.
+
+        Wells that don't have a Zarr group are valid.
+        """
+        return self.error is None and len(self.image_errors) == 0
+
+
+def _check_well_acquisitions(
+    acquisition_ids: Sequence[int], well_i: int, images: Sequence[WellImage]
+) -> None:
+    """
+    Check the acquisition IDs of a well's images are in a list of plate
+    acquisition IDs.
+    """
+    for image_i, well_image in enumerate(images):
+        if well_image.acquisition is None:
+            continue
+        elif well_image.acquisition not in acquisition_ids:
+            msg = (
+                f"Acquisition ID '{well_image.acquisition} "
+                f"(found in well {well_i}, {image_i}) "
+                f"is not in list of plate acquisitions: {list(acquisition_ids)}"
+            )
+            raise ValueError(msg)
+
+
+def _member_json(group_json: dict[str, Any], path: str) -> dict[str, Any]:
+    """
+    Get the JSON of a member of a group from the JSON of the group.
+    """
+    node_json = group_json
+    for part in path.split("/"):
+        members = node_json.get("members") or {}
+        if part not in members:
+            raise WellGroupNotFoundError(f"No Zarr group found at path '{path}'")
+        node_json = members[part]
+    return node_json
+
+
+def _validate_well(
+    well_cls: type[Well],
+    i: int,
+    path: str,
+    source: GroupSource,
+    *,
+    acquisition_ids: list[int] | None,
+) -> tuple[WellValidationResult, dict[str, Any] | None, list[str]]:
+    """
+    Validate a single well group.
+
+    This only takes and returns picklable objects,
+    so it can be run in another process.
+
+    Returns
+    -------
+    result :
+        Result of validating the well group,
+        without the results of validating its images.
+    well_json :
+        JSON of the well group, if it is valid.
+    image_paths :
+        Paths to the images in the well group, if it is valid.
+    """
+    try:
+        if isinstance(source, StorePath):
+            try:
+                group = zarr.open_group(source, mode="r")
+            except (zarr.errors.GroupNotFoundError, FileNotFoundError) as e:
+                raise WellGroupNotFoundError(
+                    f"No Zarr group found at well path '{path}'"
+                ) from e
+            well = well_cls.from_zarr(group)
+        else:
+            well = well_cls.model_validate(source)
+        images = well.ome_attributes.well.images
+        if acquisition_ids is not None:
+            _check_well_acquisitions(acquisition_ids, i, images)
+    except WellGroupNotFoundError:
+        return WellValidationResult(index=i, path=path, found=False), None, []
+    except Exception as e:
+        return WellValidationResult(index=i, path=path, error=str(e)), None, []
+    return (
+        WellValidationResult(index=i, path=path),
+        well.model_dump(),
+        [image.path for image in images],
+    )
+
+
+def _validate_image(
+    image_cls: type[Image], well_json: dict[str, Any], path: str
+) -> str | None:
+    """
+    Validate a single image group within a well group.
+
+    This only takes and returns picklable objects,
+    so it can be run in another process.
+
+    Returns
+    -------
+    str | None
+        Error message from validating the image group, if it is not valid.
+    """
+    try:
+        image_cls.model_validate(_member_json(well_json, path))
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def _group_classes(hcs: HCS) -> tuple[type[Well], type[Image]]:
+    """
+    Get the well and image group classes for the OME-Zarr version of a plate.
+    """
+    if hcs.ome_zarr_version == "0.4":
+        from ome_zarr_models.v04.image import Image as Imagev04
+        from ome_zarr_models.v04.well import Well as Wellv04
+
+        return Wellv04, Imagev04
+    else:
+        from ome_zarr_models.v05.image import Image as Imagev05
+        from ome_zarr_models.v05.well import Well as Wellv05
+
+        return Wellv05, Imagev05
+
+
+def validate_plate(
+    hcs: HCS, *, executor: Executor | None = None
+) -> dict[str, WellValidationResult]:
+    """
+    Validate every well group in a plate, and every image within each well group.
+
+    Validation of each well group, and of each image, is submitted as a separate
+    task to *executor*.
+    Any validation errors are collected and returned, instead of being raised.
+
+    Parameters
+    ----------
+    hcs :
+        HCS plate to validate.
+    executor :
+        Executor to run validation tasks on.
+        If `None`, validation is run serially in a single worker thread.
+        Tasks only take picklable arguments, so process pools can also be used.
+        If *hcs* was loaded with `from_zarr(..., lazy=True)`, each well group is
+        read from the Zarr store by the task that validates it.
+        Well groups are always validated, even if *hcs* was loaded with
+        `from_zarr(..., trusted=True)`.
+
+    Returns
+    -------
+    dict[str, WellValidationResult]
+        A validation result for each well, keyed by well path.
+        Wells are in the same order as the plate metadata.
+
+    Raises
+    ------
+    Exception
+        Any error raised by *executor* when running a task
+        (e.g., a `pickle.PicklingError` if the store cannot be pickled).
+    """
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=1) as serial_executor:
+            return validate_plate(hcs, executor=serial_executor)
+
+    well_cls, image_cls = _group_classes(hcs)
+    plate = hcs.ome_attributes.plate
+    wells = plate.wells
+    zarr_group = hcs._zarr_group
+    if zarr_group is None:
+        # Well groups have already been validated against the plate acquisitions
+        acquisition_ids = None
+        hcs_json = hcs.model_dump()
+    elif plate.acquisitions is None:
+        acquisition_ids = None
+    else:
+        acquisition_ids = [acquisition.id for acquisition in plate.acquisitions]
+
+    results: dict[int, WellValidationResult] = {}
+    well_futures: dict[
+        Future[tuple[WellValidationResult, dict[str, Any] | None, list[str]]], int
+    ] = {}
+    for i, well in enumerate(wells):
+        source: GroupSource
+        if zarr_group is not None:
+            source = zarr_group.store_path / well.path
+        else:
+            try:
+                source = _member_json(hcs_json, well.path)
+            except WellGroupNotFoundError:
+                results[i] = WellValidationResult(index=i, path=well.path, found=False)
+                continue
+        well_future = executor.submit(
+            _validate_well,
+            well_cls,
+            i,
+            well.path,
+            source,
+            acquisition_ids=acquisition_ids,
+        )
+        well_futures[well_future] = i
+
+    image_futures: dict[Future[str | None], tuple[int, int, str]] = {}
+    for well_future in as_completed(well_futures):
+        # Errors from validating the well group are returned, so any error raised
+        # here is from the executor
+        result, well_json, image_paths = well_future.result()
+        i = well_futures[well_future]
+        results[i] = result
+        for image_i, image_path in enumerate(image_paths):
+            assert well_json is not None
+            image_future = executor.submit(
+                _validate_image, image_cls, well_json, image_path
+            )
+            image_futures[image_future] = (i, image_i, image_path)
+
+    image_errors: dict[int, dict[tuple[int, str], str]] = defaultdict(dict)
+    for image_future in as_completed(image_futures):
+        i, image_i, image_path = image_futures[image_future]
+        if (error := image_future.result()) is not None:
+            image_errors[i][image_i, image_path] = error
+
+    for i, errors in image_errors.items():
+        results[i] = replace(
+            results[i],
+            image_errors={
+                image_path: error for (_, image_path), error in sorted(errors.items())
+            },
+        )
+
+    return {results[i].path: results[i] for i in range(len(wells))}
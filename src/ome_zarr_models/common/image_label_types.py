@@ -81,7 +81,9 @@ class LabelBase(BaseAttrs):
         return self
 
     @field_validator("colors", mode="after")
-    def _parse_colors(cls, colors: tuple[Color, ...]) -> tuple[Color, ...]:
+    def _parse_colors(
+        cls, colors: tuple[Color, ...] | None
+    ) -> tuple[Color, ...] | None:
         """
         Check that color label values are unique.
         """
@@ -91,6 +93,8 @@ class LabelBase(BaseAttrs):
         #        "label descriptors."
         #    )
         #    warnings.warn(msg, stacklevel=1)
+        if colors is None:
+            return colors
         dupes = duplicates(x.label_value for x in colors)
         if len(dupes) > 0:
             msg = (
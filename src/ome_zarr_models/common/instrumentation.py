@@ -0,0 +1,430 @@
+"""
+Instrumentation of the Zarr store operations made when loading OME-Zarr groups.
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypeVar
+
+import zarr
+from zarr.abc.store import Store
+from zarr.core.group import AsyncGroup
+from zarr.storage import StorePath, WrapperStore
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncIterator,
+        Callable,
+        Coroutine,
+        Iterable,
+        Iterator,
+    )
+
+    from zarr.abc.store import ByteRequest
+    from zarr.core.buffer import Buffer, BufferPrototype
+
+
+__all__ = [
+    "LATENCY_BUCKETS",
+    "InstrumentedStore",
+    "OperationStats",
+    "StoreRecording",
+    "instrument",
+]
+
+M = TypeVar("M")
+P = ParamSpec("P")
+
+LATENCY_BUCKETS = (1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+"""
+Upper bounds (in seconds) of the buckets in the latency histograms.
+
+Histograms have one more bucket than this, for operations that take
+longer than the last bound.
+"""
+
+UNKNOWN_LOADER = "unknown"
+"""Loader name for store operations that were not made by a model loader."""
+
+
+@dataclass
+class OperationStats:
+    """
+    Statistics for one type of store operation.
+    """
+
+    count: int = 0
+    """Number of operations."""
+    nbytes: int = 0
+    """Number of bytes read or written."""
+    seconds: float = 0
+    """Total time spent in the operations."""
+    latency_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    """Number of operations in each latency bucket (see `LATENCY_BUCKETS`)."""
+
+    def add(self, *, nbytes: int, seconds: float) -> None:
+        """
+        Add a single operation.
+        """
+        self.count += 1
+        self.nbytes += nbytes
+        self.seconds += seconds
+        self.latency_histogram[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+
+class StoreRecording:
+    """
+    A record of the store operations made while instrumentation was enabled.
+
+    Operations are grouped by the model loader that made them
+    (e.g., `"ome_zarr_models.v05.labels.Labels"`),
+    and then by the type of store operation (e.g., `"get"`).
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[str, dict[str, OperationStats]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, *, loader: str, operation: str, nbytes: int, seconds: float
+    ) -> None:
+        """
+        Record a single store operation.
+        """
+        with self._lock:
+            loader_stats = self._stats.setdefault(loader, {})
+            loader_stats.setdefault(operation, OperationStats()).add(
+                nbytes=nbytes, seconds=seconds
+            )
+
+    @property
+    def loaders(self) -> list[str]:
+        """
+        Names of all the loaders that made store operations.
+        """
+        with self._lock:
+            return list(self._stats)
+
+    def _matching_stats(
+        self, operation: str | None, loader: str | None
+    ) -> list[OperationStats]:
+        with self._lock:
+            return [
+                stats
+                for loader_name, loader_stats in self._stats.items()
+                if loader is None or loader_name == loader
+                for operation_name, stats in loader_stats.items()
+                if operation is None or operation_name == operation
+            ]
+
+    def count(self, operation: str | None = None, *, loader: str | None = None) -> int:
+        """
+        Number of store operations.
+
+        Parameters
+        ----------
+        operation :
+            Type of store operation to count. If `None`, count all operations.
+        loader :
+            Name of the loader to count operations for.
+            If `None`, count operations from all loaders.
+        """
+        return sum(stats.count for stats in self._matching_stats(operation, loader))
+
+    def nbytes(self, operation: str | None = None, *, loader: str | None = None) -> int:
+        """
+        Number of bytes read or written by store operations.
+
+        Parameters
+        ----------
+        operation :
+            Type of store operation to count bytes for.
+            If `None`, count bytes for all operations.
+        loader :
+            Name of the loader to count bytes for.
+            If `None`, count bytes for all loaders.
+        """
+        return sum(stats.nbytes for stats in self._matching_stats(operation, loader))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Export this recording as a dictionary.
+        """
+        with self._lock:
+            return {
+                "latency_buckets": list(LATENCY_BUCKETS),
+                "loaders": {
+                    loader: {
+                        operation: {
+                            "count": stats.count,
+                            "nbytes": stats.nbytes,
+                            "seconds": stats.seconds,
+                            "latency_histogram": list(stats.latency_histogram),
+                        }
+                        for operation, stats in loader_stats.items()
+                    }
+                    for loader, loader_stats in self._stats.items()
+                },
+            }
+
+    def to_json(self, **kwargs: Any) -> str:
+        """
+        Export this recording as a JSON string.
+
+        Parameters
+        ----------
+        **kwargs :
+            Passed to `json.dumps()`.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+# Recordings of all the instrument() blocks that are active in this context
+_recordings: ContextVar[tuple[StoreRecording, ...]] = ContextVar(
+    "_recordings", default=()
+)
+
+
+@contextmanager
+def instrument() -> Iterator[StoreRecording]:
+    """
+    Record the store operations made when loading OME-Zarr groups.
+
+    Within this context, every call to `from_zarr()` on an OME-Zarr group class
+    (or to [ome_zarr_models.open_ome_zarr][]) makes its store operations through an
+    [InstrumentedStore][ome_zarr_models.common.instrumentation.InstrumentedStore],
+    and the operations are recorded against the class that made them.
+    Operations made through a store that has been wrapped in an
+    [InstrumentedStore][ome_zarr_models.common.instrumentation.InstrumentedStore]
+    outside of a `from_zarr()` call are also recorded.
+
+    Only operations made in the same thread (or asyncio task) as this context
+    are recorded, so operations made by other threads at the same time
+    are not included.
+    If this context is nested inside another `instrument()` context, operations
+    are recorded in both recordings.
+
+    Yields
+    ------
+    StoreRecording
+        Recording of the store operations.
+    """
+    recording = StoreRecording()
+    token = _recordings.set((*_recordings.get(), recording))
+    try:
+        yield recording
+    finally:
+        _recordings.reset(token)
+
+
+class InstrumentedStore(WrapperStore[Store]):
+    """
+    A store that records the operations made on another store.
+
+    Operations are only recorded within the
+    [instrument][ome_zarr_models.common.instrumentation.instrument] context manager.
+
+    Parameters
+    ----------
+    store :
+        Store to wrap.
+    loader :
+        Name of the model loader to record operations against.
+    """
+
+    def __init__(self, store: Store, *, loader: str = UNKNOWN_LOADER) -> None:
+        super().__init__(store)
+        self.loader = loader
+
+    def _with_store(self, store: Store) -> InstrumentedStore:
+        return type(self)(store, loader=self.loader)
+
+    def __str__(self) -> str:
+        """
+        Same as the wrapped store, so a store is identified in the same way
+        with or without instrumentation.
+        """
+        return str(self._store)
+
+    def _record(self, operation: str, *, nbytes: int, start: float) -> None:
+        seconds = time.perf_counter() - start
+        for recording in _recordings.get():
+            recording.record(
+                loader=self.loader,
+                operation=operation,
+                nbytes=nbytes,
+                seconds=seconds,
+            )
+
+    async def get(
+        self,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: ByteRequest | None = None,
+    ) -> Buffer | None:
+        """
+        Get a value from the wrapped store, and record the operation.
+        """
+        start = time.perf_counter()
+        value = await self._store.get(key, prototype, byte_range)
+        self._record("get", nbytes=0 if value is None else len(value), start=start)
+        return value
+
+    async def get_partial_values(
+        self,
+        prototype: BufferPrototype,
+        key_ranges: Iterable[tuple[str, ByteRequest | None]],
+    ) -> list[Buffer | None]:
+        """
+        Get partial values from the wrapped store, and record the operation.
+        """
+        start = time.perf_counter()
+        values = await self._store.get_partial_values(prototype, key_ranges)
+        nbytes = sum(len(value) for value in values if value is not None)
+        self._record("get_partial_values", nbytes=nbytes, start=start)
+        return values
+
+    async def exists(self, key: str) -> bool:
+        """
+        Check if a key exists in the wrapped store, and record the operation.
+        """
+        start = time.perf_counter()
+        exists = await self._store.exists(key)
+        self._record("exists", nbytes=0, start=start)
+        return exists
+
+    async def set(self, key: str, value: Buffer) -> None:
+        """
+        Set a value in the wrapped store, and record the operation.
+        """
+        start = time.perf_counter()
+        await self._store.set(key, value)
+        self._record("set", nbytes=len(value), start=start)
+
+    async def set_if_not_exists(self, key: str, value: Buffer) -> None:
+        """
+        Set a value in the wrapped store if it isn't already set,
+        and record the operation.
+        """
+        start = time.perf_counter()
+        await self._store.set_if_not_exists(key, value)
+        self._record("set_if_not_exists", nbytes=len(value), start=start)
+
+    async def delete(self, key: str) -> None:
+        """
+        Delete a key from the wrapped store, and record the operation.
+        """
+        start = time.perf_counter()
+        await self._store.delete(key)
+        self._record("delete", nbytes=0, start=start)
+
+    async def _record_listing(
+        self, operation: str, keys: AsyncIterator[str]
+    ) -> AsyncIterator[str]:
+        start = time.perf_counter()
+        async for key in keys:
+            yield key
+        self._record(operation, nbytes=0, start=start)
+
+    def list(self) -> AsyncIterator[str]:
+        """
+        List all keys in the wrapped store, and record the operation.
+        """
+        return self._record_listing("list", self._store.list())
+
+    def list_prefix(self, prefix: str) -> AsyncIterator[str]:
+        """
+        List keys with a given prefix in the wrapped store, and record the operation.
+        """
+        return self._record_listing("list_prefix", self._store.list_prefix(prefix))
+
+    def list_dir(self, prefix: str) -> AsyncIterator[str]:
+        """
+        List keys in a directory of the wrapped store, and record the operation.
+        """
+        return self._record_listing("list_dir", self._store.list_dir(prefix))
+
+
+def uninstrumented_store(store: Store) -> Store:
+    """
+    Get the store wrapped by an `InstrumentedStore`, or *store* if it isn't wrapped.
+    """
+    if isinstance(store, InstrumentedStore):
+        return store._store
+    return store
+
+
+def uninstrumented_group(group: zarr.Group) -> zarr.Group:
+    """
+    Get a group that reads from the store wrapped by an `InstrumentedStore`,
+    or *group* if its store isn't wrapped.
+    """
+    if not isinstance(group.store, InstrumentedStore):
+        return group
+    return zarr.Group(
+        AsyncGroup(
+            metadata=group.metadata,
+            store_path=StorePath(uninstrumented_store(group.store), group.path),
+        )
+    )
+
+
+def _instrumented_group(cls: type[Any], group: zarr.Group) -> zarr.Group:
+    """
+    Get a group that records store operations against the loader *cls*.
+    """
+    loader = f"{cls.__module__}.{cls.__qualname__}"
+    store = group.store
+    if isinstance(store, InstrumentedStore) and store.loader == loader:
+        return group
+    store = InstrumentedStore(uninstrumented_store(store), loader=loader)
+    return zarr.Group(
+        AsyncGroup(metadata=group.metadata, store_path=StorePath(store, group.path))
+    )
+
+
+def instrumented_from_zarr(
+    func: Callable[Concatenate[type[M], zarr.Group, P], M],
+) -> Callable[Concatenate[type[M], zarr.Group, P], M]:
+    """
+    Decorate a `from_zarr()` class method to record the store operations it makes.
+    """
+
+    @functools.wraps(func)
+    def wrapper(
+        cls: type[M], group: zarr.Group, /, *args: P.args, **kwargs: P.kwargs
+    ) -> M:
+        if not _recordings.get():
+            return func(cls, group, *args, **kwargs)
+        return func(cls, _instrumented_group(cls, group), *args, **kwargs)
+
+    return wrapper
+
+
+def instrumented_from_zarr_async(
+    func: Callable[Concatenate[type[M], zarr.Group, P], Coroutine[Any, Any, M]],
+) -> Callable[Concatenate[type[M], zarr.Group, P], Coroutine[Any, Any, M]]:
+    """
+    Decorate a `from_zarr_async()` class method to record the store operations
+    it makes.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(
+        cls: type[M], group: zarr.Group, /, *args: P.args, **kwargs: P.kwargs
+    ) -> M:
+        if not _recordings.get():
+            return await func(cls, group, *args, **kwargs)
+        return await func(cls, _instrumented_group(cls, group), *args, **kwargs)
+
+    return wrapper
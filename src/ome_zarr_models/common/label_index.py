@@ -0,0 +1,335 @@
+"""
+Statistics for each label value in label image data.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import zarr
+import zarr.errors
+
+from ome_zarr_models._utils import chunk_regions, run_tasks
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+
+__all__ = [
+    "LABEL_INDEX_PATH",
+    "LabelIndex",
+    "compute_label_index",
+    "read_label_index",
+    "write_label_index",
+]
+
+LABEL_INDEX_PATH = "label_index"
+"""Path of the label index array, relative to the image label group."""
+
+# Label values are saved as int64, so larger (uint64) values can't be saved
+_MAX_LABEL_VALUE = np.iinfo(np.int64).max
+
+# Number of partial results from chunks that are collected before they are
+# merged, to limit memory use
+_MERGE_BATCH_SIZE = 256
+
+
+@dataclass(frozen=True, eq=False)
+class LabelIndex:
+    """
+    Statistics for each label value that is present in label image data.
+
+    All statistics are in array index coordinates of the full resolution level.
+    Label values are sorted in ascending order, and the i-th row of each of the
+    other attributes is for the i-th label value.
+    """
+
+    label_values: npt.NDArray[np.int64]
+    """Label values that are present in the data, shape `(n_labels,)`."""
+    counts: npt.NDArray[np.int64]
+    """Number of voxels with each label value, shape `(n_labels,)`."""
+    bbox_min: npt.NDArray[np.int64]
+    """Inclusive lower corner of the bounding box, shape `(n_labels, ndim)`."""
+    bbox_max: npt.NDArray[np.int64]
+    """Exclusive upper corner of the bounding box, shape `(n_labels, ndim)`."""
+    coordinate_sums: npt.NDArray[np.int64]
+    """Sum of the coordinates of every voxel, shape `(n_labels, ndim)`."""
+
+    @cached_property
+    def _rows(self) -> dict[int, int]:
+        """
+        Mapping from label value to row.
+        """
+        return {int(value): i for i, value in enumerate(self.label_values)}
+
+    def __len__(self) -> int:
+        """
+        Number of label values.
+        """
+        return len(self.label_values)
+
+    def __contains__(self, label_value: object) -> bool:
+        """
+        Whether a label value is present in the data.
+        """
+        return label_value in self._rows
+
+    @property
+    def centroids(self) -> npt.NDArray[np.float64]:
+        """
+        Centroid of each label value, shape `(n_labels, ndim)`.
+        """
+        centroids: npt.NDArray[np.float64] = (
+            self.coordinate_sums / self.counts[:, np.newaxis]
+        )
+        return centroids
+
+    def _row(self, label_value: int) -> int:
+        try:
+            return self._rows[label_value]
+        except KeyError:
+            raise KeyError(f"Label value {label_value} is not in the data.") from None
+
+    def count(self, label_value: int) -> int:
+        """
+        Number of voxels with a label value.
+
+        Raises
+        ------
+        KeyError
+            If the label value is not in the data.
+        """
+        return int(self.counts[self._row(label_value)])
+
+    def bounding_box(self, label_value: int) -> tuple[slice, ...]:
+        """
+        Bounding box of a label value, as a tuple of slices into the data.
+
+        Raises
+        ------
+        KeyError
+            If the label value is not in the data.
+        """
+        row = self._row(label_value)
+        return tuple(
+            slice(int(start), int(stop))
+            for start, stop in zip(self.bbox_min[row], self.bbox_max[row], strict=True)
+        )
+
+    def centroid(self, label_value: int) -> tuple[float, ...]:
+        """
+        Centroid of a label value.
+
+        Raises
+        ------
+        KeyError
+            If the label value is not in the data.
+        """
+        row = self._row(label_value)
+        return tuple(
+            float(total) / float(self.counts[row])
+            for total in self.coordinate_sums[row]
+        )
+
+    def to_array(self) -> npt.NDArray[np.int64]:
+        """
+        Convert to a single array.
+
+        The array has shape `(n_labels, 2 + 3 * ndim)`, and the columns are the
+        label value, the count, the bounding box lower corner, the bounding box
+        upper corner, and the coordinate sums.
+        """
+        return np.column_stack(
+            [
+                self.label_values,
+                self.counts,
+                self.bbox_min,
+                self.bbox_max,
+                self.coordinate_sums,
+            ]
+        ).astype(np.int64)
+
+    @classmethod
+    def from_array(cls, array: npt.NDArray[Any]) -> LabelIndex:
+        """
+        Create from a single array created by `to_array()`.
+        """
+        array = np.asarray(array, dtype=np.int64)
+        if array.ndim != 2 or array.shape[1] < 2 or (array.shape[1] - 2) % 3 != 0:
+            raise ValueError(
+                f"Label index array has shape {array.shape}, which is not a valid "
+                "label index shape."
+            )
+        ndim = (array.shape[1] - 2) // 3
+        return cls(
+            label_values=array[:, 0],
+            counts=array[:, 1],
+            bbox_min=array[:, 2 : 2 + ndim],
+            bbox_max=array[:, 2 + ndim : 2 + 2 * ndim],
+            coordinate_sums=array[:, 2 + 2 * ndim :],
+        )
+
+
+def _merge(partials: list[LabelIndex], ndim: int) -> LabelIndex:
+    """
+    Merge statistics computed for separate regions of the data.
+    """
+    if not partials:
+        empty = np.zeros((0, ndim), dtype=np.int64)
+        return LabelIndex(
+            label_values=np.zeros(0, dtype=np.int64),
+            counts=np.zeros(0, dtype=np.int64),
+            bbox_min=empty,
+            bbox_max=empty,
+            coordinate_sums=empty,
+        )
+    label_values, inverse = np.unique(
+        np.concatenate([p.label_values for p in partials]), return_inverse=True
+    )
+    n_labels = len(label_values)
+    counts = np.zeros(n_labels, dtype=np.int64)
+    np.add.at(counts, inverse, np.concatenate([p.counts for p in partials]))
+    bbox_min = np.full((n_labels, ndim), np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(bbox_min, inverse, np.concatenate([p.bbox_min for p in partials]))
+    bbox_max = np.zeros((n_labels, ndim), dtype=np.int64)
+    np.maximum.at(bbox_max, inverse, np.concatenate([p.bbox_max for p in partials]))
+    coordinate_sums = np.zeros((n_labels, ndim), dtype=np.int64)
+    np.add.at(
+        coordinate_sums,
+        inverse,
+        np.concatenate([p.coordinate_sums for p in partials]),
+    )
+    return LabelIndex(
+        label_values=label_values.astype(np.int64),
+        counts=counts,
+        bbox_min=bbox_min,
+        bbox_max=bbox_max,
+        coordinate_sums=coordinate_sums,
+    )
+
+
+def _region_label_index(
+    array: zarr.Array[Any], region: tuple[slice, ...]
+) -> LabelIndex:
+    """
+    Compute statistics for one region of label data.
+    """
+    data = np.asarray(array[region]).ravel()
+    # Sort voxels by label value, so statistics can be computed for each
+    # label value with reduceat()
+    order = np.argsort(data, kind="stable")
+    sorted_values = data[order]
+    starts = np.flatnonzero(
+        np.concatenate([[True], sorted_values[1:] != sorted_values[:-1]])
+    )
+    if len(data) and sorted_values[-1] > _MAX_LABEL_VALUE:
+        raise ValueError(
+            f"Label value {sorted_values[-1]} is too large to be saved in a label "
+            f"index. Label values must be no larger than {_MAX_LABEL_VALUE}."
+        )
+    label_values = sorted_values[starts].astype(np.int64)
+    counts = np.diff(np.append(starts, len(data))).astype(np.int64)
+
+    shape = tuple(s.stop - s.start for s in region)
+    coordinates = np.unravel_index(order, shape)
+    bbox_min = np.empty((len(starts), len(shape)), dtype=np.int64)
+    bbox_max = np.empty_like(bbox_min)
+    coordinate_sums = np.empty_like(bbox_min)
+    for axis, (coordinate, s) in enumerate(zip(coordinates, region, strict=True)):
+        coordinate = coordinate.astype(np.int64) + s.start
+        bbox_min[:, axis] = np.minimum.reduceat(coordinate, starts)
+        bbox_max[:, axis] = np.maximum.reduceat(coordinate, starts) + 1
+        coordinate_sums[:, axis] = np.add.reduceat(coordinate, starts)
+    return LabelIndex(
+        label_values=label_values,
+        counts=counts,
+        bbox_min=bbox_min,
+        bbox_max=bbox_max,
+        coordinate_sums=coordinate_sums,
+    )
+
+
+def compute_label_index(
+    array: zarr.Array[Any], *, executor: Executor | None = None
+) -> LabelIndex:
+    """
+    Compute statistics for each label value in an array of label data.
+
+    The array is scanned one chunk at a time, and statistics for each chunk
+    are merged together.
+
+    Parameters
+    ----------
+    array :
+        Label data. This is normally the full resolution level of an image label.
+    executor :
+        Executor to scan chunks with.
+        If `None`, chunks are scanned serially in a single worker thread.
+        Arrays in a store that is only held in memory (e.g., a `MemoryStore`)
+        can only be scanned with a `concurrent.futures.ThreadPoolExecutor`.
+
+    Raises
+    ------
+    ValueError
+        If the data type of *array* is not an integer data type, or the data
+        contains a label value larger than the maximum value of an int64.
+    """
+    if not np.issubdtype(array.dtype, np.integer):
+        raise ValueError(
+            f"Data type of labels must be an integer data type. Got {array.dtype}."
+        )
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=1) as serial_executor:
+            return compute_label_index(array, executor=serial_executor)
+
+    partials: list[LabelIndex] = []
+    for partial in run_tasks(
+        executor,
+        _region_label_index,
+        ((array, region) for region in chunk_regions(array)),
+    ):
+        partials.append(partial)
+        if len(partials) >= _MERGE_BATCH_SIZE:
+            partials = [_merge(partials, array.ndim)]
+    return _merge(partials, array.ndim)
+
+
+def write_label_index(
+    group: zarr.Group, label_index: LabelIndex, *, overwrite: bool = True
+) -> zarr.Array[Any]:
+    """
+    Save a label index to an array in an image label group.
+
+    The label index is saved as a single array at `LABEL_INDEX_PATH` within
+    *group*, in the format returned by `LabelIndex.to_array()`.
+    """
+    data = label_index.to_array()
+    array = group.create_array(
+        LABEL_INDEX_PATH,
+        shape=data.shape,
+        dtype=data.dtype,
+        chunks=(max(min(len(data), 2**16), 1), data.shape[1]),
+        dimension_names=(
+            ["label", "statistic"] if group.metadata.zarr_format == 3 else None
+        ),
+        overwrite=overwrite,
+    )
+    array[...] = data
+    return array
+
+
+def read_label_index(group: zarr.Group) -> LabelIndex | None:
+    """
+    Read a label index saved with `write_label_index()` from an image label group.
+
+    Returns `None` if the group does not have a label index.
+    """
+    try:
+        array = zarr.open_array(group.store_path / LABEL_INDEX_PATH, mode="r")
+    except zarr.errors.ArrayNotFoundError:
+        return None
+    return LabelIndex.from_array(np.asarray(array[...]))
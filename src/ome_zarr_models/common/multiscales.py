@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from collections import Counter
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Self
 
+import numpy as np
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     JsonValue,
     SerializerFunctionWrapHandler,
@@ -18,6 +21,7 @@ from ome_zarr_models.base import BaseAttrs
 from ome_zarr_models.common.axes import Axes
 from ome_zarr_models.common.coordinate_transformations import (
     ScaleTransform,
+    ScaleTranslation,
     Transform,
     TranslationTransform,
     VectorScale,
@@ -30,11 +34,82 @@ from ome_zarr_models.common.validation import check_length
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    import numpy.typing as npt
+
 
 __all__ = ["Dataset", "MultiscaleBase"]
 
 VALID_NDIM = (2, 3, 4, 5)
 ValidTransform = tuple[ScaleTransform] | tuple[ScaleTransform, TranslationTransform]
+# Relative tolerance when comparing level pixel sizes to a target pixel size
+_PIXEL_SIZE_RTOL = 1e-9
+
+
+def _select_level(
+    spatial_scales: npt.ArrayLike, target_pixel_size: npt.ArrayLike
+) -> int:
+    """
+    Select the lowest resolution level with a pixel size no larger than a target.
+
+    Levels can be in any order, because the order of the levels is not checked
+    when a model is created with `trusted=True`.
+
+    Parameters
+    ----------
+    spatial_scales :
+        Pixel size of each level along each spatial axis,
+        with shape (n_levels, n_spatial_axes).
+    target_pixel_size :
+        Either a single pixel size for all spatial axes,
+        or pixel sizes for the last N spatial axes.
+    """
+    scales = np.asarray(spatial_scales, dtype=np.float64)
+    if np.ndim(target_pixel_size) == 0:
+        ratios = scales.max(axis=1) / float(target_pixel_size)  # type: ignore[arg-type]
+    else:
+        target = np.asarray(target_pixel_size, dtype=np.float64)
+        n_spatial = scales.shape[1]
+        if target.ndim != 1 or not 0 < target.size <= n_spatial:
+            raise ValueError(
+                f"Got {target.size} target pixel sizes, but there are {n_spatial} "
+                "spatial axes."
+            )
+        ratios = (scales[:, -target.size :] / target).max(axis=1)
+    valid = ratios <= 1 + _PIXEL_SIZE_RTOL
+    if not valid.any():
+        # If even the highest resolution level has too large a pixel size,
+        # the highest resolution level is the best we can do
+        return int(np.argmin(ratios))
+    return int(np.argmax(np.where(valid, ratios, -np.inf)))
+
+
+def _viewport_pixel_size(
+    bbox: npt.ArrayLike, screen_px: int | Sequence[int]
+) -> npt.NDArray[np.float64]:
+    """
+    Pixel size needed to show a bounding box at a given number of screen pixels.
+    """
+    bbox_array = np.asarray(bbox, dtype=np.float64)
+    if bbox_array.ndim != 2 or bbox_array.shape[0] != 2:
+        raise ValueError(
+            f"Bounding box must have shape (2, n_axes). Got shape {bbox_array.shape}."
+        )
+    extent = np.abs(bbox_array[1] - bbox_array[0])
+    pixel_size: npt.NDArray[np.float64] = extent / np.broadcast_to(
+        np.asarray(screen_px, dtype=np.float64), extent.shape
+    )
+    return pixel_size
+
+
+class _Transforms(BaseModel):
+    """
+    Wrapper used to validate the transforms of a `Dataset` before checking them.
+    """
+
+    # See BaseAttrs for why validators are built on first use
+    model_config = ConfigDict(defer_build=True)
+
+    transforms: list[Transform]
 
 
 class Dataset(BaseAttrs):
@@ -77,12 +152,10 @@ class Dataset(BaseAttrs):
         # Then we check the transformations are valid.
         #
         # This is a bit convoluted, but we do it because the default pydantic error
-        # messages are a mess otherwise
-
-        class Transforms(BaseModel):
-            transforms: list[Transform]
-
-        transforms = Transforms(transforms=transforms_obj).transforms
+        # messages are a mess otherwise.
+        # The wrapper model is defined once at module level, so its validator
+        # is only built once instead of on every call.
+        transforms = _Transforms(transforms=transforms_obj).transforms
         check_length(transforms, valid_lengths=[1, 2], variable_name="transforms")
 
         maybe_scale = transforms[0]
@@ -159,6 +232,105 @@ class MultiscaleBase(BaseAttrs):
         """
         return len(self.axes)
 
+    def get_dataset_transform(self, index: int) -> ScaleTranslation:
+        """
+        Get the transform from the array index space of a dataset to physical space.
+
+        This combines the coordinate transformations of the dataset with the
+        coordinate transformations of this multiscales (if present).
+        To transform from physical space to array index space, use
+        the inverse of the returned transform.
+
+        Parameters
+        ----------
+        index :
+            Index of the dataset in `datasets`.
+
+        Raises
+        ------
+        ValueError
+            If any of the coordinate transformations are defined by a path.
+        """
+        return ScaleTranslation.from_transforms(
+            [
+                *self.datasets[index].coordinateTransformations,
+                *(self.coordinateTransformations or ()),
+            ]
+        )
+
+    @cached_property
+    def _spatial_scales(self) -> tuple[tuple[float, ...], ...]:
+        """
+        Physical pixel size of each level along each spatial axis.
+
+        This is cached as tuples instead of an array, because cached values are
+        stored in `__dict__`, which pydantic compares when checking equality.
+        """
+        spatial = [i for i, axis in enumerate(self.axes) if axis.type == "space"]
+        return tuple(
+            tuple(self.get_dataset_transform(i).scale[spatial].tolist())
+            for i in range(len(self.datasets))
+        )
+
+    def select_level(self, target_pixel_size: npt.ArrayLike) -> int:
+        """
+        Select the multiscale level to use for a given physical pixel size.
+
+        The lowest resolution level with a pixel size less than or equal to the
+        target pixel size along the spatial axes is selected.
+        If no level is high enough resolution, the highest resolution level
+        is selected.
+        Levels do not need to be ordered from high to low resolution.
+
+        Pixel sizes of each level are computed the first time this is called,
+        so subsequent calls are fast.
+
+        Parameters
+        ----------
+        target_pixel_size :
+            Target pixel size, in the units of the spatial axes.
+            Either a single pixel size for every spatial axis,
+            or pixel sizes for the last N spatial axes (e.g., the `y` and `x` axes
+            when viewing 2D slices of 3D data).
+
+        Returns
+        -------
+        int
+            Index of the selected dataset in `datasets`.
+
+        Raises
+        ------
+        ValueError
+            If any of the scale transformations are defined by a path.
+        """
+        return _select_level(self._spatial_scales, target_pixel_size)
+
+    def level_for_viewport(
+        self, bbox: npt.ArrayLike, screen_px: int | Sequence[int]
+    ) -> int:
+        """
+        Select the multiscale level to use to show a region on screen.
+
+        This selects the lowest resolution level that still has at least one
+        pixel for every screen pixel (see `select_level()`).
+
+        Parameters
+        ----------
+        bbox :
+            Bounding box of the region in physical coordinates, with shape
+            (2, n_axes). The first row is one corner of the box, and the second
+            row is the opposite corner. The axes are the last `n_axes` spatial axes.
+        screen_px :
+            Number of screen pixels the region is shown across.
+            Either a single number for all axes, or one number for each axis.
+
+        Returns
+        -------
+        int
+            Index of the selected dataset in `datasets`.
+        """
+        return self.select_level(_viewport_pixel_size(bbox, screen_px))
+
     @model_validator(mode="after")
     def _ensure_axes_top_transforms(data: Self) -> Self:
         """
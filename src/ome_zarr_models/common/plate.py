@@ -1,6 +1,9 @@
-from collections import Counter
-from typing import Annotated, Self, TypeVar
+from __future__ import annotations
 
+from functools import cached_property
+from typing import TYPE_CHECKING, Annotated, Self, TypeVar
+
+import numpy as np
 from pydantic import (
     Field,
     NonNegativeInt,
@@ -15,6 +18,11 @@ from ome_zarr_models.common.validation import (
     unique_items_validator,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import numpy.typing as npt
+
 __all__ = [
     "Acquisition",
     "Column",
@@ -26,6 +34,48 @@ __all__ = [
 T = TypeVar("T")
 
 
+def _split_well_path(path: str) -> tuple[str, str] | None:
+    """
+    Split a well path into row and column names.
+
+    Returns `None` if the path does not contain a single '/'.
+    """
+    row, sep, column = path.partition("/")
+    if not sep or "/" in column:
+        return None
+    return row, column
+
+
+def _wells_in_plate(
+    rows: Sequence[str], columns: Sequence[str], well_paths: Iterable[str]
+) -> list[WellInPlate]:
+    """
+    Create the wells in a plate from their paths, ordered by row and then column.
+    """
+    row_indices = {row: i for i, row in enumerate(rows)}
+    column_indices = {column: i for i, column in enumerate(columns)}
+    wells = []
+    for path in well_paths:
+        row_column = _split_well_path(path)
+        if (
+            row_column is None
+            or row_column[0] not in row_indices
+            or row_column[1] not in column_indices
+        ):
+            raise ValueError(
+                f"Well path '{path}' must be of the form '{{row}}/{{column}}', "
+                "with a row and column that are in the plate."
+            )
+        wells.append(
+            WellInPlate(
+                path=path,
+                rowIndex=row_indices[row_column[0]],
+                columnIndex=column_indices[row_column[1]],
+            )
+        )
+    return sorted(wells, key=lambda well: (well.rowIndex, well.columnIndex))
+
+
 class Acquisition(BaseAttrs):
     """
     A single acquisition.
@@ -100,11 +150,11 @@ class PlateBase(BaseAttrs):
 
         for well in self.wells:
             path = well.path
-            if Counter(path)["/"] != 1:
+            if (row_column := _split_well_path(path)) is None:
                 errors.append(f"well path '{path}' does not contain a single '/'")
                 continue
 
-            row, column = path.split("/")
+            row, column = row_column
             if row not in row_names:
                 errors.append(
                     f"row '{row}' in well path '{path}' is not in list of rows"
@@ -119,3 +169,110 @@ class PlateBase(BaseAttrs):
             raise ValueError(f"Error validating plate metadata:\n{errors_joined}")
 
         return self
+
+    @cached_property
+    def _well_indices(self) -> dict[tuple[str, str], int]:
+        """
+        Mapping from (row name, column name) to the index of each well.
+        """
+        indices: dict[tuple[str, str], int] = {}
+        for i, well in enumerate(self.wells):
+            if (row_column := _split_well_path(well.path)) is not None:
+                indices.setdefault(row_column, i)
+        return indices
+
+    @cached_property
+    def _row_positions(self) -> dict[str, int]:
+        return {row.name: i for i, row in enumerate(self.rows)}
+
+    @cached_property
+    def _column_positions(self) -> dict[str, int]:
+        return {column.name: i for i, column in enumerate(self.columns)}
+
+    @cached_property
+    def _well_grid_rows(self) -> tuple[tuple[int, ...], ...]:
+        """
+        Index of the well at each position in the plate, as one tuple per row.
+
+        This is cached as tuples instead of an array, because cached values are
+        stored in `__dict__`, which pydantic compares when checking equality.
+        """
+        grid = [[-1] * len(self.columns) for _ in self.rows]
+        for i, well in enumerate(self.wells):
+            if not (
+                0 <= well.rowIndex < len(self.rows)
+                and 0 <= well.columnIndex < len(self.columns)
+            ):
+                raise ValueError(
+                    f"Well '{well.path}' has position ({well.rowIndex}, "
+                    f"{well.columnIndex}), which is outside of the plate with "
+                    f"{len(self.rows)} rows and {len(self.columns)} columns."
+                )
+            grid[well.rowIndex][well.columnIndex] = i
+        return tuple(tuple(row) for row in grid)
+
+    @property
+    def well_grid(self) -> npt.NDArray[np.intp]:
+        """
+        Index of the well at each position in the plate.
+
+        This is a read-only array with shape (number of rows, number of columns),
+        where element `[rowIndex, columnIndex]` is the index of the well in `wells`.
+        Positions without a well are set to -1.
+
+        Raises
+        ------
+        ValueError
+            If the row or column index of a well is outside the plate.
+        """
+        grid = np.array(self._well_grid_rows, dtype=np.intp).reshape(
+            len(self.rows), len(self.columns)
+        )
+        grid.flags.writeable = False
+        return grid
+
+    def get_well_index(self, row: str, column: str) -> int:
+        """
+        Get the index of a well in `wells` from its row and column names.
+
+        The lookup table is built the first time this is called,
+        so subsequent calls are fast.
+
+        Raises
+        ------
+        ValueError
+            If there is no well at the given row and column.
+        """
+        try:
+            return self._well_indices[row, column]
+        except KeyError:
+            raise ValueError(
+                f"No well found at row '{row}' and column '{column}'."
+            ) from None
+
+    def well_indices_in_row(self, row: str) -> list[int]:
+        """
+        Get the indices in `wells` of all the wells in a row, ordered by column.
+
+        Raises
+        ------
+        ValueError
+            If the row is not in the plate.
+        """
+        if row not in self._row_positions:
+            raise ValueError(f"Row '{row}' is not in list of rows.")
+        return [i for i in self._well_grid_rows[self._row_positions[row]] if i >= 0]
+
+    def well_indices_in_column(self, column: str) -> list[int]:
+        """
+        Get the indices in `wells` of all the wells in a column, ordered by row.
+
+        Raises
+        ------
+        ValueError
+            If the column is not in the plate.
+        """
+        if column not in self._column_positions:
+            raise ValueError(f"Column '{column}' is not in list of columns.")
+        position = self._column_positions[column]
+        return [row[position] for row in self._well_grid_rows if row[position] >= 0]
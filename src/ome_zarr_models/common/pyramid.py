@@ -0,0 +1,500 @@
+"""
+Generation of multiscale image pyramids from array data.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+import zarr
+from zarr.storage import MemoryStore
+
+from ome_zarr_models._utils import chunk_regions, run_tasks
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+    from ome_zarr_models.common.axes import Axis
+
+
+__all__ = [
+    "LABEL_DOWNSAMPLE_METHODS",
+    "DownsampleMethod",
+    "default_downsample_factors",
+    "downsample_block",
+    "pyramid_shapes",
+    "pyramid_transforms",
+    "write_pyramid",
+]
+
+DownsampleMethod = Literal["mean", "gaussian", "mode", "nearest"]
+"""
+Methods for downsampling one level of a pyramid to the next.
+
+- `"mean"`: the mean of each block of pixels.
+- `"gaussian"`: the mean of each block of pixels, after smoothing with a
+  Gaussian filter. This reduces aliasing compared to `"mean"`.
+- `"mode"`: the most common value in each block of pixels.
+  If there is a tie, the value that comes first in the block is used.
+- `"nearest"`: the first pixel in each block of pixels.
+"""
+
+LABEL_DOWNSAMPLE_METHODS: tuple[DownsampleMethod, ...] = ("mode", "nearest")
+"""
+Downsampling methods that keep the values of a label image intact.
+"""
+
+
+def default_downsample_factors(axes: Sequence[Axis]) -> tuple[int, ...]:
+    """
+    Default downsampling factors: 2 along space axes, and 1 along all other axes.
+    """
+    return tuple(2 if axis.type == "space" else 1 for axis in axes)
+
+
+def pyramid_shapes(
+    shape: Sequence[int],
+    factors: Sequence[int],
+    *,
+    levels: int | None,
+    chunks: Sequence[int],
+) -> list[tuple[int, ...]]:
+    """
+    Shapes of each level in a pyramid.
+
+    Parameters
+    ----------
+    shape :
+        Shape of the full resolution level.
+    factors :
+        Downsampling factor along each axis between each level.
+    levels :
+        Number of levels (including the full resolution level).
+        If `None`, levels are added until the lowest resolution level
+        fits in a single chunk along every axis that is downsampled.
+    chunks :
+        Chunk shape of the arrays.
+    """
+    if len(factors) != len(shape) or len(chunks) != len(shape):
+        raise ValueError(
+            f"Length of downsampling factors ({len(factors)}) and chunks "
+            f"({len(chunks)}) must match the number of dimensions ({len(shape)})."
+        )
+    if any(factor < 1 for factor in factors):
+        raise ValueError(f"Downsampling factors must be at least 1. Got {factors}.")
+    if levels is not None and levels < 1:
+        raise ValueError(f"Number of levels must be at least 1. Got {levels}.")
+    if levels is None and all(factor == 1 for factor in factors):
+        raise ValueError(
+            "At least one downsampling factor must be greater than 1 "
+            "if levels is not given."
+        )
+
+    shapes = [tuple(shape)]
+    while len(shapes) != levels:
+        if levels is None and all(
+            size <= chunk
+            for size, chunk, factor in zip(shapes[-1], chunks, factors, strict=True)
+            if factor > 1
+        ):
+            break
+        shapes.append(
+            tuple(
+                math.ceil(size / factor)
+                for size, factor in zip(shapes[-1], factors, strict=True)
+            )
+        )
+    return shapes
+
+
+def pyramid_transforms(
+    *,
+    scale: Sequence[float],
+    translation: Sequence[float],
+    factors: Sequence[int],
+    n_levels: int,
+    method: DownsampleMethod,
+) -> tuple[list[list[float]], list[list[float]]]:
+    """
+    Scale and translation of each level in a pyramid.
+
+    For `"mean"`, `"gaussian"` and `"mode"` downsampling each pixel is centred
+    on the block of pixels it was created from, so the translation is shifted
+    by half a block.
+    For `"nearest"` downsampling each pixel is positioned on the first pixel
+    of the block it was created from, so the translation is not changed.
+    """
+    scales = []
+    translations = []
+    for level in range(n_levels):
+        level_factors = [factor**level for factor in factors]
+        scales.append(
+            [s * f for s, f in zip(scale, level_factors, strict=True)],
+        )
+        if method == "nearest":
+            translations.append(list(translation))
+        else:
+            translations.append(
+                [
+                    t + (f - 1) * s / 2
+                    for t, s, f in zip(translation, scale, level_factors, strict=True)
+                ]
+            )
+    return scales, translations
+
+
+def _gaussian_radius(factor: int) -> int:
+    """
+    Radius of the Gaussian smoothing kernel used for a downsampling factor.
+    """
+    if factor == 1:
+        return 0
+    # Same sigma and truncation as skimage.transform.pyramid_reduce()
+    return int(4 * _gaussian_sigma(factor) + 0.5)
+
+
+def _gaussian_sigma(factor: int) -> float:
+    return 2 * factor / 6
+
+
+def _smooth(
+    padded: npt.NDArray[np.float64], factors: Sequence[int]
+) -> npt.NDArray[np.float64]:
+    """
+    Smooth data with a separable Gaussian filter.
+
+    *padded* must already be padded by the kernel radius along each axis, and
+    the returned array has this padding removed.
+    """
+    for axis, factor in enumerate(factors):
+        radius = _gaussian_radius(factor)
+        if radius == 0:
+            continue
+        offsets = np.arange(-radius, radius + 1)
+        weights = np.exp(-0.5 * (offsets / _gaussian_sigma(factor)) ** 2)
+        weights /= weights.sum()
+        size = padded.shape[axis] - 2 * radius
+        smoothed = np.zeros(
+            (*padded.shape[:axis], size, *padded.shape[axis + 1 :]), dtype=np.float64
+        )
+        for offset, weight in enumerate(weights):
+            shifted = (slice(None),) * axis + (slice(offset, offset + size),)
+            smoothed += weight * padded[shifted]
+        padded = smoothed
+    return padded
+
+
+def _split_blocks(
+    block: npt.NDArray[Any], factors: Sequence[int], *, fill: Any
+) -> tuple[npt.NDArray[Any], list[int]]:
+    """
+    Pad a block to a multiple of *factors*, and reshape it so each block of pixels
+    is along its own set of (odd) axes.
+    """
+    out_shape = [
+        math.ceil(size / factor)
+        for size, factor in zip(block.shape, factors, strict=True)
+    ]
+    padded = np.pad(
+        block,
+        [
+            (0, out_size * factor - size)
+            for size, out_size, factor in zip(
+                block.shape, out_shape, factors, strict=True
+            )
+        ],
+        constant_values=fill,
+    )
+    blocks = padded.reshape(
+        [
+            dim
+            for out_size, factor in zip(out_shape, factors, strict=True)
+            for dim in (out_size, factor)
+        ]
+    )
+    return blocks, out_shape
+
+
+def _block_mean(
+    block: npt.NDArray[np.float64], factors: Sequence[int]
+) -> npt.NDArray[np.float64]:
+    """
+    Mean of each block of pixels.
+    """
+    # Pad incomplete blocks with zeros, and divide the sum of each block
+    # by the number of pixels in the block that are not padding
+    blocks, _ = _split_blocks(block, factors, fill=0)
+    mean: npt.NDArray[np.float64] = blocks.sum(axis=tuple(range(1, blocks.ndim, 2)))
+    for axis, (size, factor) in enumerate(zip(block.shape, factors, strict=True)):
+        counts = np.minimum(size - np.arange(0, size, factor), factor)
+        mean /= counts.reshape([-1 if i == axis else 1 for i in range(block.ndim)])
+    return mean
+
+
+def _block_mode(block: npt.NDArray[Any], factors: Sequence[int]) -> npt.NDArray[Any]:
+    """
+    Most common value in each block of pixels.
+    """
+    blocks, out_shape = _split_blocks(block, factors, fill=0)
+    valid, _ = _split_blocks(np.ones(block.shape, dtype=bool), factors, fill=False)
+    # Move the pixels in each block to a single last axis
+    order = [*range(0, blocks.ndim, 2), *range(1, blocks.ndim, 2)]
+    n_pixels = math.prod(factors)
+    values = blocks.transpose(order).reshape([*out_shape, n_pixels])
+    valid = valid.transpose(order).reshape([*out_shape, n_pixels])
+    # Sort the pixels in each block, with padding after all the real pixels.
+    # The sort is stable, so within each run of equal values the first pixel
+    # is the first one in the block.
+    sort = np.lexsort((values, ~valid), axis=-1)
+    values = np.take_along_axis(values, sort, axis=-1)
+    valid = np.take_along_axis(valid, sort, axis=-1)
+    changes = (values[..., 1:] != values[..., :-1]) | (
+        valid[..., 1:] != valid[..., :-1]
+    )
+    run_starts = np.ones(values.shape, dtype=bool)
+    run_starts[..., 1:] = changes
+    run_ends = np.ones(values.shape, dtype=bool)
+    run_ends[..., :-1] = changes
+    # Start and end of the run that each sorted pixel is in
+    index = np.arange(n_pixels)
+    start = np.maximum.accumulate(np.where(run_starts, index, 0), axis=-1)
+    end = np.flip(
+        np.minimum.accumulate(
+            np.flip(np.where(run_ends, index, n_pixels), axis=-1), axis=-1
+        ),
+        axis=-1,
+    )
+    # Rank runs by their length, and then by their first pixel in the block,
+    # so ties go to the value that appears first.
+    # Padding is never picked.
+    first = np.take_along_axis(sort, start, axis=-1)
+    rank = (end - start + 1) * n_pixels + (n_pixels - 1 - first)
+    rank[~valid] = -1
+    mode: npt.NDArray[Any] = np.take_along_axis(
+        values, np.argmax(rank, axis=-1)[..., np.newaxis], axis=-1
+    )[..., 0]
+    return mode
+
+
+def _cast(data: npt.NDArray[np.float64], dtype: np.dtype[Any]) -> npt.NDArray[Any]:
+    if np.issubdtype(dtype, np.integer):
+        data = np.rint(data)
+    return data.astype(dtype)
+
+
+def downsample_block(
+    block: npt.NDArray[Any], factors: Sequence[int], method: DownsampleMethod
+) -> npt.NDArray[Any]:
+    """
+    Downsample a block of data.
+
+    The shape of the block does not need to be a multiple of the downsampling
+    factors. Incomplete blocks of pixels at the upper edges are downsampled
+    using only the pixels that are present.
+
+    Parameters
+    ----------
+    block :
+        Data to downsample.
+    factors :
+        Downsampling factor along each axis.
+    method :
+        Downsampling method.
+        For `"gaussian"` the block is extended by repeating the edge values
+        before smoothing.
+
+    Returns
+    -------
+    numpy.ndarray
+        Downsampled data, with the same data type as *block*.
+    """
+    if method == "gaussian":
+        radii = [_gaussian_radius(factor) for factor in factors]
+        padded = np.pad(block.astype(np.float64), [(r, r) for r in radii], mode="edge")
+        return _cast(_block_mean(_smooth(padded, factors), factors), block.dtype)
+    return _downsample(block, factors, method)
+
+
+def _downsample(
+    block: npt.NDArray[Any], factors: Sequence[int], method: DownsampleMethod
+) -> npt.NDArray[Any]:
+    """
+    Downsample a block of data that has already been smoothed if needed.
+    """
+    if method == "nearest":
+        strided: npt.NDArray[Any] = block[
+            tuple(slice(None, None, factor) for factor in factors)
+        ]
+        return strided
+    elif method == "mode":
+        return _block_mode(block, factors)
+    elif method == "mean":
+        return _cast(_block_mean(block.astype(np.float64), factors), block.dtype)
+    raise ValueError(f"Unknown downsampling method: {method}")
+
+
+def _write_chunk(
+    array: zarr.Array[Any], region: tuple[slice, ...], data: npt.NDArray[Any]
+) -> None:
+    array[region] = data
+
+
+def _copy_chunk(
+    source: zarr.Array[Any], array: zarr.Array[Any], region: tuple[slice, ...]
+) -> None:
+    array[region] = source[region]
+
+
+def _downsample_chunk(
+    previous: zarr.Array[Any],
+    array: zarr.Array[Any],
+    region: tuple[slice, ...],
+    factors: Sequence[int],
+    method: DownsampleMethod,
+) -> None:
+    """
+    Create one chunk of a pyramid level by downsampling the level above it.
+    """
+    # Region of the previous level that this chunk is created from
+    starts = [s.start * factor for s, factor in zip(region, factors, strict=True)]
+    stops = [
+        min(s.stop * factor, size)
+        for s, factor, size in zip(region, factors, previous.shape, strict=True)
+    ]
+    if method != "gaussian":
+        data = np.asarray(
+            previous[tuple(itertools.starmap(slice, zip(starts, stops, strict=True)))]
+        )
+        array[region] = _downsample(data, factors, method)
+        return
+
+    # Read a halo around the region, so the smoothing is the same as if the
+    # whole level was smoothed at once
+    radii = [_gaussian_radius(factor) for factor in factors]
+    read_starts = [max(start - r, 0) for start, r in zip(starts, radii, strict=True)]
+    read_stops = [
+        min(stop + r, size)
+        for stop, r, size in zip(stops, radii, previous.shape, strict=True)
+    ]
+    data = np.asarray(
+        previous[
+            tuple(itertools.starmap(slice, zip(read_starts, read_stops, strict=True)))
+        ]
+    ).astype(np.float64)
+    # At the edges of the level, extend the data by repeating the edge values
+    padded = np.pad(
+        data,
+        [
+            (r - (start - read_start), r - (read_stop - stop))
+            for r, start, read_start, stop, read_stop in zip(
+                radii, starts, read_starts, stops, read_stops, strict=True
+            )
+        ],
+        mode="edge",
+    )
+    array[region] = _cast(_block_mean(_smooth(padded, factors), factors), array.dtype)
+
+
+def write_pyramid(
+    source: npt.NDArray[Any] | zarr.Array[Any],
+    arrays: Sequence[zarr.Array[Any]],
+    *,
+    factors: Sequence[int],
+    method: DownsampleMethod = "mean",
+    executor: Executor | None = None,
+) -> None:
+    """
+    Write data to the levels of a pyramid, one chunk at a time.
+
+    The first level is copied from *source*, and each subsequent level is
+    created by downsampling the previous level.
+    Work is split up so that each task reads the region of the previous level
+    that one output chunk is created from, and writes that output chunk.
+    Tasks never write to the same chunk, so they can be run in parallel.
+
+    Parameters
+    ----------
+    source :
+        Full resolution data. This can be any array that supports slicing with
+        NumPy indexing (e.g., a NumPy array, a NumPy memmap, or a Zarr array).
+    arrays :
+        Zarr arrays to write each level to, from highest to lowest resolution.
+        Each array must be the downsampled shape of the previous array.
+    factors :
+        Downsampling factor along each axis between each level.
+    method :
+        Downsampling method.
+    executor :
+        Executor to run tasks with. If not given, tasks are run one at a time.
+        Downsampling is CPU bound, so use a `concurrent.futures.ProcessPoolExecutor`
+        to use multiple CPU cores. Arrays in a store that is only held in memory
+        (e.g., a `MemoryStore`) can only be written to with a
+        `concurrent.futures.ThreadPoolExecutor`.
+
+    Raises
+    ------
+    ValueError
+        If *executor* is a `ProcessPoolExecutor` and the arrays are in a
+        `MemoryStore`.
+    """
+    if tuple(arrays[0].shape) != tuple(source.shape):
+        raise ValueError(
+            f"Shape of the first array {arrays[0].shape} does not match "
+            f"shape of source data {source.shape}."
+        )
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=1) as serial_executor:
+            return write_pyramid(
+                source,
+                arrays,
+                factors=factors,
+                method=method,
+                executor=serial_executor,
+            )
+    if isinstance(executor, ProcessPoolExecutor) and any(
+        isinstance(array.store, MemoryStore) for array in arrays
+    ):
+        raise ValueError(
+            "Arrays in a MemoryStore cannot be written to from other processes. "
+            "Use a ThreadPoolExecutor, or a store that can be shared between "
+            "processes (e.g., a LocalStore)."
+        )
+
+    if isinstance(source, zarr.Array):
+        # Each task reads its own chunk from the source
+        for _ in run_tasks(
+            executor,
+            _copy_chunk,
+            ((source, arrays[0], region) for region in chunk_regions(arrays[0])),
+        ):
+            pass
+    else:
+        for _ in run_tasks(
+            executor,
+            _write_chunk,
+            (
+                (arrays[0], region, np.asarray(source[region]))
+                for region in chunk_regions(arrays[0])
+            ),
+        ):
+            pass
+
+    # Each level is created from the previous level, so levels are
+    # created one after another
+    for previous, array in itertools.pairwise(arrays):
+        for _ in run_tasks(
+            executor,
+            _downsample_chunk,
+            (
+                (previous, array, region, factors, method)
+                for region in chunk_regions(array)
+            ),
+        ):
+            pass
+    return None
@@ -1,11 +1,15 @@
 # Need to import `annotations` for the pydantic_zarr TypeAlias strings to work
 from __future__ import annotations
 
+import asyncio
+import json
 from typing import TYPE_CHECKING, Literal, TypeVar, overload
 
 import zarr
+import zarr.api.asynchronous
 import zarr.errors
 from pydantic import StringConstraints
+from pydantic_zarr.core import tuplify_json
 from pydantic_zarr.v2 import AnyArraySpec as AnyArraySpecv2
 from pydantic_zarr.v2 import AnyGroupSpec as AnyGroupSpecv2
 from pydantic_zarr.v2 import ArraySpec as ArraySpecv2
@@ -14,15 +18,25 @@ from pydantic_zarr.v3 import AnyArraySpec as AnyArraySpecv3
 from pydantic_zarr.v3 import AnyGroupSpec as AnyGroupSpecv3
 from pydantic_zarr.v3 import ArraySpec as ArraySpecv3
 from pydantic_zarr.v3 import GroupSpec as GroupSpecv3
+from zarr.core.buffer import default_buffer_prototype
+from zarr.core.common import ZARR_JSON
+from zarr.core.group import AsyncGroup
+from zarr.core.metadata import ArrayV3Metadata
+from zarr.core.sync import sync
+from zarr.storage import StorePath
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from zarr.abc.store import Store
+
 
 __all__ = [
     "AlphaNumericConstraint",
     "RGBHexConstraint",
     "check_array_path",
+    "check_array_path_async",
+    "check_array_paths_async",
     "unique_items_validator",
 ]
 
@@ -39,14 +53,24 @@ def unique_items_validator(values: list[T]) -> list[T]:
     """
     Make sure a list contains unique items.
 
+    Items are checked using their hashes, so this takes time proportional
+    to the length of the list. If any item is not hashable, every pair of items
+    is compared instead.
+
     Raises
     ------
     ValueError
         If duplicate values are found in *values*.
     """
-    for ind, value in enumerate(values, start=1):
-        if value in values[ind:]:
-            raise ValueError(f"Duplicate values found in {values}.")
+    try:
+        has_duplicates = len(set(values)) != len(values)
+    except TypeError:
+        # At least one value is not hashable
+        has_duplicates = any(
+            value in values[ind:] for ind, value in enumerate(values, start=1)
+        )
+    if has_duplicates:
+        raise ValueError(f"Duplicate values found in {values}.")
     return values
 
 
@@ -87,32 +111,216 @@ def check_array_path(
     ValueError
         If the array doesn't exist, or the array is not the expected Zarr version.
     """
-    try:
-        array = zarr.open_array(store=group.store, path=array_path, mode="r")
-        array_spec: AnyArraySpecv2 | AnyArraySpecv3
-        if array.metadata.zarr_format == 2:
-            if expected_zarr_version == 3:
-                raise ValueError("Expected Zarr v3 array, but got v2 array")
-            array_spec = ArraySpecv2.from_zarr(array)
-        else:
-            if expected_zarr_version == 2:
-                raise ValueError("Expected Zarr v2 array, but got v3 array")
-            array_spec = ArraySpecv3.from_zarr(array)
-    except FileNotFoundError as e:
-        msg = (
-            f"Expected to find an array at {array_path}, but no array was found there."
-        )
-        raise ValueError(msg) from e
-    except zarr.errors.ContainsGroupError as e:
-        msg = (
-            f"Expected to find an array at {array_path}, "
-            "but a group was found there instead."
+    return sync(  # type: ignore[return-value]
+        check_array_path_async(
+            group, array_path, expected_zarr_version=expected_zarr_version
         )
-        raise ValueError(msg) from e
+    )
+
+
+@overload
+async def check_array_path_async(
+    group: zarr.Group,
+    array_path: str,
+    *,
+    expected_zarr_version: Literal[2],
+) -> AnyArraySpecv2: ...
+
+
+@overload
+async def check_array_path_async(
+    group: zarr.Group,
+    array_path: str,
+    *,
+    expected_zarr_version: Literal[3],
+) -> AnyArraySpecv3: ...
+
+
+async def check_array_path_async(
+    group: zarr.Group,
+    array_path: str,
+    *,
+    expected_zarr_version: Literal[2, 3],
+) -> AnyArraySpecv2 | AnyArraySpecv3:
+    """
+    Asynchronously check if an array exists at a given path in a group.
+
+    See [check_array_path][ome_zarr_models.common.validation.check_array_path]
+    for more details.
+    """
+    not_found_msg = (
+        f"Expected to find an array at {array_path}, but no array was found there."
+    )
+    group_found_msg = (
+        f"Expected to find an array at {array_path}, "
+        "but a group was found there instead."
+    )
+    consolidated_path = _consolidated_path(group, array_path)
+    if consolidated_path is not None:
+        # The metadata for the whole hierarchy is already loaded,
+        # so get the array metadata from that instead of reading from the store
+        try:
+            node = await group._async_group.getitem(consolidated_path)
+        except KeyError as e:
+            raise ValueError(not_found_msg) from e
+        if isinstance(node, AsyncGroup):
+            raise ValueError(group_found_msg)
+        async_array = node
+    else:
+        # Zarr v2 array metadata documents rely on defaults that zarr fills in
+        # (e.g., the dimension separator), so they are always read by opening
+        # the array
+        if expected_zarr_version == 3:
+            array_spec_v3 = await _array_spec_from_json(group.store, array_path)
+            if array_spec_v3 is not None:
+                return array_spec_v3
+
+        try:
+            async_array = await zarr.api.asynchronous.open_array(
+                store=group.store, path=array_path, mode="r"
+            )
+        except FileNotFoundError as e:
+            raise ValueError(not_found_msg) from e
+        except zarr.errors.ContainsGroupError as e:
+            raise ValueError(group_found_msg) from e
+
+    array = zarr.Array(async_array)
+    array_spec: AnyArraySpecv2 | AnyArraySpecv3
+    if array.metadata.zarr_format == 2:
+        if expected_zarr_version == 3:
+            raise ValueError("Expected Zarr v3 array, but got v2 array")
+        array_spec = ArraySpecv2.from_zarr(array)
+    else:
+        if expected_zarr_version == 2:
+            raise ValueError("Expected Zarr v2 array, but got v3 array")
+        array_spec = _array_spec_from_metadata(array.metadata)
 
     return array_spec
 
 
+def _consolidated_path(group: zarr.Group, array_path: str) -> str | None:
+    """
+    Get the path of an array relative to a group with consolidated metadata.
+
+    *array_path* is relative to the root of the store. Returns `None` if *group*
+    does not have consolidated metadata, or *array_path* is not within *group*.
+    """
+    if group.metadata.consolidated_metadata is None:
+        return None
+    array_path = array_path.strip("/")
+    if not group.path:
+        return array_path
+    prefix = f"{group.path}/"
+    if not array_path.startswith(prefix):
+        return None
+    return array_path.removeprefix(prefix)
+
+
+async def _array_spec_from_json(store: Store, array_path: str) -> AnyArraySpecv3 | None:
+    """
+    Create an ArraySpec from the raw bytes of a Zarr v3 array metadata document.
+
+    The document is parsed into zarr array metadata directly,
+    instead of opening the array with zarr, which makes more store reads.
+
+    Returns `None` if there is no metadata document at *array_path*, or if it is
+    not valid array metadata.
+    """
+    buffer = await (StorePath(store, array_path) / ZARR_JSON).get(
+        prototype=default_buffer_prototype()
+    )
+    if buffer is None:
+        return None
+    try:
+        metadata_dict = json.loads(buffer.to_bytes())
+        if (
+            not isinstance(metadata_dict, dict)
+            or metadata_dict.get("zarr_format") != 3
+            or metadata_dict.get("node_type") != "array"
+        ):
+            return None
+        return _array_spec_from_metadata(ArrayV3Metadata.from_dict(metadata_dict))
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+def _array_spec_from_metadata(metadata: ArrayV3Metadata) -> AnyArraySpecv3:
+    """
+    Create an ArraySpec from zarr array metadata.
+
+    This gives the same ArraySpec as `ArraySpec.from_zarr()`,
+    where all the lists in the metadata (including in codec configurations)
+    are converted to tuples.
+    It does not need an opened array, and skips the package version lookup that
+    `ArraySpec.from_zarr()` makes on every call.
+    The tests check that both give the same ArraySpec, so keep this in step with
+    `ArraySpec.from_zarr()` when updating pydantic-zarr.
+    """
+    meta_json = tuplify_json(metadata.to_dict())
+    return ArraySpecv3(
+        attributes=meta_json["attributes"],
+        shape=metadata.shape,
+        data_type=meta_json["data_type"],
+        chunk_grid=meta_json["chunk_grid"],
+        chunk_key_encoding=meta_json["chunk_key_encoding"],
+        fill_value=meta_json["fill_value"],
+        codecs=meta_json["codecs"],
+        storage_transformers=meta_json["storage_transformers"],
+        dimension_names=meta_json.get("dimension_names", None),
+    )
+
+
+@overload
+async def check_array_paths_async(
+    group: zarr.Group,
+    array_paths: Sequence[str],
+    *,
+    expected_zarr_version: Literal[2],
+) -> list[AnyArraySpecv2]: ...
+
+
+@overload
+async def check_array_paths_async(
+    group: zarr.Group,
+    array_paths: Sequence[str],
+    *,
+    expected_zarr_version: Literal[3],
+) -> list[AnyArraySpecv3]: ...
+
+
+async def check_array_paths_async(
+    group: zarr.Group,
+    array_paths: Sequence[str],
+    *,
+    expected_zarr_version: Literal[2, 3],
+) -> list[AnyArraySpecv2] | list[AnyArraySpecv3]:
+    """
+    Check if arrays exist at several paths in a group.
+
+    The array metadata at each path is fetched concurrently.
+
+    Returns
+    -------
+    list[ArraySpec]
+        An ArraySpec for each path, in the same order as *array_paths*.
+
+    Raises
+    ------
+    ValueError
+        If any of the arrays don't exist, or are not the expected Zarr version.
+    """
+    return list(  # type: ignore[return-value]
+        await asyncio.gather(
+            *(
+                check_array_path_async(
+                    group, array_path, expected_zarr_version=expected_zarr_version
+                )
+                for array_path in array_paths
+            )
+        )
+    )
+
+
 def check_length(
     sequence: Sequence[T], *, valid_lengths: Sequence[int], variable_name: str
 ) -> None:
@@ -1,20 +1,42 @@
-from typing import Generic, Literal, Self, TypeVar
+from typing import Any, Generic, Literal, Self, TypeVar, Union
 
+# Import needed for pydantic type resolution
+import pydantic_zarr  # noqa: TC002
 import zarr
-from pydantic_zarr.v2 import GroupSpec, TBaseItem
+from pydantic import ConfigDict
+from pydantic_zarr.v2 import GroupSpec
+from zarr.abc.store import Store
 
 from ome_zarr_models.base import BaseAttrs, BaseGroup
+from ome_zarr_models.common.cache import cached_from_zarr
+from ome_zarr_models.common.instrumentation import instrumented_from_zarr
 
 T = TypeVar("T", bound=BaseAttrs)
 
 
-class BaseGroupv04(BaseGroup, GroupSpec[T, TBaseItem], Generic[T]):
+class BaseGroupv04(
+    BaseGroup,
+    GroupSpec[
+        T,
+        # Fully qualified names, because pydantic_zarr.v2.TBaseItem is the same
+        # object as pydantic_zarr.v3.TBaseItem, so may resolve to the v3 classes
+        Union["pydantic_zarr.v2.GroupSpec", "pydantic_zarr.v2.ArraySpec"],  # type: ignore[type-arg]
+    ],
+    Generic[T],
+):
     """
     Base class for all v0.4 OME-Zarr groups.
     """
 
+    # See BaseAttrs for why validators are built on first use
+    model_config = ConfigDict(defer_build=True)
+
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    @cached_from_zarr
+    @instrumented_from_zarr
+    def from_zarr(  # type: ignore[override]
+        cls, group: zarr.Group, *, trusted: bool = False
+    ) -> Self:
         """
         Create an OME-Zarr model from a `zarr.Group`.
 
@@ -22,9 +44,68 @@ class BaseGroupv04(BaseGroup, GroupSpec[T, TBaseItem], Generic[T]):
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image metadata.
+        trusted :
+            If `True`, create the model without validating the metadata.
+            Only use this for groups whose metadata is already known to be valid,
+            e.g., groups that were written by ome-zarr-models.
         """
+        if trusted:
+            group_spec: GroupSpec[Any, Any] = GroupSpec.from_zarr(group)
+            return cls._from_attributes_and_members(
+                attributes=group_spec.attributes,
+                members=group_spec.members,
+                trusted=True,
+            )
         return super().from_zarr(group)
 
+    def to_zarr(
+        self,
+        store: Store,
+        path: str,
+        *,
+        overwrite: bool = False,
+        consolidate: bool = False,
+        concurrent: bool = False,
+        **kwargs: Any,
+    ) -> zarr.Group:
+        """
+        Save this model to a Zarr store.
+
+        Parameters
+        ----------
+        store :
+            Store to save the group to.
+        path :
+            Path within the store to save the group to.
+        overwrite :
+            If `True`, overwrite any existing group or array at *path*.
+        consolidate :
+            If `True`, also write consolidated metadata for the group.
+            This allows the whole group to be loaded later with a single read.
+        concurrent :
+            If `True`, create the metadata for every group and array in memory,
+            and then write all the metadata documents to the store concurrently.
+            This is much faster for large hierarchies (e.g., HCS plates), especially
+            on high latency stores.
+            Unlike the default behaviour, an error is raised if there is already
+            a group or array at any of the paths and *overwrite* is `False`.
+        **kwargs :
+            Passed to `GroupSpec.to_zarr()`. Not supported if *concurrent* is `True`.
+        """
+        if concurrent:
+            if kwargs:
+                raise TypeError(
+                    "Extra keyword arguments are not supported when concurrent=True. "
+                    f"Got {list(kwargs)}."
+                )
+            return self._to_zarr_concurrent(
+                store, path, overwrite=overwrite, consolidate=consolidate
+            )
+        group = super().to_zarr(store, path, overwrite=overwrite, **kwargs)
+        if consolidate:
+            group = zarr.consolidate_metadata(store, path)
+        return group
+
     @property
     def ome_zarr_version(self) -> Literal["0.4"]:
         """
@@ -7,6 +7,7 @@ from ome_zarr_models.common.coordinate_transformations import (
     PathScale,
     PathTranslation,
     ScaleTransform,
+    ScaleTranslation,
     Transform,
     TranslationTransform,
     VectorScale,
@@ -19,6 +20,7 @@ __all__ = [
     "PathScale",
     "PathTranslation",
     "ScaleTransform",
+    "ScaleTranslation",
     "Transform",
     "TranslationTransform",
     "VectorScale",
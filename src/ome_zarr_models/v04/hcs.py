@@ -1,14 +1,35 @@
-from collections.abc import Generator, Mapping
-from typing import Self
+from collections.abc import Generator, Mapping, Sequence
+from concurrent.futures import Executor
+from typing import Any, Self
 
-from pydantic import model_validator
+# Import needed for pydantic type resolution
+import pydantic_zarr  # noqa: F401
+import zarr
+from pydantic import (
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+    model_validator,
+)
 from pydantic_zarr.v2 import GroupSpec
+from zarr.abc.store import Store
 
+from ome_zarr_models._utils import LRUCache
 from ome_zarr_models.base import BaseAttrs
-from ome_zarr_models.common.well import WellGroupNotFoundError
+from ome_zarr_models.common.cache import cached_from_zarr
+from ome_zarr_models.common.hcs import (
+    WellValidationResult,
+    _check_well_acquisitions,
+    validate_plate,
+)
+from ome_zarr_models.common.instrumentation import instrumented_from_zarr
+from ome_zarr_models.common.plate import _wells_in_plate
+from ome_zarr_models.common.well import WellAttrs, WellGroupNotFoundError
 from ome_zarr_models.v04.base import BaseGroupv04
-from ome_zarr_models.v04.plate import Plate
+from ome_zarr_models.v04.image import Image
+from ome_zarr_models.v04.plate import Acquisition, Column, Plate, Row
 from ome_zarr_models.v04.well import Well
+from ome_zarr_models.v04.well_types import WellImage, WellMeta
 
 __all__ = ["HCS", "HCSAttrs"]
 
@@ -26,6 +47,188 @@ class HCS(BaseGroupv04[HCSAttrs]):
     An OME-Zarr high-content screening (HCS) dataset representing a single plate.
     """
 
+    # Only set if this group has been lazily loaded
+    _zarr_group: zarr.Group | None = PrivateAttr(default=None)
+    _well_cache: LRUCache[int, Well] | None = PrivateAttr(default=None)
+    _trusted: bool = PrivateAttr(default=False)
+
+    @classmethod
+    @cached_from_zarr
+    @instrumented_from_zarr
+    def from_zarr(  # type: ignore[override]
+        cls,
+        group: zarr.Group,
+        *,
+        lazy: bool = False,
+        well_cache_size: int = 128,
+        trusted: bool = False,
+    ) -> Self:
+        """
+        Create an OME-Zarr HCS model from a `zarr.Group`.
+
+        Parameters
+        ----------
+        group : zarr.Group
+            A Zarr group that has valid OME-Zarr HCS metadata.
+        lazy :
+            If `True`, only read the plate metadata when creating the model.
+            Well groups are then read and validated from the Zarr group the
+            first time they are accessed with `get_well_group()` or `well_groups`.
+            If `False`, read the whole plate hierarchy.
+        well_cache_size :
+            If `lazy=True`, the maximum number of well groups that are kept in memory
+            after they have been read. The least recently accessed well groups
+            are removed from memory first.
+        trusted :
+            If `True`, create the model without validating the metadata.
+            If `lazy=True`, well groups are also read without validation.
+            Only use this for groups whose metadata is already known to be valid,
+            e.g., groups that were written by ome-zarr-models.
+
+        Notes
+        -----
+        If `lazy=True`, the `members` of the model are empty. Saving the model with
+        `to_zarr()`, dumping it with `model_dump()`, or comparing it to another
+        model first reads the whole plate hierarchy, so the result is the same as
+        for a model created with `lazy=False`.
+        """
+        if not lazy:
+            return super().from_zarr(group, trusted=trusted)
+
+        hcs = cls._from_attributes_and_members(
+            attributes=group.attrs.asdict(), members={}, trusted=trusted
+        )
+        hcs._zarr_group = group
+        hcs._trusted = trusted
+        hcs._well_cache = LRUCache(maxsize=well_cache_size)
+        return hcs
+
+    def _eager(self) -> Self:
+        """
+        Get this model with all of its members.
+
+        If this model was created with `from_zarr(..., lazy=True)`,
+        the whole plate hierarchy is read from the Zarr group.
+        """
+        if self._zarr_group is None:
+            return self
+        return type(self).from_zarr(self._zarr_group, trusted=self._trusted)
+
+    @model_serializer(mode="wrap")
+    def _serialize_eager(self, handler: SerializerFunctionWrapHandler) -> Any:
+        return handler(self._eager())
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare with all of the members, even if either model was lazily loaded.
+        """
+        if not isinstance(other, HCS):
+            return NotImplemented
+        return BaseGroupv04.__eq__(self._eager(), other._eager())
+
+    def to_zarr(self, store: Store, path: str, **kwargs: Any) -> zarr.Group:
+        """
+        Save this model to a Zarr store.
+
+        If this model was created with `from_zarr(..., lazy=True)`, the whole
+        plate hierarchy is read from the Zarr group it was created from first.
+
+        Parameters
+        ----------
+        store :
+            Store to save the group to.
+        path :
+            Path within the store to save the group to.
+        **kwargs :
+            Passed to `BaseGroupv04.to_zarr()`.
+        """
+        eager = self._eager()
+        return super(HCS, eager).to_zarr(store, path, **kwargs)
+
+    @classmethod
+    def new(
+        cls,
+        *,
+        rows: Sequence[str],
+        columns: Sequence[str],
+        images: Mapping[str, Sequence[Image]],
+        acquisitions: Sequence[Acquisition] | None = None,
+        image_acquisitions: Mapping[str, Sequence[int | None]] | None = None,
+        name: str | None = None,
+    ) -> "HCS":
+        """
+        Create a new `HCS` plate from a plate layout and the images in each well.
+
+        Parameters
+        ----------
+        rows :
+            Names of the rows in the plate.
+        columns :
+            Names of the columns in the plate.
+        images :
+            Images (fields of view) in each well, keyed by well path.
+            Well paths must be of the form `"{row}/{column}"`.
+            Wells without images should not be included.
+            Images in each well are stored at paths `"0"`, `"1"`, `"2"`, ...
+        acquisitions :
+            Acquisitions in the plate.
+        image_acquisitions :
+            Acquisition ID of each image in *images*, keyed by well path.
+            Wells that are not included have no acquisition IDs.
+        name :
+            Name of the plate.
+
+        Notes
+        -----
+        This class does not store or copy any array data. To save a new plate,
+        use `to_zarr(..., concurrent=True)` to write the metadata for the whole plate
+        at once, and then write data to the Zarr arrays in the store.
+        """
+        image_acquisitions = image_acquisitions or {}
+        plate = Plate(
+            acquisitions=None if acquisitions is None else list(acquisitions),
+            columns=[Column(name=column) for column in columns],
+            field_count=max((len(i) for i in images.values()), default=None),
+            name=name,
+            rows=[Row(name=row) for row in rows],
+            wells=_wells_in_plate(rows, columns, images),
+            version="0.4",
+        )
+
+        row_members: dict[str, dict[str, Well]] = {}
+        for well in plate.wells:
+            well_images = images[well.path]
+            well_acquisitions = image_acquisitions.get(
+                well.path, [None] * len(well_images)
+            )
+            if len(well_acquisitions) != len(well_images):
+                raise ValueError(
+                    f"Number of acquisition IDs for well '{well.path}' "
+                    f"({len(well_acquisitions)}) does not match number of images "
+                    f"({len(well_images)})."
+                )
+            row, column = well.path.split("/")
+            row_members.setdefault(row, {})[column] = Well(
+                attributes=WellAttrs(
+                    well=WellMeta(
+                        images=[
+                            WellImage(path=str(i), acquisition=acquisition)
+                            for i, acquisition in enumerate(well_acquisitions)
+                        ],
+                        version="0.4",
+                    )
+                ),
+                members={str(i): image for i, image in enumerate(well_images)},
+            )
+
+        return cls(
+            attributes=HCSAttrs(plate=plate),
+            members={
+                row: GroupSpec(attributes={}, members=members)
+                for row, members in row_members.items()
+            },
+        )
+
     @model_validator(mode="after")
     def _check_valid_acquisitions(self) -> Self:
         """
@@ -35,22 +238,23 @@ class HCS(BaseGroupv04[HCSAttrs]):
         if acquisitions is None:
             return self
 
-        valid_aq_ids = [aq.id for aq in acquisitions]
-
         for well_i, well_group in enumerate(self.well_groups):
-            for image_i, well_image in enumerate(well_group.attributes.well.images):
-                if well_image.acquisition is None:
-                    continue
-                elif well_image.acquisition not in valid_aq_ids:
-                    msg = (
-                        f"Acquisition ID '{well_image.acquisition} "
-                        f"(found in well {well_i}, {image_i}) "
-                        f"is not in list of plate acquisitions: {valid_aq_ids}"
-                    )
-                    raise ValueError(msg)
+            self._check_well_acquisitions(well_i, well_group)
 
         return self
 
+    def _check_well_acquisitions(self, well_i: int, well_group: Well) -> None:
+        """
+        Check a well's acquisition IDs are in list of plate acquisition ids.
+        """
+        acquisitions = self.attributes.plate.acquisitions
+        if acquisitions is None:
+            return
+
+        _check_well_acquisitions(
+            [aq.id for aq in acquisitions], well_i, well_group.attributes.well.images
+        )
+
     @property
     def n_wells(self) -> int:
         """
@@ -84,11 +288,19 @@ class HCS(BaseGroupv04[HCSAttrs]):
         i :
             Index of well group.
 
+        Notes
+        -----
+        If this model was created with `from_zarr(..., lazy=True)`, the well group
+        is read from Zarr the first time it is accessed.
+
         Raises
         ------
         WellGroupNotFoundError :
             If no Zarr group is found at the well path.
         """
+        if self._zarr_group is not None:
+            return self._get_well_group_lazy(i)
+
         if self.members is None:
             raise RuntimeError("Zarr group has no members")
 
@@ -112,3 +324,121 @@ class HCS(BaseGroupv04[HCSAttrs]):
             )
         group = row_group.members[col]
         return Well(attributes=group.attributes, members=group.members)
+
+    def get_well(self, row: str, column: str) -> Well:
+        """
+        Get a single well group from its row and column names.
+
+        Parameters
+        ----------
+        row :
+            Name of the row the well is in.
+        column :
+            Name of the column the well is in.
+
+        Raises
+        ------
+        ValueError :
+            If there is no well at the given row and column in the plate metadata.
+        WellGroupNotFoundError :
+            If no Zarr group is found at the well path.
+        """
+        return self.get_well_group(self.attributes.plate.get_well_index(row, column))
+
+    def wells_in_row(self, row: str) -> list[Well]:
+        """
+        Get all the well groups in a row, ordered by column.
+
+        Notes
+        -----
+        Only well groups that exist are returned.
+
+        Raises
+        ------
+        ValueError :
+            If the row is not in the plate metadata.
+        """
+        return self._existing_well_groups(
+            self.attributes.plate.well_indices_in_row(row)
+        )
+
+    def wells_in_column(self, column: str) -> list[Well]:
+        """
+        Get all the well groups in a column, ordered by row.
+
+        Notes
+        -----
+        Only well groups that exist are returned.
+
+        Raises
+        ------
+        ValueError :
+            If the column is not in the plate metadata.
+        """
+        return self._existing_well_groups(
+            self.attributes.plate.well_indices_in_column(column)
+        )
+
+    def _existing_well_groups(self, indices: list[int]) -> list[Well]:
+        wells = []
+        for i in indices:
+            try:
+                wells.append(self.get_well_group(i))
+            except WellGroupNotFoundError:
+                continue
+        return wells
+
+    def validate_all(
+        self, *, executor: Executor | None = None
+    ) -> dict[str, WellValidationResult]:
+        """
+        Validate all the well groups in this plate, and all the images within them.
+
+        Unlike creating a `HCS` object, this does not stop at the first
+        error, and instead returns a report of errors for every well.
+        It is most useful on a plate loaded with `from_zarr(..., lazy=True)`
+        or `from_zarr(..., trusted=True)`,
+        where the well groups have not already been validated.
+
+        Parameters
+        ----------
+        executor :
+            A `concurrent.futures` executor to run validation tasks on.
+            Each well group, and each image within a well group,
+            are validated in separate tasks.
+            If `None`, validation is run serially.
+
+        Returns
+        -------
+        dict[str, WellValidationResult]
+            A validation result for each well, keyed by well path.
+        """
+        return validate_plate(self, executor=executor)
+
+    def _get_well_group_lazy(self, i: int) -> Well:
+        """
+        Get a single well group, reading it from the Zarr group if it is not cached.
+        """
+        assert self._zarr_group is not None
+        assert self._well_cache is not None
+        if (well_group := self._well_cache.get(i)) is not None:
+            return well_group
+
+        well_path = self.attributes.plate.wells[i].path
+        # Indexing the group (instead of opening a new group) uses consolidated
+        # metadata if it is present
+        try:
+            group = self._zarr_group[well_path]
+        except KeyError as e:
+            raise WellGroupNotFoundError(
+                f"No Zarr group found at well path '{well_path}'"
+            ) from e
+        if not isinstance(group, zarr.Group):
+            raise WellGroupNotFoundError(
+                f"Node at well path '{well_path}' is not a Zarr group"
+            )
+        well_group = Well.from_zarr(group, trusted=self._trusted)
+        if not self._trusted:
+            self._check_well_acquisitions(i, well_group)
+        self._well_cache.put(i, well_group)
+        return well_group
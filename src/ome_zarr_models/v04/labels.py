@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+# Import needed for pydantic type resolution
+import pydantic_zarr  # noqa: F401
 from pydantic import Field
 
 from ome_zarr_models.base import BaseAttrs
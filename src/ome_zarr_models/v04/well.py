@@ -5,6 +5,9 @@ For reference, see the [well section of the OME-Zarr specification](https://ngff
 from collections.abc import Generator
 from typing import TYPE_CHECKING
 
+# Import needed for pydantic type resolution
+import pydantic_zarr  # noqa: F401
+
 from ome_zarr_models.common.well import WellAttrs
 from ome_zarr_models.v04.base import BaseGroupv04
 from ome_zarr_models.v04.image import Image
@@ -1,7 +1,35 @@
-from ome_zarr_models.v05.hcs import HCS
-from ome_zarr_models.v05.image import Image
-from ome_zarr_models.v05.image_label import ImageLabel
-from ome_zarr_models.v05.labels import Labels
-from ome_zarr_models.v05.well import Well
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ome_zarr_models.v05.hcs import HCS
+    from ome_zarr_models.v05.image import Image
+    from ome_zarr_models.v05.image_label import ImageLabel
+    from ome_zarr_models.v05.labels import Labels
+    from ome_zarr_models.v05.well import Well
 
 __all__ = ["HCS", "Image", "ImageLabel", "Labels", "Well"]
+
+# Group classes are only imported when they are first accessed, so importing
+# a single module from this package does not import every group class.
+_LAZY_ATTRIBUTES = {
+    "HCS": "ome_zarr_models.v05.hcs",
+    "Image": "ome_zarr_models.v05.image",
+    "ImageLabel": "ome_zarr_models.v05.image_label",
+    "Labels": "ome_zarr_models.v05.labels",
+    "Well": "ome_zarr_models.v05.well",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
@@ -3,6 +3,7 @@ from ome_zarr_models.common.coordinate_transformations import (
     PathScale,
     PathTranslation,
     ScaleTransform,
+    ScaleTranslation,
     TranslationTransform,
     VectorScale,
     VectorTransform,
@@ -14,6 +15,7 @@ __all__ = [
     "PathScale",
     "PathTranslation",
     "ScaleTransform",
+    "ScaleTranslation",
     "TranslationTransform",
     "VectorScale",
     "VectorTransform",
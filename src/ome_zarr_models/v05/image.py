@@ -1,15 +1,40 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Executor
 from typing import Any, Self
 
+import numpy as np
+import numpy.typing as npt
+
 # Import needed for pydantic type resolution
 import pydantic_zarr  # noqa: F401
 import zarr
+import zarr.api.asynchronous
 import zarr.errors
-from pydantic import Field, JsonValue, model_validator
-from pydantic_zarr.v3 import AnyArraySpec, AnyGroupSpec, GroupSpec
-
+from pydantic import Field, JsonValue, field_validator, model_validator
+from pydantic_zarr.v3 import AnyArraySpec, AnyGroupSpec, ArraySpec, GroupSpec
+from zarr.abc.store import Store
+from zarr.core.sync import sync
+
+from ome_zarr_models._utils import (
+    add_member,
+    construct_model,
+    get_member,
+    open_group_async,
+)
+from ome_zarr_models.common.cache import cached_from_zarr
 from ome_zarr_models.common.coordinate_transformations import _build_transforms
-from ome_zarr_models.common.validation import check_array_path
+from ome_zarr_models.common.instrumentation import (
+    instrumented_from_zarr,
+    instrumented_from_zarr_async,
+)
+from ome_zarr_models.common.pyramid import (
+    DownsampleMethod,
+    default_downsample_factors,
+    pyramid_shapes,
+    pyramid_transforms,
+    write_pyramid,
+)
+from ome_zarr_models.common.validation import check_array_paths_async
 from ome_zarr_models.v05.axes import Axis
 from ome_zarr_models.v05.base import BaseGroupv05, BaseOMEAttrs, BaseZarrAttrs
 from ome_zarr_models.v05.labels import Labels
@@ -36,7 +61,11 @@ class Image(BaseGroupv05[ImageAttrs]):
     """
 
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    @cached_from_zarr
+    @instrumented_from_zarr
+    def from_zarr(  # type: ignore[override]
+        cls, group: zarr.Group, *, trusted: bool = False
+    ) -> Self:
         """
         Create an OME-Zarr image model from a `zarr.Group`.
 
@@ -44,35 +73,67 @@ class Image(BaseGroupv05[ImageAttrs]):
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image metadata.
+        trusted :
+            If `True`, create the model without validating the metadata.
+            Only use this for groups whose metadata is already known to be valid,
+            e.g., groups that were written by ome-zarr-models.
+        """
+        return sync(cls.from_zarr_async(group, trusted=trusted))
+
+    @classmethod
+    @instrumented_from_zarr_async
+    async def from_zarr_async(cls, group: zarr.Group, *, trusted: bool = False) -> Self:
+        """
+        Asynchronously create an OME-Zarr image model from a `zarr.Group`.
+
+        The metadata for all the arrays in the image are fetched concurrently.
+
+        Parameters
+        ----------
+        group : zarr.Group
+            A Zarr group that has valid OME-Zarr image metadata.
+        trusted :
+            If `True`, create the model without validating the metadata.
         """
         # on unlistable storage backends, the members of this group will be {}
         group_spec: GroupSpec[dict[str, Any], Any] = GroupSpec.from_zarr(group, depth=0)
 
         if "ome" not in group_spec.attributes:
             raise RuntimeError(f"Did not find 'ome' key in {group} attributes")
-        multi_meta = ImageAttrs.model_validate(group_spec.attributes["ome"])
-        members_tree_flat: dict[str, AnyGroupSpec | AnyArraySpec] = {}
-        for multiscale in multi_meta.multiscales:
-            for dataset in multiscale.datasets:
-                array_path = f"{group.path}/{dataset.path}"
-                array_spec = check_array_path(
-                    group, array_path, expected_zarr_version=3
-                )
-                members_tree_flat["/" + dataset.path] = array_spec
+
+        if trusted:
+            multi_meta = construct_model(ImageAttrs, group_spec.attributes["ome"])
+        else:
+            multi_meta = ImageAttrs.model_validate(group_spec.attributes["ome"])
+        dataset_paths = [
+            dataset.path
+            for multiscale in multi_meta.multiscales
+            for dataset in multiscale.datasets
+        ]
+        array_specs = await check_array_paths_async(
+            group,
+            [f"{group.path}/{path}" for path in dataset_paths],
+            expected_zarr_version=3,
+        )
+        members: dict[str, AnyGroupSpec | AnyArraySpec] = {}
+        for path, array_spec in zip(dataset_paths, array_specs, strict=True):
+            add_member(members, path, array_spec, group_cls=GroupSpec)
 
         try:
-            labels_group = zarr.open_group(store=group.store_path / "labels", mode="r")
-            labels = Labels.from_zarr(labels_group)
-            # members_tree_flat["/labels"] = labels
-            labels_flat = labels.to_flat()
-            for path in labels_flat:
-                members_tree_flat[f"/labels{path}"] = labels_flat[path]
+            labels_group = await open_group_async(group, "labels")
+            labels = await Labels.from_zarr_async(labels_group, trusted=trusted)
+            add_member(members, "labels", labels, group_cls=GroupSpec)
 
         except zarr.errors.GroupNotFoundError:
             pass
 
-        members_normalized: AnyGroupSpec = GroupSpec.from_flat(members_tree_flat)
-        return cls(attributes=group_spec.attributes, members=members_normalized.members)
+        # The OME attributes and the labels have already been validated,
+        # so pass the models in directly to stop them being validated again
+        return cls._from_attributes_and_members(
+            attributes={**group_spec.attributes, "ome": multi_meta},
+            members=members,
+            trusted=trusted,
+        )
 
     @classmethod
     def new(
@@ -123,6 +184,7 @@ class Image(BaseGroupv05[ImageAttrs]):
         This class does not store or copy any array data. To save array data,
         first write this class to a Zarr store, and then write data to the Zarr
         arrays in that store.
+        To create an image and write array data in one step, use `from_array`.
         """
         if len(array_specs) != len(paths):
             raise ValueError(
@@ -179,6 +241,157 @@ class Image(BaseGroupv05[ImageAttrs]):
             ),
         )
 
+    @classmethod
+    def from_array(
+        cls,
+        source: npt.NDArray[Any] | zarr.Array[Any],
+        *,
+        store: Store,
+        path: str,
+        axes: Sequence[Axis],
+        chunks: Sequence[int],
+        scale: Sequence[float] | None = None,
+        translation: Sequence[float] | None = None,
+        downsample: Sequence[int] | None = None,
+        levels: int | None = None,
+        method: DownsampleMethod = "mean",
+        name: str | None = None,
+        overwrite: bool = False,
+        executor: Executor | None = None,
+    ) -> "Image":
+        """
+        Create a new multiscale image in a Zarr store from array data.
+
+        The source data is copied to the full resolution level of the image,
+        and each lower resolution level is generated by downsampling the level
+        above it. Data is streamed one chunk at a time, so images that are
+        larger than memory can be written.
+
+        Parameters
+        ----------
+        source :
+            Full resolution image data. This can be a NumPy array, a NumPy memmap,
+            a Zarr array, or any other array that supports slicing with NumPy
+            indexing and has `shape` and `dtype` attributes.
+        store :
+            Store to write the image to.
+        path :
+            Path within the store to write the image to.
+        axes :
+            `Axis` objects describing the axes of the image.
+        chunks :
+            Chunk shape of every level in the image.
+        scale :
+            Scale of the full resolution level. Defaults to 1 along each axis.
+        translation :
+            Translation of the full resolution level.
+            Defaults to 0 along each axis.
+        downsample :
+            Downsampling factor along each axis between each level.
+            Defaults to 2 along space axes, and 1 along all other axes.
+        levels :
+            Number of levels in the image (including the full resolution level).
+            If `None`, levels are added until the lowest resolution level
+            fits in a single chunk along every axis that is downsampled.
+        method :
+            Downsampling method. This is also saved as the type of the multiscales.
+        name :
+            A name for the multiscale collection.
+        overwrite :
+            If `True`, overwrite any existing group or array at *path*.
+        executor :
+            Executor to downsample and write chunks with.
+            If not given, chunks are processed one at a time.
+            See [ome_zarr_models.common.pyramid.write_pyramid][] for details.
+
+        Notes
+        -----
+        The scale and translation of each level are calculated from the
+        full resolution scale and translation, and the downsampling factors.
+        """
+        if downsample is None:
+            downsample = default_downsample_factors(axes)
+        image = cls._new_pyramid(
+            source,
+            axes=axes,
+            chunks=chunks,
+            scale=scale,
+            translation=translation,
+            downsample=downsample,
+            levels=levels,
+            method=method,
+            name=name,
+        )
+        group = image.to_zarr(store, path, overwrite=overwrite)
+        write_pyramid(
+            source,
+            [group[dataset.path] for dataset in image.datasets[0]],  # type: ignore[misc]
+            factors=downsample,
+            method=method,
+            executor=executor,
+        )
+        return image
+
+    @classmethod
+    def _new_pyramid(
+        cls,
+        source: npt.NDArray[Any] | zarr.Array[Any],
+        *,
+        axes: Sequence[Axis],
+        chunks: Sequence[int],
+        scale: Sequence[float] | None,
+        translation: Sequence[float] | None,
+        downsample: Sequence[int],
+        levels: int | None,
+        method: DownsampleMethod,
+        name: str | None,
+    ) -> "Image":
+        """
+        Create the metadata for a multiscale image pyramid of some source data.
+        """
+        ndim = len(source.shape)
+        if scale is None:
+            scale = [1.0] * ndim
+        if translation is None:
+            translation = [0.0] * ndim
+        shapes = pyramid_shapes(source.shape, downsample, levels=levels, chunks=chunks)
+        scales, translations = pyramid_transforms(
+            scale=scale,
+            translation=translation,
+            factors=downsample,
+            n_levels=len(shapes),
+            method=method,
+        )
+        paths = [str(i) for i in range(len(shapes))]
+        fill = np.zeros((), dtype=source.dtype)
+        array_specs: list[AnyArraySpec] = [
+            ArraySpec.from_array(
+                # Broadcast a scalar to the level shape, so the array spec can be
+                # created without allocating any memory
+                np.broadcast_to(fill, shape),
+                chunk_grid={
+                    "name": "regular",
+                    "configuration": {
+                        "chunk_shape": tuple(
+                            min(chunk, size)
+                            for chunk, size in zip(chunks, shape, strict=True)
+                        )
+                    },
+                },
+                dimension_names=[axis.name for axis in axes],
+            )
+            for shape in shapes
+        ]
+        return cls.new(
+            array_specs=array_specs,
+            paths=paths,
+            axes=axes,
+            scales=scales,
+            translations=translations,
+            name=name,
+            multiscale_type=method,
+        )
+
     @model_validator(mode="after")
     def _check_arrays_compatible(self) -> Self:
         """
@@ -190,16 +403,15 @@ class Image(BaseGroupv05[ImageAttrs]):
               metadata.
         """
         multimeta = self.ome_attributes.multiscales
-        flat_self = self.to_flat()
 
         for multiscale in multimeta:
             multiscale_ndim = len(multiscale.axes)
             multiscale_dim_names = tuple(a.name for a in multiscale.axes)
             for dataset in multiscale.datasets:
                 try:
-                    maybe_arr: AnyArraySpec | AnyGroupSpec = flat_self[
-                        "/" + dataset.path.lstrip("/")
-                    ]
+                    maybe_arr: AnyArraySpec | AnyGroupSpec = get_member(
+                        self, dataset.path
+                    )
                 except KeyError as e:
                     msg = (
                         f"The multiscale metadata references an array that does not "
@@ -242,6 +454,27 @@ class Image(BaseGroupv05[ImageAttrs]):
 
         return self
 
+    @field_validator("members", mode="after")
+    @classmethod
+    def _labels_member(
+        cls, members: Mapping[str, Any] | None
+    ) -> Mapping[str, Any] | None:
+        """
+        Convert the labels group in the members to a `Labels` model.
+
+        This gives validated images the same types of members as images created
+        with `from_zarr()`.
+        """
+        if members is None or "labels" not in members:
+            return members
+        labels_group = members["labels"]
+        if isinstance(labels_group, Labels) or not isinstance(labels_group, GroupSpec):
+            return members
+        labels = Labels(
+            attributes=labels_group.attributes, members=labels_group.members
+        )
+        return {**members, "labels": labels}
+
     @model_validator(mode="after")
     def _check_label_multiscales(self) -> Self:
         """
@@ -288,6 +521,8 @@ class Image(BaseGroupv05[ImageAttrs]):
             return None
 
         labels_group = self.members["labels"]
+        if isinstance(labels_group, Labels):
+            return labels_group
         if not isinstance(labels_group, GroupSpec):
             raise ValueError("Node at path 'labels' is not a group")
 
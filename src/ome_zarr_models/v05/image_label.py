@@ -1,13 +1,41 @@
-from typing import Self
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from typing import Any, Self
+
+import numpy as np
+import numpy.typing as npt
 
 # Import needed for pydantic type resolution
 import pydantic_zarr  # noqa: F401
 import zarr
-from pydantic import Field
+from pydantic import Field, PrivateAttr
+from zarr.abc.store import Store
+from zarr.core.sync import sync
 
-from ome_zarr_models.v05.base import BaseGroupv05, BaseOMEAttrs
+from ome_zarr_models._utils import fields_equal, set_field_values
+from ome_zarr_models.common.cache import cached_from_zarr
+from ome_zarr_models.common.instrumentation import (
+    instrumented_from_zarr,
+    instrumented_from_zarr_async,
+    uninstrumented_group,
+)
+from ome_zarr_models.common.label_index import (
+    LabelIndex,
+    compute_label_index,
+    read_label_index,
+    write_label_index,
+)
+from ome_zarr_models.common.pyramid import (
+    LABEL_DOWNSAMPLE_METHODS,
+    DownsampleMethod,
+    default_downsample_factors,
+    write_pyramid,
+)
+from ome_zarr_models.v05.axes import Axis
+from ome_zarr_models.v05.base import BaseGroupv05, BaseOMEAttrs, BaseZarrAttrs
 from ome_zarr_models.v05.image import Image
 from ome_zarr_models.v05.image_label_types import Label
+from ome_zarr_models.v05.labels import VALID_DTYPES
 from ome_zarr_models.v05.multiscales import Multiscale
 
 __all__ = ["ImageLabel", "ImageLabelAttrs"]
@@ -29,8 +57,15 @@ class ImageLabel(
     An OME-Zarr image label dataset.
     """
 
+    _zarr_group: zarr.Group | None = PrivateAttr(default=None)
+    _label_index: LabelIndex | None = PrivateAttr(default=None)
+
     @classmethod
-    def from_zarr(cls, group: zarr.Group) -> Self:  # type: ignore[override]
+    @cached_from_zarr
+    @instrumented_from_zarr
+    def from_zarr(  # type: ignore[override]
+        cls, group: zarr.Group, *, trusted: bool = False
+    ) -> Self:
         """
         Create an instance of an OME-Zarr image from a `zarr.Group`.
 
@@ -38,7 +73,232 @@ class ImageLabel(
         ----------
         group : zarr.Group
             A Zarr group that has valid OME-Zarr image label metadata.
+        trusted :
+            If `True`, create the model without validating the metadata.
+            Only use this for groups whose metadata is already known to be valid,
+            e.g., groups that were written by ome-zarr-models.
+        """
+        return sync(cls.from_zarr_async(group, trusted=trusted))
+
+    @classmethod
+    @instrumented_from_zarr_async
+    async def from_zarr_async(cls, group: zarr.Group, *, trusted: bool = False) -> Self:
+        """
+        Asynchronously create an instance of an OME-Zarr image label from
+        a `zarr.Group`.
+
+        The metadata for all the arrays in the image label are fetched concurrently.
+
+        Parameters
+        ----------
+        group : zarr.Group
+            A Zarr group that has valid OME-Zarr image label metadata.
+        trusted :
+            If `True`, create the model without validating the metadata.
+        """
+        # Use Image.from_zarr_async() to validate multiscale metadata. The validated
+        # multiscales are re-used, so only the image-label metadata is validated here.
+        image = await Image.from_zarr_async(group, trusted=trusted)
+        image_label = cls._from_attributes_and_members(
+            attributes={"ome": set_field_values(image.ome_attributes)},
+            members=image.members,
+            trusted=trusted,
+        )
+        # Image and Labels models keep the image label models they load, so don't
+        # keep a group with an instrumented store, to make loaded models the same
+        # with or without instrumentation
+        image_label._zarr_group = uninstrumented_group(group)
+        return image_label
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare the metadata and members of two image labels.
+
+        The group an image label was loaded from, and any label index read from
+        that group, are not compared.
+        """
+        if not isinstance(other, ImageLabel):
+            return NotImplemented
+        return fields_equal(self, other)
+
+    @property
+    def label_index(self) -> LabelIndex | None:
+        """
+        Statistics for each label value in the full resolution level.
+
+        This is read from the label index array that `write_label_index()` saves
+        in the image label group, the first time it is found.
+        Looking up the statistics for a single label value is then a
+        constant-time operation.
+
+        `None` if the image label group does not have a label index.
+
+        Raises
+        ------
+        ValueError
+            If this model was not created with `from_zarr()`, so there is no
+            group to read the label index from.
+            Use [ome_zarr_models.common.label_index.read_label_index][]
+            to read the label index from a group instead.
+        """
+        if self._label_index is None:
+            if self._zarr_group is None:
+                raise ValueError(
+                    "The label index can only be read from an image label that "
+                    "was created with from_zarr(). Use "
+                    "ome_zarr_models.common.label_index.read_label_index() to read "
+                    "it from a group."
+                )
+            self._label_index = read_label_index(self._zarr_group)
+        return self._label_index
+
+    def write_label_index(
+        self, group: zarr.Group | None = None, *, executor: Executor | None = None
+    ) -> LabelIndex:
+        """
+        Compute statistics for each label value, and save them in the image label group.
+
+        The full resolution level is scanned one chunk at a time, and the voxel count,
+        bounding box and centroid of each label value are saved to a compact array
+        at `ome_zarr_models.common.label_index.LABEL_INDEX_PATH` in the group.
+
+        Parameters
+        ----------
+        group :
+            Image label group to read label data from, and save the label index to.
+            Defaults to the group that this model was created from with `from_zarr()`.
+            The `label_index` of this model is only updated if this is not given.
+        executor :
+            Executor to scan chunks with.
+            If `None`, chunks are scanned one at a time.
+            See [ome_zarr_models.common.label_index.compute_label_index][]
+            for details.
+        """
+        own_group = group is None
+        if group is None:
+            if self._zarr_group is None:
+                raise ValueError(
+                    "A group must be given if the image label was not created "
+                    "with from_zarr()."
+                )
+            group = self._zarr_group
+        array = group[self.attributes.ome.multiscales[0].datasets[0].path]
+        if not isinstance(array, zarr.Array):
+            raise RuntimeError("Node at full resolution path is not an array")
+        label_index = compute_label_index(array, executor=executor)
+        write_label_index(group, label_index)
+        if own_group:
+            # Replace any label index that was read from the group before
+            self._label_index = label_index
+        return label_index
+
+    @classmethod
+    def from_array(
+        cls,
+        source: npt.NDArray[Any] | zarr.Array[Any],
+        *,
+        store: Store,
+        path: str,
+        axes: Sequence[Axis],
+        chunks: Sequence[int],
+        scale: Sequence[float] | None = None,
+        translation: Sequence[float] | None = None,
+        downsample: Sequence[int] | None = None,
+        levels: int | None = None,
+        method: DownsampleMethod = "mode",
+        image_label: Label | None = None,
+        name: str | None = None,
+        overwrite: bool = False,
+        executor: Executor | None = None,
+    ) -> Self:
+        """
+        Create a new multiscale image label in a Zarr store from array data.
+
+        This works in the same way as `Image.from_array`, but only allows
+        downsampling methods that keep the label values intact.
+
+        Parameters
+        ----------
+        source :
+            Full resolution label data, with an integer data type.
+        store :
+            Store to write the image label to.
+        path :
+            Path within the store to write the image label to.
+        axes :
+            `Axis` objects describing the axes of the image label.
+        chunks :
+            Chunk shape of every level in the image label.
+        scale :
+            Scale of the full resolution level. Defaults to 1 along each axis.
+        translation :
+            Translation of the full resolution level.
+            Defaults to 0 along each axis.
+        downsample :
+            Downsampling factor along each axis between each level.
+            Defaults to 2 along space axes, and 1 along all other axes.
+        levels :
+            Number of levels in the image label (including the full resolution
+            level). If `None`, levels are added until the lowest resolution level
+            fits in a single chunk along every axis that is downsampled.
+        method :
+            Downsampling method. Must be `"mode"` or `"nearest"`.
+        image_label :
+            Image label metadata. Optional.
+        name :
+            A name for the multiscale collection.
+        overwrite :
+            If `True`, overwrite any existing group or array at *path*.
+        executor :
+            Executor to downsample and write chunks with.
+            If not given, chunks are processed one at a time.
+            See [ome_zarr_models.common.pyramid.write_pyramid][] for details.
+
+        Raises
+        ------
+        ValueError
+            If the data type of *source* is not a valid label data type, or
+            *method* does not keep label values intact.
         """
-        # Use Image.from_zarr() to validate multiscale metadata
-        image = Image.from_zarr(group)
-        return cls(attributes=image.attributes.model_dump(), members=image.members)
+        if np.dtype(source.dtype) not in VALID_DTYPES:
+            raise ValueError(
+                f"Data type of labels is not valid. Got {source.dtype}, "
+                f"should be one of {[str(x) for x in VALID_DTYPES]}."
+            )
+        if method not in LABEL_DOWNSAMPLE_METHODS:
+            raise ValueError(
+                f"Downsampling method must be one of {list(LABEL_DOWNSAMPLE_METHODS)} "
+                f"for labels. Got '{method}'."
+            )
+        if downsample is None:
+            downsample = default_downsample_factors(axes)
+        image = Image._new_pyramid(
+            source,
+            axes=axes,
+            chunks=chunks,
+            scale=scale,
+            translation=translation,
+            downsample=downsample,
+            levels=levels,
+            method=method,
+            name=name,
+        )
+        label = cls(
+            attributes=BaseZarrAttrs(
+                ome=ImageLabelAttrs(
+                    image_label=image_label,
+                    multiscales=image.attributes.ome.multiscales,
+                    version="0.5",
+                )
+            ),
+            members=image.members,
+        )
+        group = label.to_zarr(store, path, overwrite=overwrite)
+        write_pyramid(
+            source,
+            [group[dataset.path] for dataset in image.datasets[0]],  # type: ignore[misc]
+            factors=downsample,
+            method=method,
+            executor=executor,
+        )
+        return label
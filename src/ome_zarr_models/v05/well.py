@@ -1,9 +1,16 @@
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+
 # Import needed for pydantic type resolution
 import pydantic_zarr  # noqa: F401
 
 from ome_zarr_models.v05.base import BaseGroupv05, BaseOMEAttrs
+from ome_zarr_models.v05.image import Image
 from ome_zarr_models.v05.well_types import WellMeta
 
+if TYPE_CHECKING:
+    from pydantic_zarr.v3 import AnyGroupSpec
+
 __all__ = ["Well", "WellAttrs"]
 
 
@@ -19,3 +26,33 @@ class Well(BaseGroupv05[WellAttrs]):
     """
     An OME-Zarr well dataset.
     """
+
+    def get_image(self, i: int) -> Image:
+        """
+        Get a single image from this well.
+        """
+        image = self.ome_attributes.well.images[i]
+        image_path = image.path
+        image_path_parts = image_path.split("/")
+        group: AnyGroupSpec = self  # type: ignore[assignment]
+        for part in image_path_parts:
+            if group.members is None:
+                raise RuntimeError(f"{group.members=}")
+            group = group.members[part]  # type: ignore[assignment]
+
+        return Image(attributes=group.attributes, members=group.members)
+
+    @property
+    def n_images(self) -> int:
+        """
+        Number of images.
+        """
+        return len(self.ome_attributes.well.images)
+
+    @property
+    def images(self) -> Generator[Image, None, None]:
+        """
+        Generator for all images in this well.
+        """
+        for i in range(self.n_images):
+            yield self.get_image(i)
@@ -233,6 +233,7 @@ def test_image_with_labels(store: Store) -> None:
     assert image.labels.attributes.ome == LabelsAttrs(
         version="0.6", labels=["cell_space_segmentation"]
     )
+    assert Image.model_validate(image.model_dump()) == image
 
 
 def test_image_with_labels_mismatch_multiscales(store: Store) -> None:
@@ -279,3 +280,19 @@ def test_image_with_labels_mismatch_multiscales(store: Store) -> None:
         ),
     ):
         Image.from_zarr(zarr_group)
+
+
+def test_image_trusted(store: Store) -> None:
+    zarr_group = json_to_zarr_group(json_fname="image_example.json", store=store)
+    for path in ["0", "1", "2"]:
+        zarr_group.create_array(
+            path,
+            shape=(1, 1, 1, 1, 1),
+            dtype="uint8",
+            dimension_names=["t", "c", "z", "y", "x"],
+        )
+
+    image = Image.from_zarr(zarr_group, trusted=True)
+    assert image == Image.from_zarr(zarr_group)
+    assert image.model_dump_json() == Image.from_zarr(zarr_group).model_dump_json()
+    assert isinstance(image.attributes.ome, ImageAttrs)
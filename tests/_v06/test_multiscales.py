@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -5,6 +6,7 @@ from ome_zarr_models._v06.axes import Axis
 from ome_zarr_models._v06.coordinate_transformations import (
     CoordinateSystem,
     CoordinateTransformation,
+    Identity,
     SequenceTransform,
     VectorScale,
     VectorTranslation,
@@ -240,6 +242,133 @@ def test_ensure_ordered_scales() -> None:
         )
 
 
+def _multiscale_with_transforms() -> Multiscale:
+    axes = [Axis(name="j"), Axis(name="i")]
+    return Multiscale(
+        coordinateSystems=(
+            CoordinateSystem(name="physical", axes=axes),
+            CoordinateSystem(name="shifted", axes=axes),
+            CoordinateSystem(name="aligned", axes=axes),
+            CoordinateSystem(name="unconnected", axes=axes),
+        ),
+        datasets=(
+            Dataset(
+                path="0",
+                coordinateTransformations=[
+                    VectorScale(scale=[2.0, 2.0], input="/0", output="physical")
+                ],
+            ),
+            Dataset(
+                path="1",
+                coordinateTransformations=[
+                    VectorScale(scale=[4.0, 4.0], input="/1", output="physical")
+                ],
+            ),
+        ),
+        coordinateTransformations=(
+            SequenceTransform(
+                transformations=[
+                    VectorScale(scale=[1.0, 0.5]),
+                    VectorTranslation(translation=[1.0, 2.0]),
+                ],
+                input="physical",
+                output="shifted",
+            ),
+            Identity(input="aligned", output="shifted"),
+        ),
+    )
+
+
+def test_get_transform() -> None:
+    multiscale = _multiscale_with_transforms()
+
+    transform = multiscale.get_transform("physical", "shifted")
+    np.testing.assert_equal(transform.scale, [1.0, 0.5])
+    np.testing.assert_equal(transform.translation, [1.0, 2.0])
+    # Transforms are cached
+    assert multiscale.get_transform("physical", "shifted") is transform
+
+    # Chain of transforms, from array coordinates
+    transform = multiscale.get_transform("/1", "shifted")
+    np.testing.assert_equal(transform.scale, [4.0, 2.0])
+    np.testing.assert_equal(transform.translation, [1.0, 2.0])
+    np.testing.assert_equal(transform.apply(np.array([[1.0, 1.0]])), [[5.0, 4.0]])
+
+    # Chain of transforms, including inverse and identity transforms
+    transform = multiscale.get_transform("aligned", "/0")
+    np.testing.assert_equal(transform.scale, [0.5, 1.0])
+    np.testing.assert_equal(transform.translation, [-0.5, -2.0])
+    assert transform == multiscale.get_transform("/0", "aligned").inverse()
+
+    # Only identity transforms
+    transform = multiscale.get_transform("unconnected", "unconnected")
+    np.testing.assert_equal(transform.to_affine(), np.eye(3))
+
+
+def test_get_transform_errors() -> None:
+    multiscale = _multiscale_with_transforms()
+    with pytest.raises(ValueError, match="No coordinate system with name 'missing'"):
+        multiscale.get_transform("physical", "missing")
+    with pytest.raises(
+        ValueError,
+        match="No chain of coordinate transformations from 'physical' to 'unconnected'",
+    ):
+        multiscale.get_transform("physical", "unconnected")
+
+
+def test_get_coordinate_system() -> None:
+    multiscale = _multiscale_with_transforms()
+    assert multiscale.get_coordinate_system("shifted").name == "shifted"
+    with pytest.raises(ValueError, match="No coordinate system with name missing"):
+        multiscale.get_coordinate_system("missing")
+
+
+def test_select_level() -> None:
+    multiscale = Multiscale(
+        coordinateSystems=(
+            CoordinateSystem(
+                name="physical",
+                axes=[
+                    Axis(name="c", type="channel"),
+                    Axis(name="y", type="space"),
+                    Axis(name="x", type="space"),
+                ],
+            ),
+        ),
+        datasets=(
+            Dataset(
+                path="0",
+                coordinateTransformations=[
+                    VectorScale(scale=[1.0, 1.0, 1.0], input="/0", output="physical")
+                ],
+            ),
+            Dataset(
+                path="1",
+                coordinateTransformations=[
+                    SequenceTransform(
+                        transformations=[
+                            VectorScale(scale=[1.0, 2.0, 2.0]),
+                            VectorTranslation(translation=[0.0, 0.5, 0.5]),
+                        ],
+                        input="/1",
+                        output="physical",
+                    )
+                ],
+            ),
+        ),
+    )
+    assert multiscale.select_level(0.5) == 0
+    assert multiscale.select_level(2) == 1
+    assert multiscale.select_level([1, 2]) == 0
+    assert multiscale.level_for_viewport([[0, 0], [20, 20]], screen_px=10) == 1
+
+    # Selecting a level doesn't change equality
+    other = Multiscale.model_validate(multiscale.model_dump())
+    assert other == multiscale
+    other.select_level(1)
+    assert other == multiscale
+
+
 # TODO: all these tests have been copied over from v05, and needs to be adjusted
 # def test_ordered_multiscales() -> None:
 #     """
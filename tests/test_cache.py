@@ -0,0 +1,136 @@
+import os
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+import zarr
+from zarr.abc.store import Store
+from zarr.storage import LocalStore, MemoryStore
+
+from ome_zarr_models import open_ome_zarr
+from ome_zarr_models.common.cache import (
+    CacheInfo,
+    ModelCache,
+    disable_model_cache,
+    enable_model_cache,
+    get_model_cache,
+)
+from ome_zarr_models.v04.hcs import HCS
+from ome_zarr_models.v05.image import Image
+from tests.conftest import get_examples_path
+from tests.v05.conftest import json_to_dict, json_to_zarr_group
+
+
+@pytest.fixture
+def model_cache() -> Generator[ModelCache]:
+    yield enable_model_cache(maxsize=2)
+    disable_model_cache()
+
+
+def make_image_group(store: Store) -> zarr.Group:
+    zarr_group = json_to_zarr_group(json_fname="image_example.json", store=store)
+    for path in ["0", "1", "2"]:
+        zarr_group.create_array(
+            path,
+            shape=(1, 1, 1, 1, 1),
+            dtype="uint8",
+            dimension_names=["t", "c", "z", "y", "x"],
+        )
+    return zarr_group
+
+
+def test_cache_disabled_by_default() -> None:
+    assert get_model_cache() is None
+
+
+def test_cache_hit(model_cache: ModelCache) -> None:
+    assert get_model_cache() is model_cache
+    store = MemoryStore()
+    make_image_group(store)
+
+    image = Image.from_zarr(zarr.open_group(store, mode="r"))
+    assert model_cache.info() == CacheInfo(hits=0, misses=1, maxsize=2, currsize=1)
+
+    # Re-opening the group should give the same model
+    assert Image.from_zarr(zarr.open_group(store, mode="r")) is image
+    assert open_ome_zarr(zarr.open_group(store, mode="r")) is image
+    assert model_cache.info() == CacheInfo(hits=2, misses=1, maxsize=2, currsize=1)
+
+    model_cache.clear()
+    assert model_cache.info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_cache_invalidated_on_attribute_change(model_cache: ModelCache) -> None:
+    store = MemoryStore()
+    zarr_group = make_image_group(store)
+    image = Image.from_zarr(zarr_group)
+
+    attrs = json_to_dict(json_fname="image_example.json")
+    attrs["ome"]["multiscales"][0]["name"] = "new_name"
+    zarr_group.attrs.put(attrs)
+
+    new_image = Image.from_zarr(zarr.open_group(store, mode="r"))
+    assert new_image is not image
+    assert new_image.ome_attributes.multiscales[0].name == "new_name"
+    assert model_cache.info().misses == 2
+
+
+def test_cache_not_invalidated_on_mtime_change(
+    model_cache: ModelCache, tmp_path: Path
+) -> None:
+    # Only the contents of metadata documents are checked
+    store = LocalStore(tmp_path)
+    make_image_group(store)
+    image = Image.from_zarr(zarr.open_group(store, mode="r"))
+    assert Image.from_zarr(zarr.open_group(store, mode="r")) is image
+
+    metadata_path = tmp_path / "zarr.json"
+    mtime_ns = metadata_path.stat().st_mtime_ns
+    os.utime(metadata_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    assert Image.from_zarr(zarr.open_group(store, mode="r")) is image
+    assert model_cache.info().misses == 1
+
+
+@pytest.mark.parametrize("store_type", ["local", "memory"])
+def test_cache_invalidated_on_array_metadata_change(
+    model_cache: ModelCache, tmp_path: Path, store_type: str
+) -> None:
+    store = LocalStore(tmp_path) if store_type == "local" else MemoryStore()
+    make_image_group(store)
+    image = Image.from_zarr(zarr.open_group(store, mode="r"))
+    assert Image.from_zarr(zarr.open_group(store, mode="r")) is image
+
+    # Change the metadata of an array, without changing the group metadata
+    zarr.open_array(store, path="1").attrs["new_key"] = "new_value"
+
+    new_image = Image.from_zarr(zarr.open_group(store, mode="r"))
+    assert new_image is not image
+    assert new_image.members is not None
+    assert new_image.members["1"].attributes == {"new_key": "new_value"}
+    assert model_cache.info().misses == 2
+
+
+def test_cache_eviction(model_cache: ModelCache) -> None:
+    stores = [MemoryStore() for _ in range(3)]
+    for store in stores:
+        make_image_group(store)
+    images = [Image.from_zarr(zarr.open_group(store, mode="r")) for store in stores]
+    assert model_cache.info().currsize == 2
+
+    # Least recently used model has been evicted
+    assert Image.from_zarr(zarr.open_group(stores[0], mode="r")) is not images[0]
+    assert Image.from_zarr(zarr.open_group(stores[2], mode="r")) is images[2]
+
+
+def test_cache_subclass_from_zarr(model_cache: ModelCache) -> None:
+    # HCS.from_zarr() calls BaseGroupv04.from_zarr(), which should
+    # not be counted as a second cache lookup
+    hcs_group = zarr.open_group(
+        get_examples_path(version="0.4") / "hcs_example.ome.zarr", mode="r"
+    )
+    hcs = HCS.from_zarr(hcs_group)
+    assert model_cache.info() == CacheInfo(hits=0, misses=1, maxsize=2, currsize=1)
+    assert HCS.from_zarr(hcs_group) is hcs
+    assert HCS.from_zarr(hcs_group, lazy=False) is hcs
+    # Different options to from_zarr() give a different model
+    assert HCS.from_zarr(hcs_group, lazy=True) is not hcs
@@ -0,0 +1,105 @@
+import re
+
+import numpy as np
+import pytest
+
+from ome_zarr_models.common.coordinate_transformations import (
+    Identity,
+    PathScale,
+    ScaleTranslation,
+    VectorScale,
+    VectorTranslation,
+)
+
+
+def test_from_transforms() -> None:
+    transform = ScaleTranslation.from_transforms(
+        [
+            VectorScale.build([2, 4]),
+            VectorTranslation.build([1, 1]),
+            Identity(type="identity"),
+            VectorScale.build([10, 10]),
+        ]
+    )
+    assert transform == ScaleTranslation([20, 40], [10, 10])
+    # Same as applying the transformations one at a time
+    np.testing.assert_array_equal(transform.apply([1, 1]), [30, 50])
+
+
+def test_from_transforms_path() -> None:
+    with pytest.raises(ValueError, match="defined by a path"):
+        ScaleTranslation.from_transforms([PathScale(type="scale", path="scale")])
+
+
+def test_from_transforms_inconsistent_ndim() -> None:
+    with pytest.raises(ValueError, match="inconsistent dimensionality"):
+        ScaleTranslation.from_transforms(
+            [VectorScale.build([1, 1]), VectorTranslation.build([1, 1, 1])]
+        )
+
+
+def test_apply() -> None:
+    transform = ScaleTranslation([0.5, 2, 4], [1, 2, 3])
+    rng = np.random.default_rng(seed=0)
+    points = rng.uniform(0, 100, size=(1000, 3))
+
+    physical = transform.apply(points)
+    np.testing.assert_allclose(physical, points * [0.5, 2, 4] + [1, 2, 3])
+    np.testing.assert_allclose(transform.apply_inverse(physical), points)
+    np.testing.assert_allclose(transform.inverse().apply(physical), points)
+
+    # Transform in place
+    out = points.copy()
+    assert transform.apply(out, out=out) is out
+    np.testing.assert_allclose(out, physical)
+
+
+def test_apply_wrong_ndim() -> None:
+    transform = ScaleTranslation([1, 1, 1])
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Dimensionality of points (2) does not match "
+            "dimensionality of transform (3)."
+        ),
+    ):
+        transform.apply(np.zeros((10, 2)))
+
+
+def test_then() -> None:
+    first = ScaleTranslation([2, 2], [1, 0])
+    second = ScaleTranslation([3, 1], [0, 5])
+    points = np.array([[1.0, 2.0], [3.0, 4.0]])
+    np.testing.assert_allclose(
+        first.then(second).apply(points), second.apply(first.apply(points))
+    )
+
+
+def test_to_affine() -> None:
+    transform = ScaleTranslation([2, 3], [4, 5])
+    affine = transform.to_affine()
+    np.testing.assert_array_equal(affine, [[2, 0, 4], [0, 3, 5], [0, 0, 1]])
+    point = np.array([1.0, 1.0])
+    np.testing.assert_array_equal(
+        (affine @ np.append(point, 1))[:-1], transform.apply(point)
+    )
+
+
+def test_bounding_boxes() -> None:
+    transform = ScaleTranslation([2, -1], [0, 10])
+    boxes = np.array([[[0, 0], [1, 2]], [[2, 2], [4, 3]]])
+    np.testing.assert_array_equal(
+        transform.apply_to_bounding_boxes(boxes),
+        [[[0, 8], [2, 10]], [[4, 7], [8, 8]]],
+    )
+    np.testing.assert_array_equal(
+        transform.apply_to_bounding_boxes(
+            transform.apply_to_bounding_boxes(boxes), inverse=True
+        ),
+        boxes,
+    )
+
+
+def test_inverse_zero_scale() -> None:
+    with pytest.raises(ValueError, match="zero scale factor"):
+        ScaleTranslation([0, 1]).inverse()
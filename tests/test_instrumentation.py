@@ -0,0 +1,147 @@
+import json
+import threading
+
+import zarr
+from zarr.abc.store import Store
+from zarr.storage import MemoryStore
+
+import ome_zarr_models
+from ome_zarr_models.common.instrumentation import (
+    LATENCY_BUCKETS,
+    InstrumentedStore,
+    StoreRecording,
+)
+from ome_zarr_models.v05.image import Image
+from ome_zarr_models.v05.labels import Labels
+from tests.v05.conftest import json_to_dict, json_to_zarr_group
+
+
+def make_image_with_labels(store: Store) -> zarr.Group:
+    zarr_group = json_to_zarr_group(json_fname="image_example.json", store=store)
+    labels_group = zarr_group.create_group(
+        "labels", attributes=json_to_dict(json_fname="labels_example.json")
+    )
+    image_label_group = labels_group.create_group(
+        "cell_space_segmentation",
+        attributes=json_to_dict(json_fname="image_label_example.json"),
+    )
+    for group in [zarr_group, image_label_group]:
+        for path in ["0", "1", "2"]:
+            group.create_array(
+                path,
+                shape=(1, 1, 1, 1, 1),
+                dtype="uint8",
+                dimension_names=["t", "c", "z", "y", "x"],
+            )
+    return zarr_group
+
+
+def test_instrument() -> None:
+    zarr_group = make_image_with_labels(MemoryStore())
+
+    with ome_zarr_models.instrument() as recording:
+        ome_zarr_models.open_ome_zarr(zarr_group)
+
+    image_loader = "ome_zarr_models.v05.image.Image"
+    labels_loader = "ome_zarr_models.v05.labels.Labels"
+    # ImageLabel.from_zarr() reads everything using Image.from_zarr(),
+    # so has no store operations of its own
+    assert set(recording.loaders) == {image_loader, labels_loader}
+    # Reading the metadata of the three image arrays, and opening the labels group
+    assert recording.count("get", loader=image_loader) > 3
+    assert recording.count("set") == 0
+    assert recording.count() == sum(
+        recording.count(loader=loader) for loader in recording.loaders
+    )
+    assert recording.nbytes("get") > 0
+
+    recording_dict = recording.to_dict()
+    assert recording_dict["latency_buckets"] == list(LATENCY_BUCKETS)
+    get_stats = recording_dict["loaders"][image_loader]["get"]
+    assert get_stats["count"] == recording.count("get", loader=image_loader)
+    assert sum(get_stats["latency_histogram"]) == get_stats["count"]
+    assert json.loads(recording.to_json()) == recording_dict
+
+
+def test_instrument_matches_uninstrumented() -> None:
+    zarr_group = make_image_with_labels(MemoryStore())
+    with ome_zarr_models.instrument():
+        image = Image.from_zarr(zarr_group)
+    assert image == Image.from_zarr(zarr_group)
+
+
+def test_instrument_nested_loader() -> None:
+    store = MemoryStore()
+    make_image_with_labels(store)
+    labels_group = zarr.open_group(store, path="labels", mode="r")
+
+    with ome_zarr_models.instrument() as recording:
+        Labels.from_zarr(labels_group)
+    # Operations are attributed to the innermost loader
+    assert set(recording.loaders) == {
+        "ome_zarr_models.v05.labels.Labels",
+        "ome_zarr_models.v05.image.Image",
+    }
+    # Reading the metadata of the three label image arrays
+    assert recording.count("get", loader="ome_zarr_models.v05.image.Image") >= 3
+
+
+def test_instrumented_store() -> None:
+    store = InstrumentedStore(MemoryStore())
+    # Operations outside of instrument() are not recorded
+    zarr_group = make_image_with_labels(store)
+
+    with ome_zarr_models.instrument() as recording:
+        zarr.open_group(store, mode="r")
+        zarr_group.create_group("new_group")
+    assert recording.loaders == ["unknown"]
+    assert recording.count("get") > 0
+    assert recording.count("set") == 1
+    assert recording.nbytes("set") > 0
+
+    # Nothing is recorded after the context manager exits
+    zarr.open_group(store, mode="r")
+    assert recording.count("set") == 1
+
+
+def test_instrument_nested() -> None:
+    zarr_group = make_image_with_labels(MemoryStore())
+
+    with ome_zarr_models.instrument() as outer_recording:
+        Image.from_zarr(zarr_group)
+        n_outer = outer_recording.count()
+        with ome_zarr_models.instrument() as inner_recording:
+            Image.from_zarr(zarr_group)
+
+    # Operations in the inner block are recorded in both recordings
+    assert n_outer > 0
+    assert inner_recording.count() == n_outer
+    assert outer_recording.count() == 2 * n_outer
+
+
+def test_instrument_threads() -> None:
+    zarr_group = make_image_with_labels(MemoryStore())
+    recordings: dict[str, StoreRecording] = {}
+    barrier = threading.Barrier(2, timeout=60)
+
+    def record(name: str, *, load: bool) -> None:
+        with ome_zarr_models.instrument() as recording:
+            recordings[name] = recording
+            # Both blocks are active while the image is loaded
+            barrier.wait()
+            if load:
+                Image.from_zarr(zarr_group)
+            barrier.wait()
+
+    threads = [
+        threading.Thread(target=record, args=("load",), kwargs={"load": True}),
+        threading.Thread(target=record, args=("idle",), kwargs={"load": False}),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Operations are only recorded in the block of the thread that made them
+    assert recordings["load"].count() > 0
+    assert recordings["idle"].count() == 0
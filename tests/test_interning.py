@@ -0,0 +1,96 @@
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from ome_zarr_models.common.axes import Axis
+from ome_zarr_models.v05.image import ImageAttrs
+from ome_zarr_models.v05.multiscales import Dataset, Multiscale
+
+MULTISCALE: dict[str, Any] = {
+    "axes": [
+        {"name": "y", "type": "space", "unit": "micrometer"},
+        {"name": "x", "type": "space", "unit": "micrometer"},
+    ],
+    "datasets": [
+        {
+            "path": "0",
+            "coordinateTransformations": [{"type": "scale", "scale": [1.0, 1.0]}],
+        },
+        {
+            "path": "1",
+            "coordinateTransformations": [{"type": "scale", "scale": [2.0, 2.0]}],
+        },
+    ],
+}
+
+
+def test_identical_models_shared() -> None:
+    axis = Axis.model_validate(MULTISCALE["axes"][0])
+    axis_json = Axis(**MULTISCALE["axes"][0]).model_dump_json()
+    assert Axis.model_validate_json(axis_json) is axis
+
+    # Axes are shared between models that are not identical
+    image_1 = ImageAttrs.model_validate(
+        {"version": "0.5", "multiscales": [{**MULTISCALE, "name": "image_1"}]}
+    )
+    image_2 = ImageAttrs.model_validate(
+        {"version": "0.5", "multiscales": [{**MULTISCALE, "name": "image_2"}]}
+    )
+    assert image_1.multiscales[0].axes[0] is image_2.multiscales[0].axes[0]
+    assert image_1.multiscales[0].axes[0] is axis
+
+
+def test_mutable_models_not_shared() -> None:
+    # Models holding lists or dictionaries could be changed through
+    # another model that shares them
+    for data in [
+        {"name": "x", "unit": ["micrometer"]},
+        {"name": "x", "extra": {"a": 1}},
+    ]:
+        axis = Axis.model_validate(data)
+        assert Axis.model_validate(data) is not axis
+        assert Axis.model_validate(data) == axis
+
+    multiscale_1 = Multiscale.model_validate(MULTISCALE)
+    multiscale_2 = Multiscale.model_validate(MULTISCALE)
+    assert multiscale_2 is not multiscale_1
+    assert multiscale_2.datasets[0] is not multiscale_1.datasets[0]
+
+
+@pytest.mark.parametrize("unit", [1, 1.0, True, None, "1"])
+def test_different_types_not_shared(unit: Any) -> None:
+    axis = Axis.model_validate({"name": "x", "unit": unit})
+    assert type(axis.unit) is type(unit)
+    assert axis.unit == unit
+
+
+def test_init_not_shared() -> None:
+    axis = Axis.model_validate({"name": "x", "type": "space"})
+    new_axis = Axis(name="x", type="space")
+    assert new_axis is not axis
+    assert new_axis == axis
+
+    # Models nested inside a model created with __init__() are shared
+    assert Multiscale(**MULTISCALE).axes[0] is Axis.model_validate(
+        MULTISCALE["axes"][0]
+    )
+
+
+def test_non_json_data_not_shared() -> None:
+    axes = tuple(MULTISCALE["axes"])
+    # Existing models are validated as normal
+    axis = Axis(name="x", type="space")
+    assert Axis.model_validate(axis) is axis
+    # The items of a tuple are still JSON-like, so are shared
+    multiscale = Multiscale.model_validate({**MULTISCALE, "axes": axes})
+    assert multiscale.axes[0] is Axis.model_validate(MULTISCALE["axes"][0])
+
+
+def test_union_error_locations() -> None:
+    # Transforms are validated against unions of models, and the wrap validator
+    # used for interning would hide the model names in validation error locations
+    with pytest.raises(ValidationError, match=r"union\[VectorScale,PathScale\]"):
+        Dataset.model_validate(
+            {"path": "0", "coordinateTransformations": [{"type": "scale"}]}
+        )
@@ -0,0 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import zarr
+from zarr.storage import MemoryStore
+
+from ome_zarr_models.common.label_index import (
+    LabelIndex,
+    compute_label_index,
+    read_label_index,
+    write_label_index,
+)
+
+
+@pytest.fixture
+def label_data() -> np.ndarray:
+    data = np.zeros((10, 13, 7), dtype=np.uint32)
+    data[1:4, 2:9, 0:3] = 5
+    data[6:10, 10:13, 4:7] = 2
+    data[5, 5, 5] = 100
+    return data
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_compute_label_index(label_data: np.ndarray, use_executor: bool) -> None:
+    array = zarr.create_array(MemoryStore(), data=label_data, chunks=(4, 4, 4))
+    if use_executor:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            label_index = compute_label_index(array, executor=executor)
+    else:
+        label_index = compute_label_index(array)
+
+    np.testing.assert_array_equal(label_index.label_values, [0, 2, 5, 100])
+    assert len(label_index) == 4
+    assert 5 in label_index
+    assert 3 not in label_index
+    for value in [0, 2, 5, 100]:
+        coordinates = np.argwhere(label_data == value)
+        assert label_index.count(value) == len(coordinates)
+        assert label_index.bounding_box(value) == tuple(
+            slice(start, stop)
+            for start, stop in zip(
+                coordinates.min(axis=0), coordinates.max(axis=0) + 1, strict=True
+            )
+        )
+        np.testing.assert_allclose(
+            label_index.centroid(value), coordinates.mean(axis=0)
+        )
+    assert label_index.bounding_box(5) == (slice(1, 4), slice(2, 9), slice(0, 3))
+    np.testing.assert_allclose(label_index.centroids[3], [5, 5, 5])
+
+    with pytest.raises(KeyError, match="Label value 3 is not in the data"):
+        label_index.count(3)
+
+
+def test_compute_label_index_invalid_dtype() -> None:
+    array = zarr.create_array(MemoryStore(), shape=(4, 4), dtype="float32")
+    with pytest.raises(
+        ValueError, match="Data type of labels must be an integer data type"
+    ):
+        compute_label_index(array)
+
+
+def test_compute_label_index_uint64_too_large() -> None:
+    data = np.zeros((4, 4), dtype=np.uint64)
+    data[0, 0] = 2**63
+    array = zarr.create_array(MemoryStore(), data=data, chunks=(2, 2))
+    with pytest.raises(ValueError, match=f"Label value {2**63} is too large"):
+        compute_label_index(array)
+
+    # Values that fit in an int64 are fine
+    data[0, 0] = 2**63 - 1
+    array = zarr.create_array(MemoryStore(), data=data, chunks=(2, 2))
+    np.testing.assert_array_equal(
+        compute_label_index(array).label_values, [0, 2**63 - 1]
+    )
+
+
+@pytest.mark.parametrize("zarr_format", [2, 3])
+def test_write_read_label_index(label_data: np.ndarray, zarr_format: int) -> None:
+    group = zarr.create_group(MemoryStore(), zarr_format=zarr_format)  # type: ignore[arg-type]
+    assert read_label_index(group) is None
+
+    array = group.create_array("0", data=label_data, chunks=(4, 4, 4))
+    label_index = compute_label_index(array)
+    write_label_index(group, label_index)
+    assert dict(group.arrays())["label_index"].shape == (4, 11)
+
+    read_index = read_label_index(group)
+    assert read_index is not None
+    np.testing.assert_array_equal(read_index.to_array(), label_index.to_array())
+
+
+def test_label_index_from_array_invalid() -> None:
+    with pytest.raises(
+        ValueError,
+        match=r"Label index array has shape \(4, 6\), which is not a valid",
+    ):
+        LabelIndex.from_array(np.zeros((4, 6)))
@@ -0,0 +1,195 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+import zarr
+from zarr.storage import LocalStore, MemoryStore
+
+from ome_zarr_models.common.pyramid import (
+    DownsampleMethod,
+    downsample_block,
+    pyramid_shapes,
+    pyramid_transforms,
+    write_pyramid,
+)
+
+
+def test_downsample_block_mean() -> None:
+    block = np.arange(25, dtype=np.uint8).reshape(5, 5)
+    # Incomplete blocks at the edges only use the pixels that are present
+    np.testing.assert_array_equal(
+        downsample_block(block.astype(np.float64), (2, 2), "mean"),
+        [[3, 5, 6.5], [13, 15, 16.5], [20.5, 22.5, 24]],
+    )
+    downsampled = downsample_block(block, (2, 2), "mean")
+    assert downsampled.dtype == np.uint8
+    np.testing.assert_array_equal(downsampled, [[3, 5, 6], [13, 15, 16], [20, 22, 24]])
+
+
+def test_downsample_block_nearest() -> None:
+    block = np.arange(15).reshape(3, 5)
+    np.testing.assert_array_equal(
+        downsample_block(block, (1, 2), "nearest"),
+        [[0, 2, 4], [5, 7, 9], [10, 12, 14]],
+    )
+
+
+def test_pyramid_shapes() -> None:
+    assert pyramid_shapes((3, 37, 50), (1, 2, 2), levels=None, chunks=(1, 8, 8)) == [
+        (3, 37, 50),
+        (3, 19, 25),
+        (3, 10, 13),
+        (3, 5, 7),
+    ]
+    assert pyramid_shapes((3, 37, 50), (1, 2, 2), levels=2, chunks=(1, 8, 8)) == [
+        (3, 37, 50),
+        (3, 19, 25),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "msg"),
+    [
+        ({"levels": 0}, "Number of levels must be at least 1. Got 0."),
+        (
+            {"factors": (1, 0)},
+            r"Downsampling factors must be at least 1. Got \(1, 0\).",
+        ),
+        ({"factors": (1,)}, r"Length of downsampling factors \(1\) and chunks \(2\)"),
+        ({"factors": (1, 1)}, "At least one downsampling factor must be greater"),
+    ],
+)
+def test_pyramid_shapes_invalid(kwargs: dict[str, object], msg: str) -> None:
+    arguments: dict[str, object] = {
+        "factors": (2, 2),
+        "levels": None,
+        "chunks": (4, 4),
+    } | kwargs
+    with pytest.raises(ValueError, match=msg):
+        pyramid_shapes((10, 10), **arguments)  # type: ignore[arg-type]
+
+
+def test_pyramid_transforms() -> None:
+    scales, translations = pyramid_transforms(
+        scale=[1, 0.5],
+        translation=[10, 0],
+        factors=[1, 2],
+        n_levels=3,
+        method="mean",
+    )
+    assert scales == [[1, 0.5], [1, 1], [1, 2]]
+    assert translations == [[10, 0], [10, 0.25], [10, 0.75]]
+
+    _, translations = pyramid_transforms(
+        scale=[1, 0.5],
+        translation=[10, 0],
+        factors=[1, 2],
+        n_levels=3,
+        method="nearest",
+    )
+    assert translations == [[10, 0], [10, 0], [10, 0]]
+
+
+def test_downsample_block_mode() -> None:
+    block = np.array(
+        [[1, 1, 2, 2, 3], [1, 2, 2, 2, 3], [5, 5, 6, 6, 7]], dtype=np.uint8
+    )
+    np.testing.assert_array_equal(
+        downsample_block(block, (2, 2), "mode"), [[1, 2, 3], [5, 6, 7]]
+    )
+    # Ties go to the first value in the block
+    np.testing.assert_array_equal(
+        downsample_block(np.array([[4, 2], [2, 4]]), (2, 2), "mode"), [[4]]
+    )
+
+
+def test_downsample_block_mode_large_factors() -> None:
+    rng = np.random.default_rng(0)
+    # Incomplete blocks at the upper edges, and zeros that must not be
+    # confused with the padding
+    block = rng.integers(0, 4, size=(10, 9, 7), dtype=np.uint16)
+    factors = (4, 4, 4)
+    downsampled = downsample_block(block, factors, "mode")
+    assert downsampled.shape == (3, 3, 2)
+    for index in np.ndindex(downsampled.shape):
+        pixels = block[
+            tuple(
+                slice(i * factor, (i + 1) * factor)
+                for i, factor in zip(index, factors, strict=True)
+            )
+        ].ravel()
+        counts = [np.count_nonzero(pixels == value) for value in pixels]
+        # Ties go to the first value in the block
+        assert downsampled[index] == pixels[np.argmax(counts)]
+
+
+def test_downsample_block_gaussian() -> None:
+    block = np.zeros((9, 9))
+    block[4, 4] = 1
+    downsampled = downsample_block(block, (2, 2), "gaussian")
+    assert downsampled.shape == (5, 5)
+    # Smoothing spreads the value out, but keeps the total
+    assert np.count_nonzero(downsampled) > 1
+    np.testing.assert_allclose(downsampled.sum() * 4, 1)
+
+
+def make_pyramid_arrays(
+    store: MemoryStore | LocalStore, shapes: list[tuple[int, ...]]
+) -> list[zarr.Array[Any]]:
+    return [
+        zarr.create_array(store, name=str(i), shape=shape, chunks=(16, 16), dtype="f8")
+        for i, shape in enumerate(shapes)
+    ]
+
+
+@pytest.mark.parametrize("method", ["mean", "gaussian", "mode", "nearest"])
+@pytest.mark.parametrize("source_type", ["numpy", "zarr"])
+def test_write_pyramid(method: DownsampleMethod, source_type: str) -> None:
+    data = np.random.default_rng(0).random((70, 90))
+    source: npt.NDArray[Any] | zarr.Array[Any] = data
+    if source_type == "zarr":
+        source = zarr.create_array(MemoryStore(), data=data, chunks=(32, 32))
+    arrays = make_pyramid_arrays(MemoryStore(), [(70, 90), (35, 45), (18, 23)])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        write_pyramid(source, arrays, factors=(2, 2), method=method, executor=executor)
+
+    # Writing one chunk at a time gives the same result as downsampling
+    # each whole level at once
+    level_1 = downsample_block(data, (2, 2), method)
+    np.testing.assert_allclose(np.asarray(arrays[0][:]), data)
+    np.testing.assert_allclose(np.asarray(arrays[1][:]), level_1)
+    np.testing.assert_allclose(
+        np.asarray(arrays[2][:]), downsample_block(level_1, (2, 2), method)
+    )
+
+
+def test_write_pyramid_process_pool(tmp_path: Path) -> None:
+    data = np.random.default_rng(0).random((40, 40))
+    arrays = make_pyramid_arrays(LocalStore(tmp_path), [(40, 40), (20, 20)])
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        write_pyramid(
+            data, arrays, factors=(2, 2), method="gaussian", executor=executor
+        )
+    np.testing.assert_allclose(
+        np.asarray(arrays[1][:]), downsample_block(data, (2, 2), "gaussian")
+    )
+
+    arrays = make_pyramid_arrays(MemoryStore(), [(40, 40), (20, 20)])
+    with (
+        ProcessPoolExecutor(max_workers=1) as executor,
+        pytest.raises(ValueError, match="Arrays in a MemoryStore cannot be written"),
+    ):
+        write_pyramid(data, arrays, factors=(2, 2), executor=executor)
+
+
+def test_write_pyramid_wrong_shape() -> None:
+    arrays = make_pyramid_arrays(MemoryStore(), [(10, 10)])
+    with pytest.raises(
+        ValueError,
+        match=r"Shape of the first array \(10, 10\) does not match shape of source",
+    ):
+        write_pyramid(np.zeros((10, 11)), arrays, factors=(2, 2))
@@ -1,12 +1,24 @@
 import re
+import subprocess
+import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 import zarr
+from zarr.abc.store import Store
+from zarr.storage import MemoryStore
 
-from ome_zarr_models import open_ome_zarr
+import ome_zarr_models
+import ome_zarr_models.v05
+from ome_zarr_models import instrument, open_ome_zarr
+from ome_zarr_models.common.axes import Axis
 from ome_zarr_models.v04.hcs import HCS
+from ome_zarr_models.v04.image_label import ImageLabel as ImageLabelv04
+from ome_zarr_models.v05.image_label import ImageLabel as ImageLabelv05
 from tests.conftest import get_examples_path
+from tests.v04.conftest import json_to_zarr_group as v04_json_to_zarr_group
+from tests.v05.conftest import json_to_zarr_group as v05_json_to_zarr_group
 
 
 def test_load_ome_zarr_group() -> None:
@@ -19,6 +31,16 @@ def test_load_ome_zarr_group() -> None:
     assert ome_zarr_group.ome_zarr_version == "0.4"
 
 
+def test_load_ome_zarr_group_trusted() -> None:
+    hcs_group = zarr.open_group(
+        get_examples_path(version="0.4") / "hcs_example.ome.zarr", mode="r"
+    )
+    ome_zarr_group = open_ome_zarr(hcs_group, trusted=True)
+
+    assert isinstance(ome_zarr_group, HCS)
+    assert ome_zarr_group == open_ome_zarr(hcs_group)
+
+
 def test_load_ome_zarr_group_bad(tmp_path: Path) -> None:
     hcs_group = zarr.create_group(tmp_path / "test")
     with pytest.raises(
@@ -29,3 +51,106 @@ def test_load_ome_zarr_group_bad(tmp_path: Path) -> None:
         ),
     ):
         open_ome_zarr(hcs_group)
+
+
+def test_load_ome_zarr_group_v05_image(store: Store) -> None:
+    zarr_group = v05_json_to_zarr_group(json_fname="image_example.json", store=store)
+    for path in ["0", "1", "2"]:
+        zarr_group.create_array(
+            path,
+            shape=(1, 1, 1, 1, 1),
+            dtype="uint8",
+            dimension_names=["t", "c", "z", "y", "x"],
+        )
+    ome_zarr_group = open_ome_zarr(zarr_group)
+
+    # Check that an image is not mistakenly parsed as an image-label group
+    assert type(ome_zarr_group) is ome_zarr_models.v05.Image
+    assert ome_zarr_group.ome_zarr_version == "0.5"
+
+
+@pytest.mark.parametrize("image_label_cls", [ImageLabelv04, ImageLabelv05])
+def test_load_ome_zarr_group_image_label_round_trip(
+    image_label_cls: type[ImageLabelv04] | type[ImageLabelv05],
+) -> None:
+    image_label = image_label_cls.from_array(
+        np.zeros((8, 8), dtype="uint8"),
+        store=MemoryStore(),
+        path="cells",
+        axes=[Axis(name="y", type="space"), Axis(name="x", type="space")],
+        chunks=(4, 4),
+    )
+    store = MemoryStore()
+    # ImageLabel.to_zarr() writes the "image_label" key instead of "image-label"
+    ome_zarr_group = open_ome_zarr(image_label.to_zarr(store, "cells"))
+
+    assert type(ome_zarr_group) is image_label_cls
+    assert ome_zarr_group.model_dump() == image_label.model_dump()
+
+
+def test_load_ome_zarr_group_invalid_error(store: Store) -> None:
+    # Image metadata, but missing the arrays
+    zarr_group = v04_json_to_zarr_group(
+        json_fname="multiscales_example.json", store=store
+    )
+    with pytest.raises(ValueError, match="Expected to find an array at"):
+        open_ome_zarr(zarr_group)
+
+
+def test_load_ome_zarr_group_unknown_version(store: Store) -> None:
+    zarr_group = zarr.open_group(store=store, zarr_format=3)
+    zarr_group.attrs.put({"ome": {"version": "0.1", "multiscales": []}})
+    with pytest.raises(RuntimeError, match="Could not successfully validate"):
+        open_ome_zarr(zarr_group)
+
+
+def test_lazy_import() -> None:
+    # Run in a new interpreter, as other tests have already imported everything
+    code = (
+        "import sys\n"
+        "import ome_zarr_models\n"
+        "assert 'zarr' not in sys.modules\n"
+        "assert 'pydantic' not in sys.modules\n"
+        "assert 'ome_zarr_models.v04.hcs' not in sys.modules\n"
+        "import ome_zarr_models.v04.well_types\n"
+        "assert 'ome_zarr_models.v04.hcs' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_attributes() -> None:
+    assert ome_zarr_models._V04_groups["plate"] is HCS
+    assert ome_zarr_models._V05_groups["multiscales"] is ome_zarr_models.v05.Image
+    assert ome_zarr_models.v04.HCS is HCS
+    assert ome_zarr_models.instrument is instrument
+    assert isinstance(ome_zarr_models.__version__, str)
+    assert "v04" in dir(ome_zarr_models)
+    with pytest.raises(AttributeError, match="has no attribute 'foo'"):
+        ome_zarr_models.foo  # noqa: B018
+    with pytest.raises(AttributeError, match="has no attribute 'foo'"):
+        ome_zarr_models.v05.foo  # noqa: B018
+
+
+def test_prebuild() -> None:
+    # Run in a new interpreter, as other tests have already built the models
+    code = (
+        "import ome_zarr_models\n"
+        "import ome_zarr_models.v04.image\n"
+        "import ome_zarr_models.v05.hcs\n"
+        "import ome_zarr_models.v05.image\n"
+        "assert not ome_zarr_models.v05.image.Image.__pydantic_complete__\n"
+        "assert not ome_zarr_models.v05.image.ImageAttrs.__pydantic_complete__\n"
+        "ome_zarr_models.prebuild(version='0.5')\n"
+        "assert ome_zarr_models.v05.image.Image.__pydantic_complete__\n"
+        "assert ome_zarr_models.v05.image.ImageAttrs.__pydantic_complete__\n"
+        "assert ome_zarr_models.v05.hcs.HCS.__pydantic_complete__\n"
+        "assert not ome_zarr_models.v04.image.Image.__pydantic_complete__\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_prebuild_invalid_version() -> None:
+    with pytest.raises(
+        ValueError, match=re.escape("Unsupported OME-Zarr version '0.1'")
+    ):
+        ome_zarr_models.prebuild(version="0.1")  # type: ignore[arg-type]
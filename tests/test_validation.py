@@ -0,0 +1,140 @@
+from typing import Any
+
+import pytest
+import zarr
+from pydantic_zarr.v3 import ArraySpec
+from zarr.codecs import (
+    BloscCodec,
+    BytesCodec,
+    Crc32cCodec,
+    GzipCodec,
+    TransposeCodec,
+    ZstdCodec,
+)
+from zarr.storage import MemoryStore
+
+from ome_zarr_models.common.validation import check_array_path, unique_items_validator
+from ome_zarr_models.common.well_types import WellImage
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [],
+        ["a", "b", "c"],
+        [WellImage(path="0"), WellImage(path="0", acquisition=1)],
+        # Not hashable
+        [[0, 1], [1, 0], {"a": 1}],
+    ],
+)
+def test_unique_items_validator(values: list[object]) -> None:
+    assert unique_items_validator(values) is values
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["a", "b", "a"],
+        [WellImage(path="0", acquisition=1), WellImage(path="0", acquisition=1)],
+        # Not hashable
+        [[0, 1], {"a": 1}, [0, 1]],
+    ],
+)
+def test_unique_items_validator_duplicates(values: list[object]) -> None:
+    with pytest.raises(ValueError, match="Duplicate values found in "):
+        unique_items_validator(values)
+
+
+@pytest.mark.parametrize("attributes", [{}, {"a": [1, [2, 3]], "b": {"c": None}}])
+@pytest.mark.parametrize("fill_value", [0, float("nan")])
+def test_check_array_path_v3(attributes: dict[str, Any], fill_value: float) -> None:
+    group = zarr.open_group(MemoryStore(), zarr_format=3)
+    array = group.create_array(
+        "image/0",
+        shape=(4, 6),
+        chunks=(2, 3),
+        dtype="float32",
+        fill_value=fill_value,
+        attributes=attributes,
+        dimension_names=["y", "x"],
+    )
+    array_spec = check_array_path(group, "image/0", expected_zarr_version=3)
+    assert array_spec == ArraySpec.from_zarr(array)
+
+
+@pytest.mark.parametrize("consolidated", [False, True])
+@pytest.mark.filterwarnings("ignore:Consolidated metadata is currently not part")
+def test_check_array_path_v3_sharded(consolidated: bool) -> None:
+    # Sharding codecs have nested codec configurations, which must be
+    # converted to tuples in the same way as ArraySpec.from_zarr()
+    store = MemoryStore()
+    group = zarr.open_group(store, zarr_format=3)
+    array = group.create_array(
+        "image/0",
+        shape=(8, 12),
+        chunks=(2, 3),
+        shards=(4, 6),
+        dtype="uint16",
+        compressors=ZstdCodec(level=3),
+        dimension_names=["y", "x"],
+    )
+    if consolidated:
+        zarr.consolidate_metadata(store)
+        group = zarr.open_group(store, mode="r")
+    array_spec = check_array_path(group, "image/0", expected_zarr_version=3)
+    assert array_spec == ArraySpec.from_zarr(array)
+    sharding_codec = array_spec.codecs[0]
+    assert isinstance(sharding_codec, dict)
+    assert isinstance(sharding_codec["configuration"]["codecs"], tuple)
+
+
+@pytest.mark.parametrize(
+    "array_kwargs",
+    [
+        {"dtype": "uint8", "dimension_names": ["t", "c", "z", "y", "x"]},
+        {"dtype": "bool", "fill_value": True},
+        {"dtype": "int64", "compressors": None, "dimension_names": None},
+        {"dtype": "float64", "fill_value": float("-inf")},
+        {"dtype": "complex64", "fill_value": 1 + 2j},
+        {"dtype": str, "fill_value": "a"},
+        {"dtype": "datetime64[ns]"},
+        {"dtype": ">u4", "serializer": BytesCodec(endian="big")},
+        {"dtype": "uint16", "compressors": [GzipCodec(level=2), Crc32cCodec()]},
+        {
+            "dtype": "float32",
+            "filters": [TransposeCodec(order=(0, 1, 2, 4, 3))],
+            "compressors": BloscCodec(),
+        },
+        {"dtype": "uint16", "chunks": (1, 1, 1, 2, 3), "shards": (1, 1, 1, 4, 6)},
+    ],
+)
+@pytest.mark.parametrize("consolidated", [False, True])
+@pytest.mark.filterwarnings("ignore:Consolidated metadata is currently not part")
+def test_check_array_path_v3_matches_from_zarr(
+    array_kwargs: dict[str, Any], consolidated: bool
+) -> None:
+    # Zarr v3 array specs are built from the array metadata without opening
+    # the array, so check they match ArraySpec.from_zarr() for a range of arrays
+    store = MemoryStore()
+    group = zarr.open_group(store, zarr_format=3)
+    array = group.create_array(
+        "image/0", shape=(1, 1, 2, 4, 6), attributes={"a": [1, [2]]}, **array_kwargs
+    )
+    if consolidated:
+        zarr.consolidate_metadata(store)
+        group = zarr.open_group(store, mode="r")
+    array_spec = check_array_path(group, "image/0", expected_zarr_version=3)
+    assert array_spec == ArraySpec.from_zarr(array)
+
+
+def test_check_array_path_v3_errors() -> None:
+    group = zarr.open_group(MemoryStore(), zarr_format=3)
+    group.create_group("image")
+    zarr.create_array(group.store, name="v2", shape=(1,), dtype="uint8", zarr_format=2)
+
+    with pytest.raises(ValueError, match="no array was found there"):
+        check_array_path(group, "missing", expected_zarr_version=3)
+    with pytest.raises(ValueError, match="group"):
+        check_array_path(group, "image", expected_zarr_version=3)
+    with pytest.raises(ValueError, match="Expected Zarr v3 array, but got v2 array"):
+        check_array_path(group, "v2", expected_zarr_version=3)
@@ -1,10 +1,20 @@
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
 import zarr
+from pydantic_zarr.v2 import ArraySpec
+from zarr.errors import ContainsGroupError
+from zarr.storage import MemoryStore
 
+from ome_zarr_models.common.hcs import WellValidationResult
 from ome_zarr_models.common.omero import Channel, Omero, Window
 from ome_zarr_models.v04.axes import Axis
 from ome_zarr_models.v04.coordinate_transformations import VectorScale
 from ome_zarr_models.v04.hcs import HCS, HCSAttrs
-from ome_zarr_models.v04.image import ImageAttrs
+from ome_zarr_models.v04.image import Image, ImageAttrs
 from ome_zarr_models.v04.multiscales import Dataset, Multiscale
 from ome_zarr_models.v04.plate import Acquisition, Column, Plate, Row, WellInPlate
 from ome_zarr_models.v04.well_types import WellImage, WellMeta
@@ -131,3 +141,147 @@ def test_non_existent_wells() -> None:
             }
         }
     )
+
+
+def test_example_hcs_lazy() -> None:
+    group = zarr.open_group(
+        get_examples_path(version="0.4") / "hcs_example.ome.zarr", mode="r"
+    )
+    hcs = HCS.from_zarr(group, lazy=True)
+    assert hcs.members == {}
+    assert hcs.attributes == HCS.from_zarr(group).attributes
+
+    well_group = hcs.get_well_group(0)
+    assert well_group == HCS.from_zarr(group).get_well_group(0)
+    # Check the well group is cached
+    assert hcs.get_well_group(0) is well_group
+    assert len(list(hcs.well_groups)) == 1
+
+
+def test_example_hcs_lazy_round_trip() -> None:
+    group = zarr.open_group(
+        get_examples_path(version="0.4") / "hcs_example.ome.zarr", mode="r"
+    )
+    hcs = HCS.from_zarr(group, lazy=True)
+    eager_hcs = HCS.from_zarr(group)
+    # The lazy model reads all of its members when it is dumped or compared
+    assert hcs.members == {}
+    assert hcs.model_dump() == eager_hcs.model_dump()
+    assert hcs == eager_hcs
+
+    store = MemoryStore()
+    hcs.to_zarr(store, "plate")
+    new_hcs = HCS.from_zarr(zarr.open_group(store, path="plate", mode="r"))
+    assert len(list(new_hcs.well_groups)) == 1
+    assert new_hcs == eager_hcs
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_get_well(lazy: bool) -> None:
+    group = zarr.open_group(
+        get_examples_path(version="0.4") / "hcs_example.ome.zarr", mode="r"
+    )
+    hcs = HCS.from_zarr(group, lazy=lazy)
+    well_group = hcs.get_well("B", "03")
+    assert well_group == hcs.get_well_group(0)
+    assert hcs.wells_in_row("B") == [well_group]
+    assert hcs.wells_in_column("03") == [well_group]
+    with pytest.raises(ValueError, match="No well found at row 'A' and column '03'"):
+        hcs.get_well("A", "03")
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test_validate_all(lazy: bool) -> None:
+    group = zarr.open_group(
+        get_examples_path(version="0.4") / "hcs_example.ome.zarr", mode="r"
+    )
+    hcs = HCS.from_zarr(group, lazy=lazy)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        report = hcs.validate_all(executor=executor)
+
+    assert report == {"B/03": WellValidationResult(index=0, path="B/03")}
+    assert report["B/03"].is_valid
+
+
+def _new_image() -> Image:
+    return Image.new(
+        array_specs=[ArraySpec(shape=(5, 5), chunks=(2, 2), dtype=np.uint8)],
+        paths=["0"],
+        axes=[Axis(name="y", type="space"), Axis(name="x", type="space")],
+        scales=[(1, 1)],
+        translations=[None],
+    )
+
+
+def test_hcs_new() -> None:
+    image = _new_image()
+    hcs = HCS.new(
+        rows=["A", "B"],
+        columns=["1", "2"],
+        images={"B/1": [image, image], "A/2": [image]},
+        acquisitions=[Acquisition(id=0)],
+        image_acquisitions={"B/1": [0, 0]},
+        name="test",
+    )
+    plate = hcs.attributes.plate
+    assert plate.wells == [
+        WellInPlate(path="A/2", rowIndex=0, columnIndex=1),
+        WellInPlate(path="B/1", rowIndex=1, columnIndex=0),
+    ]
+    assert plate.field_count == 2
+    assert plate.name == "test"
+    well = hcs.get_well("B", "1")
+    assert well.attributes.well.images == [
+        WellImage(path="0", acquisition=0),
+        WellImage(path="1", acquisition=0),
+    ]
+    assert well.get_image(1) == image
+    assert hcs.get_well("A", "2").ome_attributes.well.images[0].acquisition is None
+
+
+def test_hcs_new_invalid() -> None:
+    image = _new_image()
+    with pytest.raises(ValueError, match="Well path 'C/1' must be of the form"):
+        HCS.new(rows=["A"], columns=["1"], images={"C/1": [image]})
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Number of acquisition IDs for well 'A/1' (2) does not match number of "
+            "images (1)."
+        ),
+    ):
+        HCS.new(
+            rows=["A"],
+            columns=["1"],
+            images={"A/1": [image]},
+            image_acquisitions={"A/1": [0, 1]},
+        )
+
+
+@pytest.mark.parametrize("consolidate", [True, False])
+def test_hcs_to_zarr_concurrent(consolidate: bool) -> None:
+    image = _new_image()
+    hcs = HCS.new(
+        rows=["A", "B"],
+        columns=["1", "2"],
+        images={"A/1": [image, image], "B/2": [image]},
+    )
+    sequential_store = MemoryStore()
+    hcs.to_zarr(sequential_store, "plate", consolidate=consolidate)
+    store = MemoryStore()
+    group = hcs.to_zarr(store, "plate", concurrent=True, consolidate=consolidate)
+
+    # The same metadata documents are written
+    assert store._store_dict.keys() == sequential_store._store_dict.keys()
+    for key, value in store._store_dict.items():
+        assert json.loads(value.to_bytes()) == json.loads(
+            sequential_store._store_dict[key].to_bytes()
+        )
+    assert (group.metadata.consolidated_metadata is not None) == consolidate
+    assert HCS.from_zarr(group) == HCS.from_zarr(
+        zarr.open_group(sequential_store, path="plate")
+    )
+
+    with pytest.raises(ContainsGroupError):
+        hcs.to_zarr(store, "plate", concurrent=True)
+    hcs.to_zarr(store, "plate", concurrent=True, overwrite=True)
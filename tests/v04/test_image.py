@@ -1,11 +1,16 @@
+import asyncio
 import re
+from typing import Any
 
 import numpy as np
 import pytest
+import zarr
 from pydantic_zarr.v2 import ArraySpec
 from zarr.abc.store import Store
+from zarr.storage import MemoryStore
 
 from ome_zarr_models.common.coordinate_transformations import VectorTranslation
+from ome_zarr_models.common.pyramid import downsample_block
 from ome_zarr_models.v04.axes import Axis
 from ome_zarr_models.v04.coordinate_transformations import VectorScale
 from ome_zarr_models.v04.image import Image, ImageAttrs
@@ -253,3 +258,162 @@ def test_no_global_transform() -> None:
     assert "coordinateTransformations" not in model_dict["attributes"]["multiscales"][0]
 
     new_image.model_dump(exclude_none=True)
+
+
+def test_image_from_zarr_async(store: Store) -> None:
+    zarr_group = json_to_zarr_group(json_fname="multiscales_example.json", store=store)
+    zarr_group.create_array("0", shape=(1, 1, 1, 1), dtype="uint8")
+    zarr_group.create_array("1", shape=(1, 1, 1, 1), dtype="uint8")
+
+    image = asyncio.run(Image.from_zarr_async(zarr_group))
+    assert image == Image.from_zarr(zarr_group)
+
+
+def test_image_consolidated_metadata() -> None:
+    new_image = Image.new(
+        array_specs=[
+            ArraySpec(shape=(5, 5), chunks=(2, 2), dtype=np.uint8),
+            ArraySpec(shape=(3, 3), chunks=(2, 2), dtype=np.uint8),
+        ],
+        paths=["scale0", "scale1"],
+        axes=[
+            Axis(name="x", type="space", unit="km"),
+            Axis(name="y", type="space", unit="km"),
+        ],
+        scales=[(4, 4), (8, 8)],
+        translations=[None, None],
+    )
+    unconsolidated_store = MemoryStore()
+    new_image.to_zarr(unconsolidated_store, "")
+    unconsolidated_group = zarr.open_group(unconsolidated_store, mode="r")
+    assert unconsolidated_group.metadata.consolidated_metadata is None
+
+    store = MemoryStore()
+    new_image.to_zarr(store, "", consolidate=True)
+    group = zarr.open_group(store, mode="r")
+    assert group.metadata.consolidated_metadata is not None
+
+    # Remove the array metadata from the store, to check that all the metadata
+    # is read from the consolidated metadata
+    for key in ["scale0/.zarray", "scale1/.zarray"]:
+        del store._store_dict[key]
+
+    assert Image.from_zarr(group) == Image.from_zarr(unconsolidated_group)
+
+
+def test_image_consolidated_metadata_members() -> None:
+    new_image = Image.new(
+        array_specs=[ArraySpec(shape=(5, 5), chunks=(2, 2), dtype=np.uint8)],
+        paths=["scale0"],
+        axes=[
+            Axis(name="x", type="space", unit="km"),
+            Axis(name="y", type="space", unit="km"),
+        ],
+        scales=[(4, 4)],
+        translations=[None],
+    )
+    store = MemoryStore()
+    zarr_group = new_image.to_zarr(store, "image")
+    zarr_group.create_group("labels", attributes={"labels": []})
+    # Nodes that are not part of the image are not included in the model
+    zarr_group.create_array("extra", shape=(1,), dtype="uint8")
+    zarr_group.create_group("labels/extra")
+    unconsolidated_image = Image.from_zarr(
+        zarr.open_group(store, path="image", mode="r")
+    )
+
+    zarr.consolidate_metadata(store, "image")
+    group = zarr.open_group(store, path="image", mode="r")
+    assert group.metadata.consolidated_metadata is not None
+    image = Image.from_zarr(group)
+
+    assert image == unconsolidated_image
+    assert image.members is not None
+    assert sorted(image.members) == ["labels", "scale0"]
+
+
+def test_image_trusted(store: Store) -> None:
+    zarr_group = json_to_zarr_group(json_fname="multiscales_example.json", store=store)
+    zarr_group.create_array("0", shape=(1, 1, 1, 1), dtype="uint8")
+    zarr_group.create_array("1", shape=(1, 1, 1, 1), dtype="uint8")
+
+    image = Image.from_zarr(zarr_group, trusted=True)
+    assert image == Image.from_zarr(zarr_group)
+    assert isinstance(image.attributes, ImageAttrs)
+    assert image.datasets[0][1].path == "1"
+
+
+@pytest.mark.parametrize("source_type", ["numpy", "zarr"])
+def test_image_from_array(source_type: str) -> None:
+    data = np.random.default_rng(0).integers(0, 255, size=(2, 37, 50), dtype=np.uint16)
+    source: np.ndarray[Any, Any] | zarr.Array[Any] = data
+    if source_type == "zarr":
+        source = zarr.create_array(MemoryStore(), shape=data.shape, dtype=data.dtype)
+        source[:] = data
+    axes = [
+        Axis(name="c", type="channel"),
+        Axis(name="y", type="space", unit="micrometer"),
+        Axis(name="x", type="space", unit="micrometer"),
+    ]
+    store = MemoryStore()
+    image = Image.from_array(
+        source,
+        store=store,
+        path="image",
+        axes=axes,
+        chunks=(1, 8, 8),
+        scale=[1, 0.5, 0.5],
+    )
+
+    group = zarr.open_group(store, path="image", mode="r")
+    arrays = dict(group.arrays())
+    assert Image.from_zarr(group).attributes.model_dump(
+        mode="json"
+    ) == image.attributes.model_dump(mode="json")
+    # Levels are added until the lowest resolution level fits in a single chunk
+    assert [arrays[str(i)].shape for i in range(4)] == [
+        (2, 37, 50),
+        (2, 19, 25),
+        (2, 10, 13),
+        (2, 5, 7),
+    ]
+    assert arrays["3"].chunks == (1, 5, 7)
+    np.testing.assert_array_equal(arrays["0"][:], data)
+    np.testing.assert_array_equal(
+        arrays["1"][:], downsample_block(data, (1, 2, 2), "mean")
+    )
+    np.testing.assert_array_equal(
+        arrays["2"][:],
+        downsample_block(downsample_block(data, (1, 2, 2), "mean"), (1, 2, 2), "mean"),
+    )
+
+    multiscale = image.attributes.multiscales[0]
+    assert multiscale.type == "mean"
+    assert multiscale.datasets[2].coordinateTransformations == (
+        VectorScale(type="scale", scale=[1, 2, 2]),
+        VectorTranslation(type="translation", translation=[0, 0.75, 0.75]),
+    )
+
+
+def test_image_from_array_nearest() -> None:
+    data = np.arange(64, dtype=np.uint8).reshape(8, 8)
+    axes = [Axis(name="y", type="space"), Axis(name="x", type="space")]
+    store = MemoryStore()
+    image = Image.from_array(
+        data,
+        store=store,
+        path="",
+        axes=axes,
+        chunks=(4, 4),
+        downsample=(1, 2),
+        levels=2,
+        method="nearest",
+    )
+    arrays = dict(zarr.open_group(store, mode="r").arrays())
+    np.testing.assert_array_equal(arrays["1"][:], data[:, ::2])
+    multiscale = image.attributes.multiscales[0]
+    assert multiscale.type == "nearest"
+    assert multiscale.datasets[1].coordinateTransformations == (
+        VectorScale(type="scale", scale=[1, 2]),
+        VectorTranslation(type="translation", translation=[0, 0]),
+    )
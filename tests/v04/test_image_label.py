@@ -1,7 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pytest
+import zarr
 from pydantic import ValidationError
 from zarr.abc.store import Store
+from zarr.storage import MemoryStore
 
+from ome_zarr_models import open_ome_zarr
 from ome_zarr_models.v04.axes import Axis
 from ome_zarr_models.v04.coordinate_transformations import VectorScale
 from ome_zarr_models.v04.image_label import ImageLabel, ImageLabelAttrs
@@ -12,14 +18,10 @@ from ome_zarr_models.v04.image_label_types import (
     Source,
 )
 from ome_zarr_models.v04.multiscales import Dataset, Multiscale
-from tests.conftest import UnlistableStore
 from tests.v04.conftest import json_to_zarr_group
 
 
 def test_image_label_example_json(store: Store) -> None:
-    if isinstance(store, UnlistableStore):
-        pytest.xfail("ImageLabel does not work on unlistable stores")
-
     zarr_group = json_to_zarr_group(json_fname="image_label_example.json", store=store)
     zarr_group.create_array("0", shape=(1, 1, 1, 1, 1), dtype="uint8")
     ome_group = ImageLabel.from_zarr(zarr_group)
@@ -72,6 +74,20 @@ def test_image_label_example_json(store: Store) -> None:
     )
 
 
+def test_image_label_example_json_trusted(store: Store) -> None:
+    # The example has a property with a "cls" key, which is not a field
+    zarr_group = json_to_zarr_group(json_fname="image_label_example.json", store=store)
+    zarr_group.create_array("0", shape=(1, 1, 1, 1, 1), dtype="uint8")
+    validated = ImageLabel.from_zarr(zarr_group)
+
+    trusted = ImageLabel.from_zarr(zarr_group, trusted=True)
+    assert trusted == validated
+    assert trusted.model_dump(exclude_unset=True) == validated.model_dump(
+        exclude_unset=True
+    )
+    assert open_ome_zarr(zarr_group, trusted=True) == validated
+
+
 def test_invalid_label() -> None:
     """
     > Each color object MUST contain the label-value key whose value MUST be an integer
@@ -110,3 +126,127 @@ def test_default_source() -> None:
     )
     assert attrs.source is not None
     assert attrs.source.image == "../../"
+
+
+def test_image_label_members(store: Store) -> None:
+    zarr_group = json_to_zarr_group(json_fname="image_label_example.json", store=store)
+    zarr_group.create_array("0", shape=(1, 1, 1, 1, 1), dtype="uint8")
+    # Arrays that aren't part of the multiscales shouldn't be loaded
+    zarr_group.create_array("other", shape=(1,), dtype="uint8")
+    ome_group = ImageLabel.from_zarr(zarr_group)
+    assert ome_group.members is not None
+    assert list(ome_group.members.keys()) == ["0"]
+
+
+def test_image_label_from_array() -> None:
+    data = np.zeros((9, 12), dtype=np.uint16)
+    data[:4, :6] = 3
+    data[4:, 6:] = 7
+    axes = [Axis(name="y", type="space"), Axis(name="x", type="space")]
+    store = MemoryStore()
+    image_label = ImageLabel.from_array(
+        data,
+        store=store,
+        path="labels/cells",
+        axes=axes,
+        chunks=(4, 4),
+        image_label=Label(colors=(Color(label_value=3, rgba=(255, 0, 0, 255)),)),
+        executor=ThreadPoolExecutor(max_workers=2),
+    )
+
+    group = zarr.open_group(store, path="labels/cells", mode="r")
+    assert ImageLabel.from_zarr(group).attributes.model_dump(
+        mode="json"
+    ) == image_label.attributes.model_dump(mode="json")
+    arrays = dict(group.arrays())
+    assert sorted(arrays) == ["0", "1", "2"]
+    np.testing.assert_array_equal(arrays["0"][:], data)
+    # Downsampling with the mode only gives values that are in the source data
+    np.testing.assert_array_equal(
+        arrays["1"][:],
+        [
+            [3, 3, 3, 0, 0, 0],
+            [3, 3, 3, 0, 0, 0],
+            [0, 0, 0, 7, 7, 7],
+            [0, 0, 0, 7, 7, 7],
+            [0, 0, 0, 7, 7, 7],
+        ],
+    )
+    np.testing.assert_array_equal(arrays["2"][:], [[3, 3, 0], [0, 0, 7], [0, 0, 7]])
+
+
+@pytest.mark.parametrize(
+    ("dtype", "method", "msg"),
+    [
+        ("float32", "mode", "Data type of labels"),
+        ("uint8", "mean", "Downsampling method must be one of"),
+    ],
+)
+def test_image_label_from_array_invalid(dtype: str, method: str, msg: str) -> None:
+    with pytest.raises(ValueError, match=msg):
+        ImageLabel.from_array(
+            np.zeros((4, 4), dtype=dtype),
+            store=MemoryStore(),
+            path="",
+            axes=[Axis(name="y", type="space"), Axis(name="x", type="space")],
+            chunks=(2, 2),
+            method=method,  # type: ignore[arg-type]
+        )
+
+
+def test_image_label_label_index() -> None:
+    data = np.zeros((9, 12), dtype=np.uint16)
+    data[1:3, 2:8] = 4
+    store = MemoryStore()
+    axes = [Axis(name="y", type="space"), Axis(name="x", type="space")]
+    ImageLabel.from_array(data, store=store, path="", axes=axes, chunks=(4, 4))
+
+    image_label = ImageLabel.from_zarr(zarr.open_group(store))
+    no_label_index = image_label.label_index
+    assert no_label_index is None
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        label_index = image_label.write_label_index(executor=executor)
+    assert image_label.label_index is label_index
+
+    # The label index is read back when the group is loaded again
+    read_label_index = ImageLabel.from_zarr(zarr.open_group(store)).label_index
+    assert read_label_index is not None
+    np.testing.assert_array_equal(read_label_index.label_values, [0, 4])
+    assert read_label_index.count(4) == 12
+    assert read_label_index.bounding_box(4) == (slice(1, 3), slice(2, 8))
+    assert read_label_index.centroid(4) == (1.5, 4.5)
+
+    # Saving a label index to another group doesn't change the label index
+    # of the model
+    other_group = zarr.open_group(MemoryStore())
+    other_group.create_array("0", data=np.where(data == 4, 7, 0), chunks=(4, 4))
+    other_label_index = image_label.write_label_index(other_group)
+    np.testing.assert_array_equal(other_label_index.label_values, [0, 7])
+    assert image_label.label_index is label_index
+
+    # A model that was not loaded from Zarr has no group to read from
+    new_image_label = ImageLabel(
+        attributes=image_label.attributes, members=image_label.members
+    )
+    with pytest.raises(ValueError, match="can only be read from an image label"):
+        _ = new_image_label.label_index
+    with pytest.raises(ValueError, match="A group must be given"):
+        new_image_label.write_label_index()
+
+
+def test_image_label_equal_from_different_stores() -> None:
+    data = np.zeros((9, 12), dtype=np.uint16)
+    data[1:3, 2:8] = 4
+    axes = [Axis(name="y", type="space"), Axis(name="x", type="space")]
+    image_labels = []
+    for _ in range(2):
+        store = MemoryStore()
+        ImageLabel.from_array(data, store=store, path="", axes=axes, chunks=(4, 4))
+        image_labels.append(ImageLabel.from_zarr(zarr.open_group(store)))
+
+    assert image_labels[0] == image_labels[1]
+    # Reading the label index doesn't change equality
+    assert image_labels[0].label_index is None
+    image_labels[1].write_label_index()
+    assert image_labels[1].label_index is not None
+    assert image_labels[0] == image_labels[1]
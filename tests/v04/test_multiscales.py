@@ -13,6 +13,7 @@ from ome_zarr_models.common.coordinate_transformations import (
 )
 from ome_zarr_models.v04.axes import Axis
 from ome_zarr_models.v04.coordinate_transformations import (
+    ScaleTranslation,
     VectorScale,
     VectorTranslation,
 )
@@ -555,3 +556,73 @@ def test_hashable(default_multiscale: Multiscale) -> None:
     Test that `Multiscale` can be hashed
     """
     assert set(default_multiscale) == set(default_multiscale)
+
+
+def test_get_dataset_transform() -> None:
+    axes = (
+        Axis(name="z", type="space", unit="meter"),
+        Axis(name="y", type="space", unit="meter"),
+        Axis(name="x", type="space", unit="meter"),
+    )
+    multiscale = Multiscale(
+        axes=axes,
+        datasets=(
+            Dataset.build(path="0", scale=(1, 1, 1), translation=(0, 0, 0)),
+            Dataset.build(path="1", scale=(1, 2, 2), translation=(0, 0.5, 0.5)),
+        ),
+        coordinateTransformations=_build_transforms(
+            scale=(2, 2, 2), translation=(10, 0, 0)
+        ),
+    )
+    transform = multiscale.get_dataset_transform(1)
+    assert transform == ScaleTranslation([2, 4, 4], [10, 1, 1])
+
+    index = np.array([[0, 0, 0], [1, 2, 3]])
+    physical = transform.apply(index)
+    np.testing.assert_array_equal(physical, [[10, 1, 1], [12, 9, 13]])
+    np.testing.assert_array_equal(transform.apply_inverse(physical), index)
+
+
+def test_select_level() -> None:
+    axes = (
+        Axis(name="c", type="channel"),
+        Axis(name="z", type="space", unit="meter"),
+        Axis(name="y", type="space", unit="meter"),
+        Axis(name="x", type="space", unit="meter"),
+    )
+    multiscale = Multiscale(
+        axes=axes,
+        datasets=tuple(
+            Dataset.build(
+                path=str(i), scale=(1, 2, 0.5 * 2**i, 0.5 * 2**i), translation=None
+            )
+            for i in range(4)
+        ),
+        coordinateTransformations=_build_transforms(
+            scale=(1, 1, 2, 2), translation=None
+        ),
+    )
+    # Level pixel sizes (y, x) are 1, 2, 4, 8
+    assert multiscale.select_level(0.5) == 0
+    assert multiscale.select_level(4) == 2
+    assert multiscale.select_level(5) == 2
+    assert multiscale.select_level(100) == 3
+    # The z pixel size (2) limits the level selected
+    assert multiscale.select_level(1.5) == 0
+    # Only consider the y and x axes
+    assert multiscale.select_level([1.5, 1.5]) == 0
+    assert multiscale.select_level([4, 2]) == 1
+    with pytest.raises(ValueError, match="Got 4 target pixel sizes"):
+        multiscale.select_level([1, 1, 1, 1])
+
+    # 100 x 50 physical units, shown on a 25 x 25 screen
+    assert multiscale.level_for_viewport([[0, 0], [100, 50]], screen_px=25) == 1
+    assert multiscale.level_for_viewport([[0, 0], [100, 50]], screen_px=[25, 5]) == 2
+    with pytest.raises(ValueError, match=r"Bounding box must have shape \(2, n_axes\)"):
+        multiscale.level_for_viewport([0, 100], screen_px=25)
+
+    # Selecting a level doesn't change equality
+    other = Multiscale.model_validate(multiscale.model_dump())
+    assert other == multiscale
+    other.level_for_viewport([[0, 0], [100, 50]], screen_px=25)
+    assert other == multiscale
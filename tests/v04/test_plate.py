@@ -1,5 +1,6 @@
 import re
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -141,3 +142,50 @@ def test_well_paths(well_path: str, msg: str) -> None:
             version="0.4",
             wells=[WellInPlate(path=well_path, rowIndex=1, columnIndex=1)],
         )
+
+
+def test_well_index() -> None:
+    plate = Plate(
+        columns=[Column(name="01"), Column(name="02"), Column(name="03")],
+        rows=[Row(name="A"), Row(name="B")],
+        version="0.4",
+        wells=[
+            WellInPlate(path="A/01", rowIndex=0, columnIndex=0),
+            WellInPlate(path="B/03", rowIndex=1, columnIndex=2),
+            WellInPlate(path="A/03", rowIndex=0, columnIndex=2),
+        ],
+    )
+    np.testing.assert_array_equal(plate.well_grid, [[0, -1, 2], [-1, -1, 1]])
+    assert not plate.well_grid.flags.writeable
+
+    assert plate.get_well_index("B", "03") == 1
+    assert plate.well_indices_in_row("A") == [0, 2]
+    assert plate.well_indices_in_row("B") == [1]
+    assert plate.well_indices_in_column("02") == []
+    assert plate.well_indices_in_column("03") == [2, 1]
+
+    with pytest.raises(ValueError, match="No well found at row 'B' and column '01'"):
+        plate.get_well_index("B", "01")
+    with pytest.raises(ValueError, match="Row 'C' is not in list of rows"):
+        plate.well_indices_in_row("C")
+    with pytest.raises(ValueError, match="Column '04' is not in list of columns"):
+        plate.well_indices_in_column("04")
+
+    # Looking up wells doesn't change equality
+    other = Plate.model_validate(plate.model_dump())
+    assert other == plate
+    other.get_well_index("B", "03")
+    other.well_indices_in_row("A")
+    other.well_indices_in_column("03")
+    assert other == plate
+
+
+def test_well_grid_outside_plate() -> None:
+    plate = Plate(
+        columns=[Column(name="01")],
+        rows=[Row(name="A")],
+        version="0.4",
+        wells=[WellInPlate(path="A/01", rowIndex=1, columnIndex=0)],
+    )
+    with pytest.raises(ValueError, match=r"position \(1, 0\), which is outside"):
+        plate.well_grid  # noqa: B018
@@ -1,10 +1,34 @@
+import json
+import re
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from pathlib import Path
+from typing import Any, TypeVar
+
+import numpy as np
 import pytest
+import zarr
+from pydantic_zarr.v3 import ArraySpec
 from zarr.abc.store import Store
+from zarr.errors import ContainsGroupError
+from zarr.storage import LocalStore, MemoryStore
 
+from ome_zarr_models.common.hcs import WellValidationResult
+from ome_zarr_models.common.well import WellGroupNotFoundError
+from ome_zarr_models.v05.axes import Axis
 from ome_zarr_models.v05.hcs import HCS, HCSAttrs
+from ome_zarr_models.v05.image import Image
 from ome_zarr_models.v05.plate import Acquisition, Column, Plate, Row, WellInPlate
+from ome_zarr_models.v05.well_types import WellImage
 from tests.conftest import UnlistableStore
-from tests.v05.conftest import json_to_zarr_group
+from tests.v05.conftest import json_to_dict, json_to_zarr_group
+
+T = TypeVar("T")
 
 
 def test_hcs(store: Store) -> None:
@@ -50,3 +74,299 @@ def test_hcs(store: Store) -> None:
     )
     well_groups = list(ome_group.well_groups)
     assert len(well_groups) == 0
+
+
+def test_hcs_lazy(store: Store) -> None:
+    if isinstance(store, UnlistableStore):
+        pytest.xfail("Well does not work on unlistable stores")
+    zarr_group = json_to_zarr_group(json_fname="hcs_example.json", store=store)
+    zarr_group.create_group("A").create_group(
+        "1", attributes=json_to_dict(json_fname="well_example.json")
+    )
+
+    hcs = HCS.from_zarr(zarr_group, lazy=True, well_cache_size=1)
+    assert hcs.members == {}
+    well_groups = list(hcs.well_groups)
+    assert len(well_groups) == 1
+    assert well_groups[0].ome_attributes.well.images[0].acquisition == 1
+
+    well_group = hcs.get_well_group(0)
+    assert hcs.get_well_group(0) is well_group
+
+    with pytest.raises(WellGroupNotFoundError, match="No Zarr group found"):
+        hcs.get_well_group(1)
+
+
+def test_hcs_lazy_invalid_acquisition(store: Store) -> None:
+    if isinstance(store, UnlistableStore):
+        pytest.xfail("Well does not work on unlistable stores")
+    zarr_group = json_to_zarr_group(json_fname="hcs_example.json", store=store)
+    well_attrs = json_to_dict(json_fname="well_example.json")
+    well_attrs["ome"]["well"]["images"][0]["acquisition"] = 3
+    zarr_group.create_group("A").create_group("1", attributes=well_attrs)
+
+    # Wells are not validated until they are accessed
+    hcs = HCS.from_zarr(zarr_group, lazy=True)
+    with pytest.raises(ValueError, match="Acquisition ID '3"):
+        hcs.get_well_group(0)
+
+
+def test_hcs_lazy_trusted(store: Store) -> None:
+    if isinstance(store, UnlistableStore):
+        pytest.xfail("Well does not work on unlistable stores")
+    zarr_group = json_to_zarr_group(json_fname="hcs_example.json", store=store)
+    well_attrs = json_to_dict(json_fname="well_example.json")
+    well_attrs["ome"]["well"]["images"][0]["acquisition"] = 3
+    zarr_group.create_group("A").create_group("1", attributes=well_attrs)
+
+    # Trusted wells are not validated when they are accessed
+    hcs = HCS.from_zarr(zarr_group, lazy=True, trusted=True)
+    well_group = hcs.get_well_group(0)
+    assert well_group.ome_attributes.well.images[0].acquisition == 3
+
+
+def test_hcs_lazy_round_trip(store: Store) -> None:
+    if isinstance(store, UnlistableStore):
+        pytest.xfail("Well does not work on unlistable stores")
+    zarr_group = json_to_zarr_group(json_fname="hcs_example.json", store=store)
+    zarr_group.create_group("A").create_group(
+        "1", attributes=json_to_dict(json_fname="well_example.json")
+    )
+
+    hcs = HCS.from_zarr(zarr_group, lazy=True)
+    eager_hcs = HCS.from_zarr(zarr_group)
+    # The lazy model reads all of its members when it is dumped or compared
+    assert hcs.members == {}
+    assert hcs.model_dump() == eager_hcs.model_dump()
+    assert hcs == eager_hcs
+
+    new_store = MemoryStore()
+    hcs.to_zarr(new_store, "plate")
+    new_hcs = HCS.from_zarr(zarr.open_group(new_store, path="plate", mode="r"))
+    assert len(list(new_hcs.well_groups)) == 1
+    assert new_hcs == eager_hcs
+
+
+def test_hcs_get_well(store: Store) -> None:
+    if isinstance(store, UnlistableStore):
+        pytest.xfail("Well does not work on unlistable stores")
+    zarr_group = json_to_zarr_group(json_fname="hcs_example.json", store=store)
+    zarr_group.create_group("A").create_group(
+        "2", attributes=json_to_dict(json_fname="well_example.json")
+    )
+
+    hcs = HCS.from_zarr(zarr_group, lazy=True)
+    well_group = hcs.get_well("A", "2")
+    assert well_group is hcs.get_well_group(1)
+    # Only well groups that exist are returned
+    assert hcs.wells_in_row("A") == [well_group]
+    assert hcs.wells_in_row("B") == []
+    assert hcs.wells_in_column("2") == [well_group]
+
+    with pytest.raises(WellGroupNotFoundError, match="No Zarr group found"):
+        hcs.get_well("A", "1")
+    with pytest.raises(ValueError, match="No well found at row 'C' and column '1'"):
+        hcs.get_well("C", "1")
+
+
+def _plate_to_validate(store: Store) -> zarr.Group:
+    """
+    Create a plate with a well that has an invalid image, and an invalid well.
+    """
+    zarr_group = json_to_zarr_group(json_fname="hcs_example.json", store=store)
+    row_group = zarr_group.create_group("A")
+
+    # Valid well, with an image that is missing an array
+    well_group = row_group.create_group(
+        "1", attributes=json_to_dict(json_fname="well_example.json")
+    )
+    for image_path in ["0", "1", "2", "3"]:
+        image_group = well_group.create_group(
+            image_path, attributes=json_to_dict(json_fname="image_example.json")
+        )
+        for array_path in ["0", "1", "2"]:
+            if image_path == "2" and array_path == "1":
+                continue
+            image_group.create_array(
+                array_path,
+                shape=(1, 1, 1, 1, 1),
+                dtype="uint8",
+                dimension_names=["t", "c", "z", "y", "x"],
+            )
+
+    # Well with an invalid acquisition ID
+    well_attrs = json_to_dict(json_fname="well_example.json")
+    well_attrs["ome"]["well"]["images"] = [{"acquisition": 3, "path": "0"}]
+    row_group.create_group("2", attributes=well_attrs)
+    return zarr_group
+
+
+def test_hcs_validate_all(store: Store) -> None:
+    if isinstance(store, UnlistableStore):
+        pytest.xfail("Well does not work on unlistable stores")
+    hcs = HCS.from_zarr(_plate_to_validate(store), lazy=True)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        report = hcs.validate_all(executor=executor)
+
+    assert list(report) == ["A/1", "A/2", "A/3", "B/1", "B/2", "B/3"]
+    assert list(report["A/1"].image_errors) == ["2"]
+    assert "does not exist in this group: 1" in report["A/1"].image_errors["2"]
+    assert report["A/2"].error is not None
+    assert "Acquisition ID '3" in report["A/2"].error
+    assert not report["A/3"].found
+    assert report["A/3"].is_valid
+    assert [r.is_valid for r in report.values()] == [
+        False,
+        False,
+        True,
+        True,
+        True,
+        True,
+    ]
+    # Check serial validation gives the same result
+    assert hcs.validate_all() == report
+
+
+def test_hcs_validate_all_trusted(store: Store) -> None:
+    if isinstance(store, UnlistableStore):
+        pytest.xfail("Well does not work on unlistable stores")
+    zarr_group = _plate_to_validate(store)
+    hcs = HCS.from_zarr(zarr_group, lazy=True, trusted=True)
+    # Wells are validated, even though the plate was loaded without validation
+    report = hcs.validate_all()
+
+    assert report["A/2"].error is not None
+    assert "Acquisition ID '3" in report["A/2"].error
+    assert report == HCS.from_zarr(zarr_group, lazy=True).validate_all()
+
+
+def test_hcs_validate_all_process_pool(tmp_path: Path) -> None:
+    hcs = HCS.from_zarr(_plate_to_validate(LocalStore(tmp_path)), lazy=True)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        report = hcs.validate_all(executor=executor)
+
+    assert report == hcs.validate_all()
+    assert [r.is_valid for r in report.values()] == [
+        False,
+        False,
+        True,
+        True,
+        True,
+        True,
+    ]
+
+
+def test_hcs_new_validate_all_process_pool() -> None:
+    hcs = HCS.new(rows=["A"], columns=["1", "2"], images={"A/1": [_new_image()]})
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        report = hcs.validate_all(executor=executor)
+
+    assert report == {
+        "A/1": WellValidationResult(index=0, path="A/1"),
+    }
+
+
+class _BrokenExecutor(Executor):
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        future: Future[T] = Future()
+        future.set_exception(RuntimeError("Executor is broken"))
+        return future
+
+
+def test_hcs_validate_all_executor_error(store: Store) -> None:
+    if isinstance(store, UnlistableStore):
+        pytest.xfail("Well does not work on unlistable stores")
+    hcs = HCS.from_zarr(_plate_to_validate(store), lazy=True)
+    # Errors from the executor are raised, instead of being reported as
+    # validation errors
+    with pytest.raises(RuntimeError, match="Executor is broken"):
+        hcs.validate_all(executor=_BrokenExecutor())
+
+
+def _new_image() -> Image:
+    return Image.new(
+        array_specs=[
+            ArraySpec.from_array(
+                np.zeros((5, 5), dtype=np.uint8), dimension_names=["y", "x"]
+            )
+        ],
+        paths=["0"],
+        axes=[Axis(name="y", type="space"), Axis(name="x", type="space")],
+        scales=[(1, 1)],
+        translations=[None],
+    )
+
+
+def test_hcs_new() -> None:
+    image = _new_image()
+    hcs = HCS.new(
+        rows=["A", "B"],
+        columns=["1", "2"],
+        images={"B/1": [image, image], "A/2": [image]},
+        acquisitions=[Acquisition(id=0)],
+        image_acquisitions={"B/1": [0, 0]},
+        name="test",
+    )
+    plate = hcs.ome_attributes.plate
+    assert plate.wells == [
+        WellInPlate(path="A/2", rowIndex=0, columnIndex=1),
+        WellInPlate(path="B/1", rowIndex=1, columnIndex=0),
+    ]
+    assert plate.field_count == 2
+    assert plate.name == "test"
+    well = hcs.get_well("B", "1")
+    assert well.ome_attributes.well.images == [
+        WellImage(path="0", acquisition=0),
+        WellImage(path="1", acquisition=0),
+    ]
+    assert well.get_image(1) == image
+    assert hcs.get_well("A", "2").ome_attributes.well.images[0].acquisition is None
+
+
+def test_hcs_new_invalid() -> None:
+    image = _new_image()
+    with pytest.raises(ValueError, match="Well path 'C/1' must be of the form"):
+        HCS.new(rows=["A"], columns=["1"], images={"C/1": [image]})
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Number of acquisition IDs for well 'A/1' (2) does not match number of "
+            "images (1)."
+        ),
+    ):
+        HCS.new(
+            rows=["A"],
+            columns=["1"],
+            images={"A/1": [image]},
+            image_acquisitions={"A/1": [0, 1]},
+        )
+
+
+@pytest.mark.filterwarnings("ignore:Consolidated metadata is currently not part")
+@pytest.mark.parametrize("consolidate", [True, False])
+def test_hcs_to_zarr_concurrent(consolidate: bool) -> None:
+    image = _new_image()
+    hcs = HCS.new(
+        rows=["A", "B"],
+        columns=["1", "2"],
+        images={"A/1": [image, image], "B/2": [image]},
+    )
+    sequential_store = MemoryStore()
+    hcs.to_zarr(sequential_store, "plate", consolidate=consolidate)
+    store = MemoryStore()
+    group = hcs.to_zarr(store, "plate", concurrent=True, consolidate=consolidate)
+
+    # The same metadata documents are written
+    assert store._store_dict.keys() == sequential_store._store_dict.keys()
+    for key, value in store._store_dict.items():
+        assert json.loads(value.to_bytes()) == json.loads(
+            sequential_store._store_dict[key].to_bytes()
+        )
+    assert (group.metadata.consolidated_metadata is not None) == consolidate
+    assert HCS.from_zarr(group) == HCS.from_zarr(
+        zarr.open_group(sequential_store, path="plate")
+    )
+
+    with pytest.raises(ContainsGroupError):
+        hcs.to_zarr(store, "plate", concurrent=True)
+    hcs.to_zarr(store, "plate", concurrent=True, overwrite=True)
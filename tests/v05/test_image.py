@@ -1,12 +1,22 @@
+import asyncio
 import re
+import threading
+from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pytest
+import zarr
 from pydantic import ValidationError
 from zarr.abc.store import Store
+from zarr.storage import LocalStore, MemoryStore
 
+from ome_zarr_models.common.coordinate_transformations import VectorTranslation
+from ome_zarr_models.common.pyramid import downsample_block
 from ome_zarr_models.v05.axes import Axis
 from ome_zarr_models.v05.coordinate_transformations import VectorScale
 from ome_zarr_models.v05.image import Image, ImageAttrs
+from ome_zarr_models.v05.image_label import ImageLabel
 from ome_zarr_models.v05.labels import LabelsAttrs
 from ome_zarr_models.v05.multiscales import Dataset, Multiscale
 from tests.v05.conftest import json_to_dict, json_to_zarr_group
@@ -197,6 +207,23 @@ def test_image_with_labels(store: Store) -> None:
     assert image.labels.attributes.ome == LabelsAttrs(
         version="0.5", labels=["cell_space_segmentation"]
     )
+    # The models validated when loading are kept, instead of being validated again
+    assert image.members is not None
+    assert image.labels is image.members["labels"]
+    assert image.labels.members is not None
+    image_label = image.labels.members["cell_space_segmentation"]
+    assert isinstance(image_label, ImageLabel)
+    assert image.labels.get_image_labels_group("cell_space_segmentation") is image_label
+    assert Image.model_validate(image.model_dump()) == image
+    # Validated images have the same types of members
+    validated = Image.model_validate(image.model_dump())
+    assert validated.labels is not None
+    assert isinstance(
+        validated.labels.get_image_labels_group("cell_space_segmentation"),
+        ImageLabel,
+    )
+    assert validated.labels.members is not None
+    assert isinstance(validated.labels.members["cell_space_segmentation"], ImageLabel)
 
 
 def test_image_with_labels_mismatch_multiscales(store: Store) -> None:
@@ -243,3 +270,283 @@ def test_image_with_labels_mismatch_multiscales(store: Store) -> None:
         ),
     ):
         Image.from_zarr(zarr_group)
+
+
+def test_image_from_zarr_async(store: Store) -> None:
+    zarr_group = json_to_zarr_group(json_fname="image_example.json", store=store)
+    for path in ["0", "1", "2"]:
+        zarr_group.create_array(
+            path,
+            shape=(1, 1, 1, 1, 1),
+            dtype="uint8",
+            dimension_names=["t", "c", "z", "y", "x"],
+        )
+    labels_group = zarr_group.create_group(
+        "labels",
+        attributes=json_to_dict(json_fname="labels_example.json"),
+    )
+    image_label_group = labels_group.create_group(
+        "cell_space_segmentation",
+        attributes=json_to_dict(json_fname="image_label_example.json"),
+    )
+    for path in ["0", "1", "2"]:
+        image_label_group.create_array(
+            path,
+            shape=(1, 1, 1, 1, 1),
+            dtype="uint8",
+            dimension_names=["t", "c", "z", "y", "x"],
+        )
+
+    image = asyncio.run(Image.from_zarr_async(zarr_group))
+    assert image == Image.from_zarr(zarr_group)
+    assert image.labels is not None
+
+
+def _image_with_labels_group(store: Store) -> zarr.Group:
+    """
+    Create an image group with a single image label.
+    """
+    zarr_group = json_to_zarr_group(json_fname="image_example.json", store=store)
+    labels_group = zarr_group.create_group(
+        "labels",
+        attributes=json_to_dict(json_fname="labels_example.json"),
+    )
+    image_label_group = labels_group.create_group(
+        "cell_space_segmentation",
+        attributes=json_to_dict(json_fname="image_label_example.json"),
+    )
+    for group in [zarr_group, image_label_group]:
+        for path in ["0", "1", "2"]:
+            group.create_array(
+                path,
+                shape=(1, 1, 1, 1, 1),
+                dtype="uint8",
+                dimension_names=["t", "c", "z", "y", "x"],
+            )
+    return zarr_group
+
+
+def test_image_from_zarr_threads(tmp_path: Path) -> None:
+    # Loading labels used to wait on the zarr event loop from a thread in
+    # the loop's own executor, which deadlocked when many images were loaded
+    # from different threads at the same time
+    _image_with_labels_group(LocalStore(tmp_path))
+    images: list[Image] = []
+
+    def load_image() -> None:
+        images.append(Image.from_zarr(zarr.open_group(tmp_path, mode="r")))
+
+    # Daemon threads, so a deadlock fails the test instead of hanging
+    threads = [threading.Thread(target=load_image, daemon=True) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+    assert len(images) == 16
+    assert all(image.labels is not None for image in images)
+
+
+def test_image_with_labels_equal_from_different_stores(tmp_path: Path) -> None:
+    images = [
+        Image.from_zarr(_image_with_labels_group(store))
+        for store in [MemoryStore(), LocalStore(tmp_path)]
+    ]
+    assert images[0] == images[1]
+
+
+def test_image_from_zarr_async_missing_array(store: Store) -> None:
+    zarr_group = json_to_zarr_group(json_fname="image_example.json", store=store)
+    for path in ["0", "2"]:
+        zarr_group.create_array(
+            path,
+            shape=(1, 1, 1, 1, 1),
+            dtype="uint8",
+            dimension_names=["t", "c", "z", "y", "x"],
+        )
+    with pytest.raises(ValueError, match="Expected to find an array at /1"):
+        asyncio.run(Image.from_zarr_async(zarr_group))
+
+
+@pytest.mark.filterwarnings("ignore:Consolidated metadata is currently not part")
+def test_image_consolidated_metadata() -> None:
+    store = MemoryStore()
+    zarr_group = json_to_zarr_group(json_fname="image_example.json", store=store)
+    for path in ["0", "1", "2"]:
+        zarr_group.create_array(
+            path,
+            shape=(1, 1, 1, 1, 1),
+            dtype="uint8",
+            dimension_names=["t", "c", "z", "y", "x"],
+        )
+    unconsolidated_image = Image.from_zarr(zarr_group)
+
+    zarr.consolidate_metadata(store)
+    group = zarr.open_group(store, mode="r")
+    assert group.metadata.consolidated_metadata is not None
+    # Remove the array metadata from the store, to check that all the metadata
+    # is read from the consolidated metadata
+    for path in ["0", "1", "2"]:
+        del store._store_dict[f"{path}/zarr.json"]
+
+    assert Image.from_zarr(group) == unconsolidated_image
+
+
+@pytest.mark.filterwarnings("ignore:Consolidated metadata is currently not part")
+def test_image_consolidated_metadata_members() -> None:
+    store = MemoryStore()
+    zarr_group = _image_with_labels_group(store)
+    # Nodes that are not part of the image are not included in the model
+    zarr_group.create_array("extra", shape=(1,), dtype="uint8")
+    zarr_group.require_group("labels/cell_space_segmentation").create_group("extra")
+    unconsolidated_image = Image.from_zarr(zarr_group)
+
+    zarr.consolidate_metadata(store)
+    group = zarr.open_group(store, mode="r")
+    assert group.metadata.consolidated_metadata is not None
+    image = Image.from_zarr(group)
+
+    assert image == unconsolidated_image
+    assert image.members is not None
+    assert sorted(image.members) == ["0", "1", "2", "labels"]
+
+
+@pytest.mark.filterwarnings("ignore:Consolidated metadata is currently not part")
+def test_image_consolidated_metadata_label_index() -> None:
+    store = MemoryStore()
+    zarr_group = _image_with_labels_group(store)
+    ImageLabel.from_zarr(
+        zarr_group.require_group("labels/cell_space_segmentation")
+    ).write_label_index()
+
+    zarr.consolidate_metadata(store)
+    group = zarr.open_group(store, mode="r")
+    assert group.metadata.consolidated_metadata is not None
+    labels = Image.from_zarr(group).labels
+    assert labels is not None
+    label_index = labels.get_image_labels_group("cell_space_segmentation").label_index
+    assert label_index is not None
+    np.testing.assert_array_equal(label_index.label_values, [0])
+
+
+def test_image_trusted(store: Store) -> None:
+    zarr_group = json_to_zarr_group(json_fname="image_example.json", store=store)
+    for path in ["0", "1", "2"]:
+        zarr_group.create_array(
+            path,
+            shape=(1, 1, 1, 1, 1),
+            dtype="uint8",
+            dimension_names=["t", "c", "z", "y", "x"],
+        )
+    labels_group = zarr_group.create_group(
+        "labels",
+        attributes=json_to_dict(json_fname="labels_example.json"),
+    )
+    image_label_group = labels_group.create_group(
+        "cell_space_segmentation",
+        attributes=json_to_dict(json_fname="image_label_example.json"),
+    )
+    for path in ["0", "1", "2"]:
+        image_label_group.create_array(
+            path,
+            shape=(1, 1, 1, 1, 1),
+            dtype="uint8",
+            dimension_names=["t", "c", "z", "y", "x"],
+        )
+
+    image = Image.from_zarr(zarr_group, trusted=True)
+    assert image == Image.from_zarr(zarr_group)
+    assert image.model_dump_json() == Image.from_zarr(zarr_group).model_dump_json()
+    # Nested metadata is still typed
+    assert isinstance(image.attributes.ome, ImageAttrs)
+    assert isinstance(image.datasets[0][0].coordinateTransformations[0], VectorScale)
+    assert image.labels is not None
+
+
+def test_image_trusted_skips_validation(store: Store) -> None:
+    zarr_group = json_to_zarr_group(json_fname="image_example.json", store=store)
+    # Arrays have the wrong dimensionality, which is not checked
+    for path in ["0", "1", "2"]:
+        zarr_group.create_array(
+            path, shape=(1, 1), dtype="uint8", dimension_names=["y", "x"]
+        )
+    with pytest.raises(ValidationError):
+        Image.from_zarr(zarr_group)
+
+    image = Image.from_zarr(zarr_group, trusted=True)
+    assert len(image.datasets[0]) == 3
+
+
+@pytest.mark.parametrize("source_type", ["numpy", "zarr"])
+def test_image_from_array(source_type: str) -> None:
+    data = np.random.default_rng(0).integers(0, 255, size=(2, 37, 50), dtype=np.uint16)
+    source: np.ndarray[Any, Any] | zarr.Array[Any] = data
+    if source_type == "zarr":
+        source = zarr.create_array(MemoryStore(), shape=data.shape, dtype=data.dtype)
+        source[:] = data
+    axes = [
+        Axis(name="c", type="channel"),
+        Axis(name="y", type="space", unit="micrometer"),
+        Axis(name="x", type="space", unit="micrometer"),
+    ]
+    store = MemoryStore()
+    image = Image.from_array(
+        source,
+        store=store,
+        path="image",
+        axes=axes,
+        chunks=(1, 8, 8),
+        scale=[1, 0.5, 0.5],
+    )
+
+    group = zarr.open_group(store, path="image", mode="r")
+    arrays = dict(group.arrays())
+    assert Image.from_zarr(group).attributes.model_dump(
+        mode="json"
+    ) == image.attributes.model_dump(mode="json")
+    # Levels are added until the lowest resolution level fits in a single chunk
+    assert [arrays[str(i)].shape for i in range(4)] == [
+        (2, 37, 50),
+        (2, 19, 25),
+        (2, 10, 13),
+        (2, 5, 7),
+    ]
+    assert arrays["3"].chunks == (1, 5, 7)
+    np.testing.assert_array_equal(arrays["0"][:], data)
+    np.testing.assert_array_equal(
+        arrays["1"][:], downsample_block(data, (1, 2, 2), "mean")
+    )
+    np.testing.assert_array_equal(
+        arrays["2"][:],
+        downsample_block(downsample_block(data, (1, 2, 2), "mean"), (1, 2, 2), "mean"),
+    )
+
+    multiscale = image.attributes.ome.multiscales[0]
+    assert multiscale.type == "mean"
+    assert multiscale.datasets[2].coordinateTransformations == (
+        VectorScale(type="scale", scale=[1, 2, 2]),
+        VectorTranslation(type="translation", translation=[0, 0.75, 0.75]),
+    )
+
+
+def test_image_from_array_nearest() -> None:
+    data = np.arange(64, dtype=np.uint8).reshape(8, 8)
+    axes = [Axis(name="y", type="space"), Axis(name="x", type="space")]
+    store = MemoryStore()
+    image = Image.from_array(
+        data,
+        store=store,
+        path="",
+        axes=axes,
+        chunks=(4, 4),
+        downsample=(1, 2),
+        levels=2,
+        method="nearest",
+    )
+    arrays = dict(zarr.open_group(store, mode="r").arrays())
+    np.testing.assert_array_equal(arrays["1"][:], data[:, ::2])
+    multiscale = image.attributes.ome.multiscales[0]
+    assert multiscale.type == "nearest"
+    assert multiscale.datasets[1].coordinateTransformations == (
+        VectorScale(type="scale", scale=[1, 2]),
+        VectorTranslation(type="translation", translation=[0, 0]),
+    )